@@ -1,7 +1,12 @@
 from http.server import BaseHTTPRequestHandler
+import functools
 import json
-import re
+import os
 import sys
+from urllib.parse import parse_qs, urlsplit
+
+# 프로젝트 루트의 공용 모듈(youtube_core) 사용
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 인코딩 설정
 if hasattr(sys.stdout, 'reconfigure'):
@@ -9,95 +14,125 @@ if hasattr(sys.stdout, 'reconfigure'):
 if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 
-# YouTube Transcript API import
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-except ImportError:
-    # 백업 응답
-    class YouTubeTranscriptApi:
-        @staticmethod
-        def get_transcript(*args, **kwargs):
-            raise Exception("youtube-transcript-api 패키지가 설치되지 않았습니다")
+from youtube_core import metrics
+from youtube_core.archive import DEFAULT_SEARCH_LIMIT
+from youtube_core.batch import DEFAULT_CONCURRENCY, extract_many, parse_batch
+from youtube_core.cache import get_default_cache
+from youtube_core.extractor import YouTubeTextExtractor
+from youtube_core.formats import DEFAULT_FORMAT, get_format
+from youtube_core.http_cache import (
+    cache_control, compress, etag_matches, make_etag, matching_tag, representation_etag, select_encoding,
+    transcript_etag
+)
+from youtube_core.ranges import RANGE_FIELDS, parse_range
+from youtube_core.response import extractor_response, search_response, stable_response
+from youtube_core.scheduler import get_default_scheduler
+from youtube_core.singleflight import get_default_singleflight
+from youtube_core.streaming import (
+    NDJSON_CONTENT_TYPE, SSE_CONTENT_TYPE, encode_ndjson, encode_sse, iter_chunks, iter_extraction_events
+)
+from youtube_core.urls import VIDEO_ID_PATTERN
 
 
-class YouTubeTextExtractor:
-    def __init__(self):
-        self.video_info = {}
-        self.transcript_data = []
-        self.formatted_text = ""
-        self.error_details = ""
-        
-    def extract_video_id(self, url):
-        """유튜브 URL에서 비디오 ID 추출"""
-        match = re.search(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)', url)
-        return match.group(1) if match else None
+class handler(BaseHTTPRequestHandler):
+    def _send_json(self, status, response, cacheable=False, etag=None):
+        body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        self._send_body(status, body, 'application/json', cacheable, etag=etag)
     
-    def get_video_info(self, video_id):
-        """기본 비디오 정보 설정"""
-        self.video_info = {
-            'title': f'YouTube Video {video_id}',
-            'channel': 'Unknown',
-            'duration': 0,
-            'video_id': video_id
-        }
+    def _send_body(self, status, body, content_type, cacheable=False, extra_headers=(), etag=None):
+        """본문 전송 - Accept-Encoding 에 맞춰 압축, cacheable 이면 ETag/Cache-Control 과 304 처리
+
+        etag 를 주지 않으면 본문으로 만든다.
+        """
+        headers = [('Vary', 'Accept-Encoding')]
+        encoding = select_encoding(body, self.headers.get('Accept-Encoding'))
+        if cacheable:
+            headers.append(('Cache-Control', cache_control(status == 200)))
+            if status == 200:
+                etag = etag or make_etag(body)
+                headers.append(('ETag', representation_etag(etag, encoding)))
+                if etag_matches(self.headers.get('If-None-Match'), etag):
+                    self._send_not_modified(headers)
+                    return
+        
+        if encoding:
+            body = compress(body, encoding)
+            headers.append(('Content-Encoding', encoding))
+        
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in list(headers) + list(extra_headers):
+            self.send_header(name, value)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
+        self.end_headers()
+        self.wfile.write(body)
     
-    def extract_transcript(self, video_id):
-        """자막 추출"""
-        try:
-            # 한국어 자막 시도
-            try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko'])
-            except:
-                # 영어 자막 시도
-                try:
-                    transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en'])
-                except:
-                    # 사용 가능한 모든 자막 시도
-                    transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            
-            self.transcript_data = transcript
-            return True if transcript else False
-            
-        except Exception as e:
-            self.error_details = str(e)
-            return False
+    def _send_not_modified(self, headers):
+        self.send_response(304)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Expose-Headers', 'ETag')
+        self.end_headers()
     
-    def format_transcript(self):
-        """자막 포맷팅"""
-        if not self.transcript_data:
-            return ""
-        
-        texts = []
-        for entry in self.transcript_data:
-            text = entry.get('text', '').strip()
-            if text:
-                texts.append(text)
-        
-        self.formatted_text = ' '.join(texts)
-        return self.formatted_text
+    def _start_streaming(self, content_type, extra_headers=()):
+        """길이를 미리 모르는 응답 시작 - keep-alive 연결이면 응답 뒤에 닫는다"""
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        for name, value in extra_headers:
+            self.send_header(name, value)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if self.protocol_version == 'HTTP/1.1':
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
     
-    def process_youtube_url(self, url):
-        """메인 처리 함수"""
+    def _send_batch(self, urls, concurrency, languages=None, output_format=DEFAULT_FORMAT):
+        """배치 요청: 끝나는 순서대로 결과를 한 줄씩(NDJSON) 전송"""
+        # 헤더를 보낸 뒤에는 400 으로 바꿀 수 없으므로 입력을 먼저 검증
         try:
-            video_id = self.extract_video_id(url)
-            if not video_id:
-                self.error_details = "올바른 유튜브 URL이 아닙니다"
-                return False
-            
-            self.get_video_info(video_id)
-            
-            if self.extract_transcript(video_id):
-                self.format_transcript()
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            self.error_details = str(e)
-            return False
-
-
-class handler(BaseHTTPRequestHandler):
+            urls, concurrency = parse_batch(urls, concurrency)
+        except ValueError as e:
+            self._send_json(400, {"success": False, "error": str(e)})
+            return
+        self._start_streaming(NDJSON_CONTENT_TYPE)
+        
+        total = succeeded = 0
+        factory = functools.partial(YouTubeTextExtractor, languages=languages, output_format=output_format)
+        for result in extract_many(urls, factory, concurrency=concurrency):
+            total += 1
+            succeeded += 1 if result["success"] else 0
+            self.wfile.write(json.dumps(result, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+        
+        summary = {"done": True, "total": total, "succeeded": succeeded}
+        self.wfile.write(json.dumps(summary).encode('utf-8') + b'\n')
+    
+    def _send_stream(self, extractor, url, sse=False, selection=None, timings=False):
+        """스트리밍 요청: 비디오 정보 → 자막 조각 → 완료 이벤트를 차례로 전송"""
+        self._start_streaming(SSE_CONTENT_TYPE if sse else NDJSON_CONTENT_TYPE, [('Cache-Control', 'no-cache')])
+        
+        encode = encode_sse if sse else encode_ndjson
+        for event in iter_extraction_events(extractor, url, timings=timings, **(selection or {})):
+            self.wfile.write(encode(event))
+            self.wfile.flush()
+    
+    def _send_raw(self, extractor, url, selection=None):
+        """raw 요청: 선택한 형식의 자막 파일을 JSON으로 감싸지 않고 그대로 전송"""
+        if not extractor.process_youtube_url(url, **(selection or {})):
+            self._send_json(400, extractor_response(extractor, False))
+            return
+        
+        output_format = get_format(extractor.output_format)
+        filename = f"{extractor.video_info.get('video_id', 'transcript')}.{output_format.extension}"
+        self._start_streaming(output_format.content_type,
+                              [('Content-Disposition', f'attachment; filename="{filename}"')])
+        
+        for chunk in iter_chunks(extractor.iter_render()):
+            self.wfile.write(chunk.encode('utf-8'))
+    
     def do_POST(self):
         try:
             # POST 데이터 읽기
@@ -105,72 +140,185 @@ class handler(BaseHTTPRequestHandler):
             post_data = self.rfile.read(content_length)
             data = json.loads(post_data.decode('utf-8'))
             
+            # 출력 형식 확인 (text, srt, vtt, json, markdown)과 구간 선택 (start, end, max_chars)
+            try:
+                output_format = get_format(data.get('format')).name
+                selection = parse_range(data)
+            except ValueError as e:
+                self._send_json(400, {"success": False, "error": str(e)})
+                return
+            
+            urls = data.get('urls')
+            if isinstance(urls, list) and urls:
+                self._send_batch(urls, data.get('concurrency', DEFAULT_CONCURRENCY), data.get('languages'),
+                                 output_format)
+                return
+            
             url = data.get('url')
             
             if not url:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                response = {"success": False, "error": "URL이 필요합니다"}
-                self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+                self._send_json(400, {"success": False, "error": "URL이 필요합니다"})
                 return
             
             # YouTube 텍스트 추출
-            extractor = YouTubeTextExtractor()
+            extractor = YouTubeTextExtractor(languages=data.get('languages'), output_format=output_format)
             
-            if extractor.process_youtube_url(url) and extractor.formatted_text:
-                response = {
-                    "success": True,
-                    "text": extractor.formatted_text,
-                    "info": {
-                        "title": extractor.video_info.get('title', '제목 없음'),
-                        "channel": extractor.video_info.get('channel', '채널 없음'),
-                        "duration": extractor.video_info.get('duration', 0),
-                        "subtitle_count": len(extractor.transcript_data)
-                    }
-                }
-                self.send_response(200)
-            else:
-                error_msg = extractor.error_details if extractor.error_details else "자막을 추출할 수 없습니다"
-                
-                # 구체적인 에러 메시지 제공
-                if "Video unavailable" in error_msg:
-                    error_msg = "비디오를 사용할 수 없습니다. 삭제되었거나 비공개일 수 있습니다."
-                elif "Private video" in error_msg:
-                    error_msg = "비공개 비디오입니다."
-                elif "Could not retrieve a transcript" in error_msg:
-                    if "Subtitles are disabled" in error_msg:
-                        error_msg = "이 비디오는 자막이 비활성화되어 있습니다."
-                    elif "No transcripts found" in error_msg:
-                        error_msg = "이 비디오에는 자막이 없습니다."
-                    else:
-                        error_msg = "자막을 가져올 수 없습니다. 비디오가 제한되어 있을 수 있습니다."
-                elif "Connection" in error_msg or "Network" in error_msg:
-                    error_msg = "네트워크 연결 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
-                
-                response = {
-                    "success": False,
-                    "error": error_msg
-                }
-                self.send_response(400)
+            # "timings": true 면 info.timings 에 단계별 소요 시간(ms)
+            timings = bool(data.get('timings'))
             
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+            # 스트리밍 모드 (NDJSON 또는 Server-Sent Events)
+            sse = SSE_CONTENT_TYPE in (self.headers.get('Accept') or '')
+            if data.get('stream') or sse:
+                self._send_stream(extractor, url, sse=sse, selection=selection, timings=timings)
+                return
+            
+            # 형식 그대로 받기 (예: .srt 파일 다운로드)
+            if data.get('raw'):
+                self._send_raw(extractor, url, selection)
+                return
+            
+            success = extractor.process_youtube_url(url, **selection)
+            response = extractor_response(extractor, success, timings)
+            
+            self._send_json(200 if response["success"] else 400, response)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
+            self._send_json(500, {"success": False, "error": f"서버 오류: {str(e)}"})
+    
+    def do_GET(self):
+        # 상태 확인 (자체 서버 모드에서는 워커/대기열 상태 포함)
+        if self.path.split('?')[0].rstrip('/').endswith('/health'):
+            cache = get_default_cache()
+            flight = get_default_singleflight()
+            server_stats = getattr(self.server, 'stats', None)
+            self._send_json(200, {
+                "status": "draining" if getattr(self.server, 'draining', False) else "ok",
+                "server": server_stats() if server_stats else None,
+                "cache": cache.stats() if cache else None,
+                "singleflight": flight.stats() if flight else None,
+                "youtube": get_default_scheduler().stats()
+            })
+            return
+        
+        # 자막 보관소 전문 검색: GET /search?q=검색어&limit=20
+        if self.path.split('?')[0].rstrip('/').endswith('/search'):
+            params = parse_qs(urlsplit(self.path).query)
+            try:
+                limit = int(params.get('limit', [DEFAULT_SEARCH_LIMIT])[0])
+            except ValueError:
+                limit = DEFAULT_SEARCH_LIMIT
+            response = search_response(params.get('q', [''])[0], limit)
+            self._send_json(200 if response["success"] else 400, response)
+            return
+        
+        # Prometheus 지표
+        if self.path.split('?')[0].rstrip('/').endswith('/metrics'):
+            server_stats = getattr(self.server, 'stats', None)
+            body = metrics.render(server_stats() if server_stats else None).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', metrics.CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-            response = {"success": False, "error": f"서버 오류: {str(e)}"}
-            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+            self.wfile.write(body)
+            return
+        
+        # 캐시 가능한 추출: GET /api/extract?v=VIDEO_ID&format=srt&languages=ko,en&start=10:00&end=25:00
+        params = parse_qs(urlsplit(self.path).query)
+        if 'v' in params or 'url' in params:
+            try:
+                self._send_cacheable(params)
+            except Exception as e:
+                self._send_json(500, {"success": False, "error": f"서버 오류: {str(e)}"})
+            return
+        
+        self._send_json(405, {"success": False, "error": "POST 요청 또는 ?v=비디오ID 가 필요합니다"})
+    
+    def _send_cacheable(self, params):
+        """GET 추출: 같은 비디오/옵션이면 본문이 같으므로 ETag/304 와 CDN 캐시를 쓸 수 있다"""
+        def first(name):
+            return params.get(name, [None])[0]
+        
+        video_id = first('v')
+        if video_id is not None and not VIDEO_ID_PATTERN.match(video_id):
+            self._send_json(400, {"success": False, "error": "올바른 비디오 ID가 아닙니다"}, cacheable=True)
+            return
+        url = first('url') or f'https://www.youtube.com/watch?v={video_id}'
+        
+        try:
+            output_format = get_format(first('format')).name
+            selection = parse_range({name: first(name) for name in RANGE_FIELDS})
+        except ValueError as e:
+            self._send_json(400, {"success": False, "error": str(e)}, cacheable=True)
+            return
+        
+        extractor = YouTubeTextExtractor(languages=first('languages'), output_format=output_format)
+        raw = first('raw') not in (None, '', '0', 'false')
+        
+        # 캐시에 자막이 있으면 가져오거나 포맷하기 전에 ETag 를 계산해서 맞으면 바로 304
+        video_id = extractor.extract_video_id(url)
+        etag = transcript_etag(extractor, video_id, selection, raw)
+        tag = matching_tag(self.headers.get('If-None-Match'), etag)
+        if tag:
+            self._send_not_modified([('Vary', 'Accept-Encoding'), ('Cache-Control', cache_control(True)),
+                                     ('ETag', tag)])
+            return
+        
+        success = extractor.process_youtube_url(url, **selection)
+        if success and etag is None:
+            # 방금 캐시에 들어갔으므로 다음 요청이 추출 전에 계산할 값과 같다
+            etag = transcript_etag(extractor, video_id, selection, raw)
+        
+        # 형식 그대로 받기 (예: ?v=...&format=srt&raw=1)
+        if success and raw:
+            output_format = get_format(extractor.output_format)
+            filename = f"{extractor.video_info.get('video_id', 'transcript')}.{output_format.extension}"
+            self._send_body(200, extractor.render().encode('utf-8'), output_format.content_type, cacheable=True,
+                            extra_headers=[('Content-Disposition', f'attachment; filename="{filename}"')], etag=etag)
+            return
+        
+        response = extractor_response(extractor, success)
+        self._send_json(200 if response["success"] else 400, stable_response(response), cacheable=True, etag=etag)
     
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers() 
\ No newline at end of file
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+def main():
+    """자체 서버 모드 (Vercel 밖에서 같은 handler 실행)"""
+    import argparse
+    from youtube_core.prewarm import prewarm_enabled, start_prewarm
+    from youtube_core.server import (
+        DEFAULT_KEEPALIVE_TIMEOUT, DEFAULT_MAX_QUEUE, DEFAULT_SHUTDOWN_TIMEOUT, DEFAULT_WORKERS, run_server
+    )
+    
+    parser = argparse.ArgumentParser(description="YouTube 자막 추출 HTTP 서버")
+    parser.add_argument("--host", default=os.environ.get("EXTRACT_SERVER_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("EXTRACT_SERVER_PORT", "8000")))
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("EXTRACT_SERVER_WORKERS", DEFAULT_WORKERS)),
+                        help="동시에 처리하는 연결 수")
+    parser.add_argument("--max-queue", type=int,
+                        default=int(os.environ.get("EXTRACT_SERVER_MAX_QUEUE", DEFAULT_MAX_QUEUE)),
+                        help="워커를 기다릴 수 있는 연결 수 (넘으면 503)")
+    parser.add_argument("--keepalive-timeout", type=float, default=DEFAULT_KEEPALIVE_TIMEOUT,
+                        help="유휴 keep-alive 연결을 닫기까지의 시간(초)")
+    parser.add_argument("--shutdown-timeout", type=float, default=DEFAULT_SHUTDOWN_TIMEOUT,
+                        help="종료 시 진행 중인 요청을 기다리는 최대 시간(초)")
+    parser.add_argument("--prewarm", action="store_true", default=prewarm_enabled(),
+                        help="시작하면서 자막 API/캐시를 미리 불러와 첫 요청을 빠르게 (YT_PREWARM=1)")
+    args = parser.parse_args()
+    
+    if args.prewarm:
+        start_prewarm()
+    
+    run_server(handler, args.host, args.port, workers=max(1, args.workers), max_queue=max(0, args.max_queue),
+               keepalive_timeout=args.keepalive_timeout, shutdown_timeout=args.shutdown_timeout)
+
+
+if __name__ == "__main__":
+    main()
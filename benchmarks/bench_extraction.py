@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+추출 경로 부하 벤치마크
+
+로컬 가짜 자막 서버(youtube_core.fake_server)를 띄우고 세 가지 경로를 동시성별로 측정한다.
+    extractor  youtube_text_extractor.YouTubeTextExtractor.process_youtube_url 을 스레드 풀에서 직접 호출
+    handler    api/extract.py handler 를 자체 서버(ExtractHTTPServer)로 띄우고 keep-alive POST
+    cli        extract_api.py --serve 상주 프로세스에 stdin/stdout JSON 요청
+
+측정마다 별도 프로세스에서 실행해서 최대 RSS 가 섞이지 않게 한다. 추출기는
+YT_TRANSCRIPT_BACKEND_URL 로 가짜 서버를 보고, 캐시(YT_CACHE_DISABLE=1)와 요청 합치기는 끈다.
+처리량, p50/p95/p99 지연, 최대 RSS 를 출력하고 기준 JSON 으로 저장하거나 비교할 수 있다.
+
+사용법:
+    python benchmarks/bench_extraction.py [--targets extractor,handler,cli] [--concurrency 1,4,16]
+        [--requests 200] [--entries 200] [--latency 0.02] [--jitter 0.01] [--error-rate 0.0]
+        [--save benchmarks/baselines/local.json] [--compare benchmarks/baselines/local.json --tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from youtube_core.fake_server import FakeTranscriptServer, make_corpus
+
+
+TARGETS = ('extractor', 'handler', 'cli')
+
+
+def percentile(samples, q):
+    """정렬된 samples 의 q 백분위 (nearest-rank)"""
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, int(round(q / 100 * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+
+def summarize(target, concurrency, latencies, errors, wall, rss_kb):
+    """측정 결과 dict (지연은 ms)"""
+    latencies = sorted(latencies)
+    return {
+        'target': target,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'wall': round(wall, 3),
+        'throughput': round(len(latencies) / wall, 2) if wall else 0.0,
+        'p50': round(percentile(latencies, 50) * 1000, 2),
+        'p95': round(percentile(latencies, 95) * 1000, 2),
+        'p99': round(percentile(latencies, 99) * 1000, 2),
+        'rss_mb': round(rss_kb / 1024, 1),
+    }
+
+
+def video_urls(video_ids, requests):
+    return [f'https://www.youtube.com/watch?v={video_ids[i % len(video_ids)]}' for i in range(requests)]
+
+
+def run_threaded(urls, concurrency, request_once):
+    """request_once(url) -> 성공 여부 를 동시에 실행, (지연 목록, 오류 수, 전체 시간) 반환"""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def timed(url):
+        t0 = time.perf_counter()
+        ok = request_once(url)
+        elapsed = time.perf_counter() - t0
+        with lock:
+            latencies.append(elapsed)
+            if not ok:
+                errors[0] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, urls))
+    return latencies, errors[0], time.perf_counter() - started
+
+
+def bench_extractor(urls, concurrency):
+    from youtube_text_extractor import YouTubeTextExtractor
+
+    return run_threaded(urls, concurrency, lambda url: YouTubeTextExtractor().process_youtube_url(url))
+
+
+def bench_handler(urls, concurrency):
+    import http.client
+    import importlib.util
+
+    from youtube_core.server import ExtractHTTPServer, make_keepalive_handler
+
+    spec = importlib.util.spec_from_file_location('api_extract', os.path.join(ROOT, 'api', 'extract.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    server = ExtractHTTPServer(('127.0.0.1', 0), make_keepalive_handler(module.handler),
+                               workers=concurrency, max_queue=concurrency * 4)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    local = threading.local()
+
+    def request_once(url):
+        # 클라이언트 스레드마다 keep-alive 연결 하나
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        body = json.dumps({'url': url})
+        try:
+            conn.request('POST', '/api/extract', body=body, headers={'Content-Type': 'application/json'})
+            response = conn.getresponse()
+            data = json.loads(response.read())
+        except (OSError, http.client.HTTPException, ValueError):
+            conn.close()
+            local.conn = None
+            return False
+        return bool(data.get('success'))
+
+    try:
+        return run_threaded(urls, concurrency, request_once)
+    finally:
+        server.graceful_shutdown(timeout=5)
+
+
+def bench_cli(urls, concurrency):
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'extract_api.py'), '--serve', '--workers', str(concurrency)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8', bufsize=1,
+    )
+    json.loads(process.stdout.readline())  # ready
+
+    slots = threading.Semaphore(concurrency)
+    sent = {}
+    latencies = []
+    errors = 0
+
+    def reader():
+        nonlocal errors
+        for _ in urls:
+            response = json.loads(process.stdout.readline())
+            latencies.append(time.perf_counter() - sent.pop(response['id']))
+            if not response.get('success'):
+                errors += 1
+            slots.release()
+
+    thread = threading.Thread(target=reader)
+    started = time.perf_counter()
+    thread.start()
+    for request_id, url in enumerate(urls):
+        slots.acquire()
+        sent[request_id] = time.perf_counter()
+        process.stdin.write(json.dumps({'id': request_id, 'url': url}) + '\n')
+        process.stdin.flush()
+    thread.join()
+    wall = time.perf_counter() - started
+    process.stdin.close()
+    process.wait()
+    return latencies, errors, wall
+
+
+def run_child(args):
+    """측정 하나 실행 후 결과 JSON 한 줄 출력 (부모 프로세스가 호출)"""
+    video_ids = list(make_corpus(args.videos, 0))
+    urls = video_urls(video_ids, args.requests)
+    bench = {'extractor': bench_extractor, 'handler': bench_handler, 'cli': bench_cli}[args.child]
+    latencies, errors, wall = bench(urls, args.child_concurrency)
+
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if args.child == 'cli':
+        # 측정 대상은 상주 서버 프로세스
+        rss_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    print(json.dumps(summarize(args.child, args.child_concurrency, latencies, errors, wall, rss_kb)))
+
+
+def run_one(target, concurrency, server, videos, requests):
+    env = dict(os.environ)
+    env.update({
+        'YT_TRANSCRIPT_BACKEND_URL': server.url,
+        'YT_CACHE_DISABLE': '1',
+        'YT_SINGLEFLIGHT_DISABLE': '1',
+        'PYTHONPATH': ROOT,
+    })
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', target, '--child-concurrency', str(concurrency),
+         '--requests', str(requests), '--videos', str(videos)],
+        env=env, capture_output=True, text=True, check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f'{target} x{concurrency} 실패:\n{completed.stderr}')
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_result(result):
+    print(f"{result['target']:>9} x{result['concurrency']:<3}: 요청 {result['requests']}개 "
+          f"(오류 {result['errors']}), 처리량 {result['throughput']:.1f} req/s, "
+          f"p50 {result['p50']:.1f}ms, p95 {result['p95']:.1f}ms, p99 {result['p99']:.1f}ms, "
+          f"RSS {result['rss_mb']:.1f}MB", flush=True)
+
+
+def compare(results, baseline, tolerance):
+    """기준보다 처리량이 tolerance 이상 낮거나 p95 가 tolerance 이상 높으면 회귀"""
+    base = {(r['target'], r['concurrency']): r for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old = base.get((result['target'], result['concurrency']))
+        if old is None:
+            continue
+        name = f"{result['target']} x{result['concurrency']}"
+        if result['throughput'] < old['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: 처리량 {old['throughput']:.1f} -> {result['throughput']:.1f} req/s")
+        if result['p95'] > old['p95'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {old['p95']:.1f} -> {result['p95']:.1f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출 경로 부하 벤치마크")
+    parser.add_argument('--targets', default=','.join(TARGETS))
+    parser.add_argument('--concurrency', default='1,4,16')
+    parser.add_argument('--requests', type=int, default=200, help='측정마다 보낼 요청 수')
+    parser.add_argument('--videos', type=int, default=1000, help='가짜 서버의 비디오 수')
+    parser.add_argument('--entries', type=int, default=200, help='비디오마다 자막 항목 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='가짜 서버 응답 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.01, help='지연에 더할 무작위 값 최대(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='가짜 서버가 503 으로 응답할 비율')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--save', metavar='FILE', help='결과를 기준 JSON 으로 저장')
+    parser.add_argument('--compare', metavar='FILE', help='기준 JSON 과 비교 (회귀가 있으면 종료 코드 1)')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='허용 오차 비율 (기본 0.25)')
+    # 내부용: 측정 하나를 실행하는 자식 프로세스
+    parser.add_argument('--child', choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument('--child-concurrency', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    targets = [t.strip() for t in args.targets.split(',') if t.strip()]
+    levels = [int(c) for c in args.concurrency.split(',') if c.strip()]
+    config = {
+        'requests': args.requests,
+        'videos': args.videos,
+        'entries': args.entries,
+        'latency': args.latency,
+        'jitter': args.jitter,
+        'error_rate': args.error_rate,
+    }
+    print(f"📊 가짜 서버: 비디오 {args.videos}개 x 자막 {args.entries}개, 지연 {args.latency * 1000:.0f}"
+          f"+{args.jitter * 1000:.0f}ms, 오류 비율 {args.error_rate:.0%}")
+
+    corpus = make_corpus(args.videos, args.entries)
+    results = []
+    with FakeTranscriptServer(corpus, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                              seed=args.seed) as server:
+        for target in targets:
+            for concurrency in levels:
+                result = run_one(target, concurrency, server, args.videos, args.requests)
+                print_result(result)
+                results.append(result)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'config': config,
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('config') != config:
+            print(f"⚠️ 기준과 설정이 다릅니다: {baseline.get('config')}")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("❌ 성능 회귀:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"✅ 기준 대비 회귀 없음 (허용 오차 {args.tolerance:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문장 포맷터 벤치마크
+
+api/youtube_text_extractor.py 의 예전 format_transcript 구현과
+youtube_core.formatting.format_sentences 를 합성 자막(기본 1만/10만 항목)으로 비교한다.
+측정 전에 두 구현의 결과가 바이트 단위로 같은지 먼저 확인한다.
+
+사용법:
+    python benchmarks/bench_formatter.py [--sizes 10000,100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from youtube_core.formatting import format_sentences
+
+
+def legacy_format(transcript_data):
+    """예전 format_transcript 구현 (비교 기준)"""
+    if not transcript_data:
+        return ""
+
+    formatted_lines = []
+
+    for entry in transcript_data:
+        text = entry['text'].strip()
+        if text and text not in ['[음악]', '[Music]', '[Applause]', '[박수]']:
+            text = re.sub(r'\n+', ' ', text)
+            text = re.sub(r'\s+', ' ', text)
+            formatted_lines.append(text)
+
+    result_text = ' '.join(formatted_lines)
+
+    sentences = re.split(r'[.!?]\s+', result_text)
+    formatted_sentences = []
+
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if sentence and len(sentence) > 3:
+            if not sentence.endswith(('.', '!', '?')):
+                sentence += '.'
+            formatted_sentences.append(sentence)
+
+    return '\n\n'.join(formatted_sentences)
+
+
+WORDS = ['오늘은', '자막', '추출기를', 'test', 'the', 'video', '정말', 'ok', 'a', '좋은', 'hello']
+ODD_TEXTS = ['[음악]', '[Music]', ' [박수] ', '', '   ', '.', '?!', 'a. b', '. 시작', '끝.', 'x!\n\ny',
+             'tab\tand　wide', '\n[Applause]\n', 'ab', 'no punct', 'Mr. Smith', '...', 'q? ']
+
+
+def make_transcript(count, seed=0):
+    """문장 부호/줄바꿈/잡음 토큰이 섞인 합성 자막"""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        if rng.random() < 0.1:
+            text = rng.choice(ODD_TEXTS)
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(1, 10))]
+            text = ' '.join(words)
+            if rng.random() < 0.3:
+                text += rng.choice('.!?')
+            if rng.random() < 0.2:
+                text = text.replace(' ', '\n', 1)
+        entries.append({'text': text, 'start': i * 2.0, 'duration': 2.0})
+    return entries
+
+
+def check_identical(trials=200):
+    """작은 무작위 자막들로 두 구현의 결과가 같은지 확인"""
+    for seed in range(trials):
+        entries = make_transcript(random.Random(seed).randint(0, 60), seed)
+        expected = legacy_format(entries)
+        actual = format_sentences(entries)
+        if actual != expected:
+            raise AssertionError(f"결과가 다릅니다 (seed={seed})\n{expected!r}\n{actual!r}")
+    print(f"✅ 무작위 자막 {trials}개에서 결과 동일")
+
+
+def bench(name, func, entries, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(entries)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문장 포맷터 벤치마크')
+    parser.add_argument('--sizes', default='10000,100000', help='자막 항목 수 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    check_identical()
+
+    for size in [int(s) for s in args.sizes.split(',') if s]:
+        entries = make_transcript(size)
+        if legacy_format(entries) != format_sentences(entries):
+            raise AssertionError(f"{size}개 항목에서 결과가 다릅니다")
+
+        legacy = bench('legacy', legacy_format, entries, args.repeat)
+        current = bench('single-pass', format_sentences, entries, args.repeat)
+        print(f"{size:>7}개 항목: 예전 {legacy * 1000:.1f}ms, "
+              f"한 번 훑기 {current * 1000:.1f}ms ({legacy / current:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+import 시간 예산 벤치마크
+
+서버리스 콜드 스타트마다 드는 모듈 import 시간을 `python -X importtime` 으로 잰다.
+모듈마다 새 프로세스에서 여러 번 import 해서 누적 시간(cumulative)의 중앙값을 구하고
+    - 예산(BUDGETS_MS)을 넘거나
+    - 첫 사용 때 불러와야 할 무거운 의존성(LAZY_MODULES)이 import 시점에 들어오면
+종료 코드 1 로 끝난다. 인터프리터 시작(site) 시간은 포함하지 않는다.
+
+사용법:
+    python benchmarks/bench_import.py [--repeat 7] [--scale 1.0] [--verbose]
+    (느린 CI 머신에서는 --scale 2 처럼 예산을 늘린다)
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 모듈별 import 예산 (ms, 누적 시간 중앙값)
+BUDGETS_MS = {
+    'youtube_text_extractor': 60,
+    'api.youtube_text_extractor': 80,
+    'api.extract': 130,  # BaseHTTPRequestHandler 때문에 http.server(약 40ms)가 필요하다
+    'extract_api': 90,
+}
+
+# import 시점에는 들어오면 안 되는 모듈 (첫 자막/메타데이터 조회나 비동기 추출 때 불러온다)
+LAZY_MODULES = ('yt_dlp', 'youtube_transcript_api', 'requests', 'asyncio')
+
+
+def import_profile(module):
+    """새 프로세스에서 module 을 import 하고 module 이 불러온 모듈들의 {이름: 누적 시간(us)} 반환
+
+    인터프리터 시작(site 등) 때 불러온 모듈은 빠지고 module 자신은 포함된다.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = len(name) - len(name.lstrip())
+        rows.append((name.strip(), depth, int(cumulative)))
+
+    # importtime 은 하위 모듈을 부모보다 먼저, 더 깊게 들여 써서 출력한다
+    index = max(i for i, row in enumerate(rows) if row[0] == module)
+    top_depth = rows[index][1]
+    profile = {module: rows[index][2]}
+    for name, depth, cumulative in reversed(rows[:index]):
+        if depth <= top_depth:
+            break
+        profile.setdefault(name, cumulative)
+    return profile
+
+
+def measure(module, repeat):
+    """(누적 시간 중앙값 ms, 마지막 실행의 프로필)"""
+    samples = []
+    profile = {}
+    for _ in range(repeat):
+        profile = import_profile(module)
+        samples.append(profile[module] / 1000)
+    return statistics.median(samples), profile
+
+
+def heaviest(profile, module, count=5):
+    """module 이 불러온 모듈 중 누적 시간이 큰 것들"""
+    items = sorted(((us, name) for name, us in profile.items() if name != module), reverse=True)
+    return [f"{name} {us / 1000:.1f}ms" for us, name in items[:count]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='import 시간 예산 벤치마크')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--scale', type=float, default=float(os.environ.get('IMPORT_BUDGET_SCALE', '1.0')),
+                        help='예산 배율 (느린 머신)')
+    parser.add_argument('--verbose', action='store_true', help='무거운 하위 모듈 출력')
+    args = parser.parse_args()
+
+    failures = []
+    for module, budget in BUDGETS_MS.items():
+        budget *= args.scale
+        elapsed, profile = measure(module, max(1, args.repeat))
+        eager = [name for name in LAZY_MODULES if name in profile]
+
+        status = '✅' if elapsed <= budget and not eager else '❌'
+        print(f"{status} {module:<28} {elapsed:7.1f}ms (예산 {budget:.0f}ms)")
+        if args.verbose:
+            print('      ' + ', '.join(heaviest(profile, module)))
+        if elapsed > budget:
+            failures.append(f"{module}: {elapsed:.1f}ms > {budget:.0f}ms")
+        if eager:
+            failures.append(f"{module}: import 시점에 {', '.join(eager)} 를 불러옵니다")
+
+    if failures:
+        print('\n'.join(['', '예산 초과:'] + failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자막 저장 형태 벤치마크
+
+같은 합성 자막을 세 가지 형태로 만들어 메모리와 처리 시간을 비교한다.
+    dicts     normalize_entries 결과 (항목마다 dict, 지금까지의 transcript_data)
+    snippets  youtube_transcript_api 1.x 의 FetchedTranscriptSnippet 객체 (설치돼 있을 때만)
+    compact   youtube_core.compact.CompactTranscript
+
+메모리는 tracemalloc 으로 만든 뒤 남아 있는 바이트, 시간은 여러 번 실행한 중앙값이다.
+측정 전에 dicts 와 compact 로 만든 모든 출력 형식이 같은지 먼저 확인한다.
+
+사용법:
+    python benchmarks/bench_transcript.py [--sizes 10000,100000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from youtube_core.compact import CompactTranscript
+from youtube_core.formats import render_output
+from youtube_core.formatting import format_sentences
+
+try:
+    from youtube_transcript_api import FetchedTranscriptSnippet
+except ImportError:
+    FetchedTranscriptSnippet = None
+
+
+WORDS = ['오늘은', '자막', '추출기를', 'test', 'the', 'video', '정말', 'ok', 'a', '좋은', 'hello', '[음악]']
+
+
+def make_payload(count, seed=0):
+    """캐시/보관소에 저장되는 것과 같은 JSON 문자열 (불러올 때 만들어지는 객체를 재기 위해)"""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(2, 12))]
+        text = ' '.join(words) + rng.choice(['', '', '.', '?'])
+        entries.append({'text': text, 'start': round(i * 2.37, 3), 'duration': round(rng.uniform(1, 4), 3)})
+    return json.dumps(entries, ensure_ascii=False)
+
+
+def build_dicts(payload):
+    return json.loads(payload)
+
+
+def build_snippets(payload):
+    return [FetchedTranscriptSnippet(text=e['text'], start=e['start'], duration=e['duration'])
+            for e in json.loads(payload)]
+
+
+def build_compact(payload):
+    return CompactTranscript.from_entries(json.loads(payload))
+
+
+class FakeExtractor:
+    """출력 형식 writer 가 읽는 속성만 가진 추출기"""
+
+    def __init__(self, entries):
+        self.transcript_data = entries
+        self.video_info = {'title': '벤치마크', 'video_id': 'bench000001'}
+        self.transcript_language = 'ko'
+
+    def format_transcript(self):
+        return format_sentences(self.transcript_data)
+
+
+def retained_bytes(builder, payload):
+    """builder(payload) 결과가 차지하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = builder(payload)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def check_identical(payload):
+    dicts = FakeExtractor(build_dicts(payload))
+    compact = FakeExtractor(build_compact(payload))
+    for name in ('srt', 'vtt', 'json', 'markdown'):
+        if render_output(dicts, name) != render_output(compact, name):
+            raise AssertionError(f"{name} 형식 결과가 다릅니다")
+    if dicts.format_transcript() != compact.format_transcript():
+        raise AssertionError("문장 포맷 결과가 다릅니다")
+    if list(compact.transcript_data) != dicts.transcript_data:
+        raise AssertionError("항목이 다릅니다")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='자막 저장 형태 벤치마크')
+    parser.add_argument('--sizes', default='10000,100000', help='자막 항목 수 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    builders = [('dicts', build_dicts), ('compact', build_compact)]
+    if FetchedTranscriptSnippet is not None:
+        builders.insert(1, ('snippets', build_snippets))
+
+    check_identical(make_payload(2000, seed=1))
+    print("✅ dicts/compact 출력 형식 결과 동일")
+
+    for size in [int(s) for s in args.sizes.split(',') if s]:
+        payload = make_payload(size)
+        print(f"\n{size}개 항목 (JSON {len(payload.encode('utf-8')) / 1e6:.1f}MB)")
+        print(f"{'형태':<10}{'메모리':>10}{'만들기':>10}{'srt':>10}{'문장':>10}{'구간 10분':>12}")
+
+        dict_memory = None
+        for name, builder in builders:
+            memory = retained_bytes(builder, payload)
+            dict_memory = dict_memory or memory
+            entries = builder(payload)
+            build_ms = timed(lambda: builder(payload), args.repeat)
+
+            if name == 'snippets':
+                # writer 는 dict 항목을 읽으므로 형식/구간 비교는 dicts 와 compact 만
+                print(f"{name:<10}{memory / 1e6:>8.1f}MB{build_ms:>8.1f}ms{'-':>10}{'-':>10}{'-':>12}")
+                continue
+
+            extractor = FakeExtractor(entries)
+            srt_ms = timed(lambda: render_output(extractor, 'srt'), args.repeat)
+            sentences_ms = timed(extractor.format_transcript, args.repeat)
+            middle = entries[len(entries) // 2]['start']
+            if name == 'compact':
+                slice_ms = timed(lambda: entries.between(middle, middle + 600), args.repeat)
+            else:
+                slice_ms = timed(lambda: [e for e in entries if middle <= e['start'] < middle + 600], args.repeat)
+
+            ratio = '' if name == 'dicts' else f" ({dict_memory / memory:.1f}배 작음)"
+            print(f"{name:<10}{memory / 1e6:>8.1f}MB{build_ms:>8.1f}ms{srt_ms:>8.1f}ms"
+                  f"{sentences_ms:>8.1f}ms{slice_ms:>10.3f}ms{ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL 정규화 벤치마크
+
+예전 배치 묶기(줄마다 strip 후 추출기의 extract_video_id 호출)와 youtube_core.urls.normalize_batch 를
+합성 입력(기본 10만/100만 줄)으로 비교한다. 입력에는 여러 주소 모양, 추적 파라미터, 주소 없이 적은 ID,
+중복 줄, 잘못된 줄이 섞여 있다 (주소 없는 ID까지 세도록 normalize_batch 는 allow_bare_id=True 로 잰다). 측정 전에 예전 구현이 알아보는 줄에서 두 구현의 결과가 같은지 먼저 확인한다.
+
+사용법:
+    python benchmarks/bench_urls.py [--sizes 100000,1000000] [--repeat 3] [--duplicates 0.3]
+"""
+
+import argparse
+import functools
+import os
+import random
+import re
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from youtube_core.urls import normalize_batch
+
+
+# 예전 youtube_core.extractor 의 패턴 (비교 기준)
+LEGACY_PATTERN = re.compile(
+    r'(?:youtube\.com/(?:watch\?(?:[^#\n]*&)?v=|embed/|live/|shorts/)|youtu\.be/)([^&\n?#/]+)'
+)
+
+
+def legacy_group(lines):
+    """예전 group_by_video_id 구현 (비교 기준) - ([처음 나온 순서대로 video_id], rejects)"""
+    jobs = {}
+    rejects = []
+    for index, line in enumerate(lines):
+        line = (line or '').strip()
+        match = LEGACY_PATTERN.search(line) if line else None
+        if not match:
+            rejects.append((index, line))
+            continue
+        video_id = match.group(1)
+        if video_id in jobs:
+            jobs[video_id][2].append(line)
+        else:
+            jobs[video_id] = (index, video_id, [line])
+    return list(jobs), rejects
+
+
+ID_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-'
+# 예전 패턴도 알아보는 모양
+COMMON_SHAPES = [
+    'https://www.youtube.com/watch?v={id}',
+    'https://youtu.be/{id}?si=AbCdEfGhIjKlMnOp',
+    'https://www.youtube.com/watch?v={id}&t=42s&list=PL0123456789',
+    'https://www.youtube.com/watch?feature=share&v={id}',
+    'https://www.youtube.com/shorts/{id}',
+    'https://www.youtube.com/embed/{id}?start=10',
+    'https://m.youtube.com/watch?v={id}',
+    'https://www.youtube.com/live/{id}?feature=share',
+]
+# 새로 알아보는 모양
+NEW_SHAPES = [
+    '{id}',
+    'https://www.youtube-nocookie.com/embed/{id}',
+    'https://music.youtube.com/watch?v={id}&si=xyz',
+    'HTTPS://WWW.YOUTUBE.COM/watch?v={id}',
+]
+BAD_LINES = ['', 'https://example.com/watch?v=abc', 'not a url', 'https://www.youtube.com/watch?list=PL01']
+# 예전 패턴은 받아들이지만 11자가 아니거나 다른 주소 안에 들어 있어서 이제 거절하는 줄
+INVALID_ID_LINES = ['https://youtu.be/tooShort', 'https://www.youtube.com/watch?v=dQw4w9WgXcQQ',
+                    'https://evil.com/youtube.com/shorts/dQw4w9WgXcQ']
+
+
+def make_lines(count, duplicates=0.3, shapes=None, bad_lines=None, seed=0):
+    """주소 모양/중복/잘못된 줄이 섞인 합성 입력"""
+    rng = random.Random(seed)
+    shapes = shapes or COMMON_SHAPES + NEW_SHAPES
+    bad_lines = bad_lines or BAD_LINES + INVALID_ID_LINES
+    lines = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            lines.append(rng.choice(bad_lines))
+        elif roll < duplicates and lines:
+            lines.append(lines[rng.randrange(len(lines))])
+        else:
+            video_id = ''.join(rng.choice(ID_CHARS) for _ in range(11))
+            lines.append(rng.choice(shapes).format(id=video_id))
+    return lines
+
+
+def check_identical(count=20000):
+    """예전 패턴이 알아보는 입력에서 두 구현의 결과가 같은지 확인"""
+    lines = make_lines(count, shapes=COMMON_SHAPES, bad_lines=BAD_LINES, seed=1)
+    if legacy_group(lines) != normalize_batch(lines):
+        raise AssertionError("예전 구현과 결과가 다릅니다")
+    print(f"✅ 합성 입력 {count}줄에서 결과 동일")
+
+
+def bench(func, lines, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(lines)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='URL 정규화 벤치마크')
+    parser.add_argument('--sizes', default='100000,1000000', help='입력 줄 수 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--duplicates', type=float, default=0.3, help='중복 줄 비율')
+    args = parser.parse_args()
+
+    check_identical()
+
+    normalize = functools.partial(normalize_batch, allow_bare_id=True)
+    for size in [int(s) for s in args.sizes.split(',') if s]:
+        lines = make_lines(size, args.duplicates)
+        video_ids, rejects = normalize(lines)
+        print(f"{size:>8}줄 - 영상 {len(video_ids)}개, 중복 {size - len(video_ids) - len(rejects)}줄, "
+              f"거절 {len(rejects)}줄")
+        legacy = bench(legacy_group, lines, args.repeat)
+        current = bench(normalize, lines, args.repeat)
+        print(f"    예전            {legacy * 1000:7.0f}ms ({size / legacy / 1e6:.2f}M줄/초)")
+        print(f"    normalize_batch {current * 1000:7.0f}ms ({size / current / 1e6:.2f}M줄/초, {legacy / current:.2f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+콜드 스폰 vs 상주 워커 풀 벤치마크
+
+pages/api/extract.js 가 예전처럼 요청마다 extract_api.py 를 새로 띄울 때와
+extract_api.py --serve 상주 프로세스를 재사용할 때의 요청당 지연을 비교한다.
+기본 URL은 유튜브가 아닌 주소라서 네트워크 없이 프로세스/임포트 비용만 측정된다.
+
+사용법:
+    python benchmarks/bench_worker_pool.py [--requests 20] [--workers 4] [--url URL]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'extract_api.py')
+
+
+def summarize(name, samples, wall):
+    """지연 통계 출력"""
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"{name:>6}: 요청 {len(samples)}개, 총 {wall:.2f}s, "
+          f"처리량 {len(samples) / wall:.1f} req/s, "
+          f"평균 {statistics.mean(samples) * 1000:.1f}ms, "
+          f"p50 {statistics.median(samples) * 1000:.1f}ms, "
+          f"p95 {p95 * 1000:.1f}ms")
+
+
+def bench_cold(url, requests):
+    """요청마다 새 인터프리터를 띄우는 기존 방식"""
+    samples = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT, url], capture_output=True, check=False)
+        samples.append(time.perf_counter() - t0)
+    return samples, time.perf_counter() - started
+
+
+def bench_warm(url, requests, workers):
+    """상주 서버 프로세스 하나를 재사용하는 방식"""
+    process = subprocess.Popen(
+        [sys.executable, SCRIPT, '--serve', '--workers', str(workers)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8'
+    )
+    try:
+        # 준비 완료 신호까지 대기 (워밍업은 측정에서 제외)
+        ready = json.loads(process.stdout.readline())
+        assert ready.get('ready'), ready
+
+        samples = []
+        started = time.perf_counter()
+        for i in range(requests):
+            t0 = time.perf_counter()
+            process.stdin.write(json.dumps({'id': str(i), 'url': url}) + '\n')
+            process.stdin.flush()
+            json.loads(process.stdout.readline())
+            samples.append(time.perf_counter() - t0)
+        return samples, time.perf_counter() - started
+    finally:
+        process.stdin.close()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--url', default='https://example.com/not-a-youtube-url')
+    args = parser.parse_args()
+
+    cold, cold_wall = bench_cold(args.url, args.requests)
+    warm, warm_wall = bench_warm(args.url, args.requests, args.workers)
+
+    summarize('cold', cold, cold_wall)
+    summarize('warm', warm, warm_wall)
+    print(f"p50 개선: {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,11 @@ React 프론트엔드에서 호출되는 백엔드 스크립트
 import sys
 import json
 import os
-import re
+import argparse
+import functools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 인코딩 설정
 if hasattr(sys.stdout, 'reconfigure'):
@@ -16,182 +20,340 @@ if hasattr(sys.stdout, 'reconfigure'):
 if hasattr(sys.stderr, 'reconfigure'):
     sys.stderr.reconfigure(encoding='utf-8')
 
-# YouTube Transcript API import
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-except ImportError:
+# YouTube Transcript API 설치 확인 (실제 import 는 첫 자막 조회 때 - 시작 시간 절약)
+if importlib.util.find_spec('youtube_transcript_api') is None:
     print(json.dumps({
         "success": False,
         "error": "youtube-transcript-api 패키지가 설치되지 않았습니다"
     }))
     sys.exit(1)
 
+from youtube_core.archive import DEFAULT_SEARCH_LIMIT, get_default_archive
+from youtube_core.batch import DEFAULT_CONCURRENCY, extract_many, parse_batch
+from youtube_core.extractor import YouTubeTextExtractor
+from youtube_core.formats import DEFAULT_FORMAT, FORMATS, get_format
+from youtube_core.http_cache import make_etag, matching_tag, transcript_etag
+from youtube_core.prewarm import prewarm_enabled, start_prewarm
+from youtube_core.ranges import parse_range
+from youtube_core.response import extractor_response, run_extraction, search_response, stable_response, translate_error
+from youtube_core.streaming import iter_extraction_events
 
-class YouTubeTextExtractor:
-    def __init__(self):
-        self.video_info = {}
-        self.transcript_data = []
-        self.formatted_text = ""
-        self.error_details = ""
-        
-    def extract_video_id(self, url):
-        """유튜브 URL에서 비디오 ID 추출"""
-        match = re.search(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)', url)
-        return match.group(1) if match else None
-    
-    def get_video_info(self, video_id):
-        """기본 비디오 정보 설정"""
-        self.video_info = {
-            'title': f'YouTube Video {video_id}',
-            'channel': 'Unknown',
-            'duration': 0,
-            'video_id': video_id
-        }
-    
-    def extract_transcript(self, video_id):
-        """자막 추출"""
+
+def build_response(url, languages=None, output_format=DEFAULT_FORMAT, timings=False, **selection):
+    """URL 하나를 처리해서 응답 딕셔너리 생성 (selection: start/end/max_chars, timings: info.timings 포함)"""
+    return run_extraction(YouTubeTextExtractor(languages=languages, output_format=output_format), url, timings,
+                          **selection)
+
+
+def build_cacheable_response(url, languages=None, output_format=DEFAULT_FORMAT, if_none_match=None, **selection):
+    """캐시용 응답 (Next.js GET 라우트용) - 요청마다 달라지는 필드를 빼고 "etag" 를 붙인다
+
+    캐시에 있는 자막으로 만든 ETag 가 if_none_match 와 맞으면 추출하지 않고
+    {"success": true, "not_modified": true, "etag": ...} 만 돌려준다.
+    """
+    extractor = YouTubeTextExtractor(languages=languages, output_format=output_format)
+    video_id = extractor.extract_video_id(url)
+    etag = transcript_etag(extractor, video_id, selection)
+    tag = matching_tag(if_none_match, etag)
+    if tag:
+        return {"success": True, "not_modified": True, "etag": tag}
+
+    response = stable_response(run_extraction(extractor, url, **selection))
+    if response["success"]:
+        etag = etag or transcript_etag(extractor, video_id, selection)
+        response["etag"] = etag or make_etag(encode_response(response).encode('utf-8'))
+    return response
+
+
+def build_batch_response(urls, concurrency=DEFAULT_CONCURRENCY, languages=None, output_format=DEFAULT_FORMAT):
+    """여러 URL을 처리해서 결과 목록이 담긴 응답 딕셔너리 생성 (잘못된 입력이면 실패 응답)"""
+    try:
+        urls, concurrency = parse_batch(urls, concurrency)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    factory = functools.partial(YouTubeTextExtractor, languages=languages, output_format=output_format)
+    results = list(extract_many(urls, factory, concurrency=concurrency))
+    results.sort(key=lambda result: result["index"])
+    return {
+        "success": True,
+        "results": results
+    }
+
+
+def encode_response(response):
+    """응답을 한 줄짜리 JSON 문자열로 인코딩"""
+    try:
+        return json.dumps(response, ensure_ascii=False, indent=None, separators=(',', ':'))
+    except Exception:
+        # 백업 응답
+        backup_response = {"success": False, "error": "JSON encoding error"}
+        if isinstance(response, dict) and "id" in response:
+            backup_response["id"] = response["id"]
+        return json.dumps(backup_response)
+
+
+def serve(workers=4):
+    """상주 서버 모드
+
+    stdin으로 한 줄에 하나씩 {"id": ..., "url": ...} JSON 요청을 받고
+    stdout으로 같은 id가 붙은 응답을 한 줄씩 돌려준다.
+    {"id": ..., "urls": [...]} 요청은 배치로 처리해서 results 목록으로 돌려준다.
+    "languages" 필드로 자막 언어 우선순위를, "format" 필드로 출력 형식(srt, vtt, json, markdown)을 지정할 수 있다.
+    "stream": true 요청은 info/chunk/done(또는 error) 이벤트를 같은 id로 여러 줄에 나눠 보낸다.
+    "start"/"end"(초 또는 'MM:SS')와 "max_chars" 필드로 자막 일부만 받을 수 있다 (URL 하나짜리 요청).
+    "timings": true 면 응답(스트리밍이면 info 이벤트)의 info.timings 에 단계별 소요 시간(ms)을 넣는다.
+    "etag": true 요청은 build_cacheable_response 로 처리한다 ("if_none_match" 가 맞으면 추출 없이 not_modified).
+    {"id": ..., "search": "검색어", "limit": 20} 요청은 자막 보관소(YT_ARCHIVE_PATH)를 검색한다.
+    인터프리터와 라이브러리 import 비용은 프로세스 시작 시 한 번만 든다.
+
+    실행 중이거나 기다리는 요청은 workers 의 2배까지만 받는다 - 넘으면 자리가 날 때까지 stdin 을 읽지 않는다.
+    처리 중 예외가 나도 같은 id 의 실패 응답(스트리밍 요청이면 error 이벤트)을 꼭 한 줄 보낸다.
+    JSON 객체가 아닌 줄은 id 없는 실패 응답 한 줄로 답하고 다음 줄을 읽는다.
+    """
+    write_lock = threading.Lock()
+    in_flight = threading.BoundedSemaphore(workers * 2)
+
+    def write_line(response):
+        line = encode_response(response)
+        with write_lock:
+            sys.stdout.write(line + '\n')
+            sys.stdout.flush()
+
+    def handle(request, selection):
         try:
-            # 한국어 자막 시도
+            process(request, selection)
+        except Exception as e:
+            response = {"id": request.get("id"), "success": False,
+                        "error": translate_error(str(e), default_prefix=True)}
+            if request.get("stream"):
+                response["type"] = "error"
+            write_line(response)
+        finally:
+            in_flight.release()
+
+    def process(request, selection):
+        output_format = request.get("format") or DEFAULT_FORMAT
+        if request.get("stream") and request.get("url"):
+            # 스트리밍 요청: 이벤트마다 같은 id로 한 줄씩 출력
+            extractor = YouTubeTextExtractor(languages=request.get("languages"), output_format=output_format)
+            for event in iter_extraction_events(extractor, request["url"], timings=bool(request.get("timings")),
+                                                **selection):
+                event["id"] = request.get("id")
+                write_line(event)
+            return
+        if request.get("urls"):
+            response = build_batch_response(request["urls"], request.get("concurrency", DEFAULT_CONCURRENCY),
+                                            request.get("languages"), output_format)
+        elif request.get("etag"):
+            response = build_cacheable_response(request["url"], request.get("languages"), output_format,
+                                                request.get("if_none_match"), **selection)
+        else:
+            response = build_response(request["url"], request.get("languages"), output_format,
+                                      bool(request.get("timings")), **selection)
+        response["id"] = request.get("id")
+        write_line(response)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    write_line({"id": None, "ready": True, "workers": workers})
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
             try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ko'])
-            except:
-                # 영어 자막 시도
+                request = json.loads(line)
+            except ValueError:
+                write_line({"id": None, "success": False, "error": "잘못된 JSON 요청입니다"})
+                continue
+            if not isinstance(request, dict):
+                write_line({"id": None, "success": False, "error": "요청은 JSON 객체여야 합니다"})
+                continue
+
+            if "search" in request:
+                # 보관소 검색은 네트워크 없이 바로 끝나므로 읽는 스레드에서 처리
                 try:
-                    transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en'])
-                except:
-                    # 사용 가능한 모든 자막 시도
-                    transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            
-            self.transcript_data = transcript
-            return True if transcript else False
-            
-        except Exception as e:
-            self.error_details = str(e)
-            return False
-    
-    def format_transcript(self):
-        """자막 포맷팅"""
-        if not self.transcript_data:
-            return ""
-        
-        texts = []
-        for entry in self.transcript_data:
-            text = entry.get('text', '').strip()
-            if text:
-                texts.append(text)
-        
-        self.formatted_text = ' '.join(texts)
-        return self.formatted_text
-    
-    def process_youtube_url(self, url):
-        """메인 처리 함수"""
-        try:
-            video_id = self.extract_video_id(url)
-            if not video_id:
-                self.error_details = "올바른 유튜브 URL이 아닙니다"
-                return False
-            
-            self.get_video_info(video_id)
-            
-            if self.extract_transcript(video_id):
-                self.format_transcript()
-                return True
-            else:
-                return False
-                
-        except Exception as e:
-            self.error_details = str(e)
-            return False
+                    response = search_response(request["search"], request.get("limit", DEFAULT_SEARCH_LIMIT))
+                except Exception as e:
+                    response = {"success": False, "error": translate_error(str(e), default_prefix=True)}
+                response["id"] = request.get("id")
+                write_line(response)
+                continue
+
+            if not request.get("url") and not request.get("urls"):
+                write_line({"id": request.get("id"), "success": False, "error": "URL 매개변수가 필요합니다"})
+                continue
+
+            try:
+                get_format(request.get("format"))
+                selection = parse_range(request)
+                if request.get("urls"):
+                    parse_batch(request["urls"], request.get("concurrency", DEFAULT_CONCURRENCY))
+            except ValueError as e:
+                write_line({"id": request.get("id"), "success": False, "error": str(e)})
+                continue
+
+            in_flight.acquire()
+            executor.submit(handle, request, selection)
+    finally:
+        # stdin이 닫히면 진행 중인 요청까지 마치고 종료
+        executor.shutdown(wait=True)
+
+
+def read_lines(path):
+    """한 줄에 하나씩 적힌 URL 목록 ('-'이면 stdin, 빈 줄과 '#' 주석 제외)"""
+    if path == '-':
+        lines = [line.strip() for line in sys.stdin]
+    else:
+        with open(path, encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+def run_batch(path, concurrency, languages=None, output_format=DEFAULT_FORMAT):
+    """배치 CLI 모드: 결과가 끝나는 대로 한 줄씩 JSON 출력"""
+    urls = read_lines(path)
+
+    factory = functools.partial(YouTubeTextExtractor, languages=languages, output_format=output_format)
+    for result in extract_many(urls, factory, concurrency=concurrency):
+        print(encode_response(result))
+        sys.stdout.flush()
+
+
+def run_normalize(path, allow_bare_id=False):
+    """URL 정규화 CLI 모드: 중복 없는 비디오 ID를 한 줄씩 출력하고 요약(거절한 줄 포함)은 stderr 에 JSON 으로"""
+    from youtube_core.urls import normalize_batch
+
+    lines = read_lines(path)
+    video_ids, rejects = normalize_batch(lines, allow_bare_id=allow_bare_id)
+    sys.stdout.write(''.join(video_id + '\n' for video_id in video_ids))
+    sys.stdout.flush()
+    print(encode_response({
+        "success": True,
+        "lines": len(lines),
+        "videos": len(video_ids),
+        "duplicates": len(lines) - len(video_ids) - len(rejects),
+        "rejects": [line for _, line in rejects],
+    }), file=sys.stderr)
+
+
+def run_crawl(path, concurrency, languages=None, max_new=None):
+    """크롤러 CLI 모드: 채널/재생목록마다 새 영상 자막을 보관소에 저장하고 요약을 한 줄씩 JSON 출력"""
+    from youtube_core.crawler import ChannelCrawler
+
+    archive = get_default_archive()
+    if archive is None:
+        print(encode_response({"success": False, "error": "--crawl 에는 --archive 또는 YT_ARCHIVE_PATH 가 필요합니다"}))
+        sys.exit(1)
+
+    crawler = ChannelCrawler(archive, languages=languages, concurrency=concurrency, max_new=max_new)
+    for report in crawler.sync_many(read_lines(path)):
+        print(encode_response(report))
+        sys.stdout.flush()
 
 
 def main():
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="YouTube 자막 추출 API 스크립트")
+    parser.add_argument("url", nargs="?", help="유튜브 URL")
+    parser.add_argument("--serve", action="store_true",
+                        help="stdin/stdout 줄 단위 JSON 상주 서버 모드")
+    parser.add_argument("--prewarm", action="store_true", default=prewarm_enabled(),
+                        help="상주 서버 모드 시작 때 자막 API/캐시를 미리 불러오기 (YT_PREWARM=1)")
+    parser.add_argument("--workers", type=int,
+                        default=int(os.environ.get("EXTRACT_API_WORKERS", "4")),
+                        help="상주 서버 모드의 동시 처리 워커 수")
+    parser.add_argument("--batch", metavar="FILE",
+                        help="한 줄에 URL 하나씩 적힌 파일('-'이면 stdin)을 배치 처리")
+    parser.add_argument("--normalize", metavar="FILE",
+                        help="URL이 한 줄에 하나씩 적힌 파일('-'이면 stdin)을 중복 없는 비디오 ID 목록으로 정리")
+    parser.add_argument("--bare-ids", action="store_true",
+                        help="--normalize 에서 주소 없이 비디오 ID만 적은 줄도 받기")
+    parser.add_argument("--crawl", metavar="FILE",
+                        help="채널/재생목록 URL이 한 줄에 하나씩 적힌 파일('-'이면 stdin)의 새 영상 자막을 보관소에 저장")
+    parser.add_argument("--max-new", type=int,
+                        help="크롤러 모드에서 소스마다 한 번에 가져올 최근 영상 수 (처음 추적할 때 예전 영상 건너뛰기)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="배치/크롤러 모드 동시 추출 수")
+    parser.add_argument("--stream", action="store_true",
+                        help="비디오 정보와 자막 조각을 줄 단위 JSON 이벤트로 바로바로 출력")
+    parser.add_argument("--languages",
+                        help="자막 언어 우선순위 (예: ko,en:auto / ':manual' ':auto'로 종류 지정)")
+    parser.add_argument("--format", choices=sorted(FORMATS), default=DEFAULT_FORMAT,
+                        help="출력 형식 (응답의 text 필드)")
+    parser.add_argument("--raw", action="store_true",
+                        help="JSON 대신 선택한 형식 그대로 출력 (예: --format srt --raw > video.srt)")
+    parser.add_argument("--start", help="이 시각부터 시작하는 자막만 (초 또는 MM:SS, HH:MM:SS)")
+    parser.add_argument("--end", help="이 시각 전에 시작하는 자막만 (초 또는 MM:SS, HH:MM:SS)")
+    parser.add_argument("--max-chars", type=int, help="자막 원문 최대 글자 수 (넘으면 info.range.next_start 부터 이어 받기)")
+    parser.add_argument("--timings", action="store_true",
+                        help="응답 info.timings 에 단계별 소요 시간(ms) 포함")
+    parser.add_argument("--archive", metavar="PATH",
+                        help="가져온 자막을 저장하고 검색할 보관소 SQLite 파일 (기본: YT_ARCHIVE_PATH)")
+    parser.add_argument("--search", metavar="QUERY",
+                        help="보관소에서 자막 전문 검색 (영상과 일치한 시각(ms)을 출력)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT,
+                        help="검색 결과 최대 영상 수")
+    args = parser.parse_args()
+
+    if args.archive:
+        os.environ["YT_ARCHIVE_PATH"] = args.archive
+
+    if args.search is not None:
+        response = search_response(args.search, args.limit)
+        print(encode_response(response))
+        sys.exit(0 if response["success"] else 1)
+
+    if args.serve:
+        if args.prewarm:
+            start_prewarm()
+        serve(workers=max(1, args.workers))
+        return
+
+    if args.normalize:
+        run_normalize(args.normalize, allow_bare_id=args.bare_ids)
+        return
+
+    if args.crawl:
+        run_crawl(args.crawl, args.concurrency, args.languages, args.max_new)
+        return
+
+    if args.batch:
+        run_batch(args.batch, args.concurrency, args.languages, args.format)
+        return
+
+    if not args.url:
         print(json.dumps({
             "success": False,
             "error": "URL 매개변수가 필요합니다"
         }))
         sys.exit(1)
     
-    url = sys.argv[1]
-    
     try:
-        # 추출기 생성
-        extractor = YouTubeTextExtractor()
-        
-        # 자막 추출 시도
-        result = extractor.process_youtube_url(url)
-        
-        if result and extractor.formatted_text:
-            # 성공적으로 추출됨
-            response = {
-                "success": True,
-                "text": extractor.formatted_text,
-                "info": {
-                    "title": extractor.video_info.get('title', '제목 없음'),
-                    "channel": extractor.video_info.get('channel', '채널 없음'),
-                    "duration": extractor.video_info.get('duration', 0),
-                    "subtitle_count": len(extractor.transcript_data)
-                }
-            }
-        else:
-            # 추출 실패
-            error_msg = extractor.error_details if extractor.error_details else "자막을 추출할 수 없습니다"
-            
-            # 구체적인 에러 메시지 제공
-            if "Video unavailable" in error_msg:
-                error_msg = "비디오를 사용할 수 없습니다. 삭제되었거나 비공개일 수 있습니다."
-            elif "Private video" in error_msg:
-                error_msg = "비공개 비디오입니다."
-            elif "Could not retrieve a transcript" in error_msg:
-                if "Subtitles are disabled" in error_msg:
-                    error_msg = "이 비디오는 자막이 비활성화되어 있습니다."
-                elif "No transcripts found" in error_msg:
-                    error_msg = "이 비디오에는 자막이 없습니다."
-                else:
-                    error_msg = "자막을 가져올 수 없습니다. 비디오가 제한되어 있을 수 있습니다."
-            elif "Connection" in error_msg or "Network" in error_msg:
-                error_msg = "네트워크 연결 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
-            
-            response = {
-                "success": False,
-                "error": error_msg
-            }
-            
-    except Exception as e:
-        error_msg = str(e)
-        
-        # 구체적인 에러 메시지 제공
-        if "Video unavailable" in error_msg:
-            error_msg = "비디오를 사용할 수 없습니다. 삭제되었거나 비공개일 수 있습니다."
-        elif "Private video" in error_msg:
-            error_msg = "비공개 비디오입니다."
-        elif "Could not retrieve a transcript" in error_msg:
-            if "Subtitles are disabled" in error_msg:
-                error_msg = "이 비디오는 자막이 비활성화되어 있습니다."
-            elif "No transcripts found" in error_msg:
-                error_msg = "이 비디오에는 자막이 없습니다."
-            else:
-                error_msg = "자막을 가져올 수 없습니다. 비디오가 제한되어 있을 수 있습니다."
-        elif "Connection" in error_msg or "Network" in error_msg:
-            error_msg = "네트워크 연결 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
-        else:
-            error_msg = f"오류가 발생했습니다: {error_msg}"
-        
-        response = {
-            "success": False,
-            "error": error_msg
-        }
+        selection = parse_range({"start": args.start, "end": args.end, "max_chars": args.max_chars})
+    except ValueError as e:
+        print(encode_response({"success": False, "error": str(e)}))
+        sys.exit(1)
     
-    # JSON 응답 출력
-    try:
-        json_output = json.dumps(response, ensure_ascii=False, indent=None, separators=(',', ':'))
-        print(json_output)
-        sys.stdout.flush()
-    except Exception as e:
-        # 백업 응답
-        backup_response = {"success": False, "error": "JSON encoding error"}
-        print(json.dumps(backup_response))
+    if args.raw:
+        extractor = YouTubeTextExtractor(languages=args.languages, output_format=args.format)
+        if not extractor.process_youtube_url(args.url, **selection):
+            print(encode_response(extractor_response(extractor, False)))
+            sys.exit(1)
+        for piece in extractor.iter_render():
+            sys.stdout.write(piece)
         sys.stdout.flush()
+        return
+    
+    if args.stream:
+        extractor = YouTubeTextExtractor(languages=args.languages, output_format=args.format)
+        for event in iter_extraction_events(extractor, args.url, timings=args.timings, **selection):
+            print(encode_response(event))
+            sys.stdout.flush()
+        return
+    
+    # JSON 응답 출력
+    print(encode_response(build_response(args.url, args.languages, args.format, args.timings, **selection)))
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
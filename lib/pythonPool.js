@@ -0,0 +1,196 @@
+import { spawn } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+
+// 풀 설정 (환경 변수로 조정 가능)
+const PYTHON_BIN = process.env.PYTHON_BIN || 'python';
+const POOL_SIZE = parseInt(process.env.PYTHON_POOL_SIZE || '2', 10);
+const WORKERS_PER_PROCESS = parseInt(process.env.PYTHON_POOL_WORKERS || '4', 10);
+const MAX_QUEUE = parseInt(process.env.PYTHON_POOL_MAX_QUEUE || '32', 10);
+
+export class PoolBusyError extends Error {
+  constructor() {
+    super('모든 Python 워커가 사용 중입니다');
+    this.name = 'PoolBusyError';
+  }
+}
+
+export class PoolTimeoutError extends Error {
+  constructor() {
+    super('요청 시간이 초과되었습니다');
+    this.name = 'PoolTimeoutError';
+  }
+}
+
+// extract_api.py --serve 프로세스 하나를 감싸는 워커
+class PythonWorker {
+  constructor(script, workers, onIdle) {
+    this.script = script;
+    this.capacity = workers;
+    this.onIdle = onIdle;
+    this.pending = new Map();
+    this.nextId = 0;
+    this.start();
+  }
+
+  start() {
+    this.ready = false;
+    this.alive = true;
+    this.process = spawn(PYTHON_BIN, [this.script, '--serve', '--workers', String(this.capacity)]);
+
+    const lines = readline.createInterface({ input: this.process.stdout });
+    lines.on('line', (line) => this.handleLine(line));
+
+    this.process.stderr.on('data', (data) => {
+      console.error('Python 워커 오류:', data.toString());
+    });
+
+    this.process.on('error', (error) => {
+      console.error('Python 워커 실행 오류:', error);
+    });
+
+    this.process.stdin.on('error', (error) => {
+      console.error('Python 워커 입력 오류:', error);
+    });
+
+    this.process.on('close', (code) => {
+      this.alive = false;
+      console.error(`Python 워커 종료 (code ${code}), 재시작합니다`);
+      const pending = Array.from(this.pending.values());
+      this.pending.clear();
+      pending.forEach((entry) => {
+        clearTimeout(entry.timer);
+        if (!entry.timedOut) entry.reject(new Error('Python 워커가 비정상 종료되었습니다'));
+      });
+      // 연속 크래시로 인한 재시작 폭주 방지
+      setTimeout(() => {
+        this.start();
+        this.onIdle();
+      }, 1000);
+    });
+  }
+
+  // 타임아웃된 요청도 Python 이 답할 때까지는 실제로 처리 중이므로 자리를 차지한다
+  get load() {
+    return this.pending.size;
+  }
+
+  get available() {
+    return this.alive && this.ready && this.pending.size < this.capacity;
+  }
+
+  handleLine(line) {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch (parseError) {
+      console.error('JSON 파싱 오류:', parseError, line);
+      return;
+    }
+
+    if (message.ready) {
+      this.ready = true;
+      this.onIdle();
+      return;
+    }
+
+    const { id } = message;
+    const entry = this.pending.get(id);
+    if (!entry) return;
+
+    delete message.id;
+
+    // 스트리밍 요청: done/error 이벤트가 올 때까지 중간 이벤트 전달
+    if (entry.onEvent && message.type && message.type !== 'done' && message.type !== 'error') {
+      if (!entry.timedOut) entry.onEvent(message);
+      return;
+    }
+
+    // 마지막 응답이 와야 자리를 비운다 (타임아웃된 요청은 호출자에게 이미 실패를 알렸다)
+    this.pending.delete(id);
+    clearTimeout(entry.timer);
+    if (!entry.timedOut) {
+      if (entry.onEvent) entry.onEvent(message);
+      entry.resolve(message);
+    }
+    this.onIdle();
+  }
+
+  send(payload, timeoutMs, onEvent) {
+    const id = String(this.nextId++);
+
+    return new Promise((resolve, reject) => {
+      const entry = { resolve, reject, onEvent, timedOut: false };
+      entry.timer = setTimeout(() => {
+        // 호출자에게는 바로 실패를 알리지만, Python 이 아직 처리 중이므로 응답이 올 때까지 자리는 남겨 둔다
+        entry.timedOut = true;
+        reject(new PoolTimeoutError());
+      }, timeoutMs);
+
+      this.pending.set(id, entry);
+      this.process.stdin.write(JSON.stringify({ ...payload, id }) + '\n');
+    });
+  }
+}
+
+// 여러 워커 프로세스와 대기열을 관리하는 풀
+class PythonPool {
+  constructor(script, size, workersPerProcess, maxQueue) {
+    this.queue = [];
+    this.maxQueue = maxQueue;
+    this.workers = Array.from({ length: size }, () =>
+      new PythonWorker(script, workersPerProcess, () => this.drain())
+    );
+  }
+
+  pickWorker() {
+    let best = null;
+    for (const worker of this.workers) {
+      if (worker.available && (!best || worker.load < best.load)) {
+        best = worker;
+      }
+    }
+    return best;
+  }
+
+  drain() {
+    while (this.queue.length > 0) {
+      const worker = this.pickWorker();
+      if (!worker) return;
+      const job = this.queue.shift();
+      clearTimeout(job.timer);
+      worker.send(job.payload, job.deadline - Date.now(), job.onEvent).then(job.resolve, job.reject);
+    }
+  }
+
+  // onEvent 를 넘기면 스트리밍 요청의 중간 이벤트(info/chunk)를 받을 수 있다
+  run(payload, timeoutMs = 60000, onEvent = null) {
+    const worker = this.pickWorker();
+    if (worker) {
+      return worker.send(payload, timeoutMs, onEvent);
+    }
+
+    // 백프레셔: 대기열이 가득 차면 즉시 거절
+    if (this.queue.length >= this.maxQueue) {
+      return Promise.reject(new PoolBusyError());
+    }
+
+    return new Promise((resolve, reject) => {
+      const job = { payload, resolve, reject, onEvent, deadline: Date.now() + timeoutMs };
+      job.timer = setTimeout(() => {
+        this.queue = this.queue.filter((queued) => queued !== job);
+        reject(new PoolTimeoutError());
+      }, timeoutMs);
+      this.queue.push(job);
+    });
+  }
+}
+
+// Next.js 개발 모드의 핫 리로드에서도 프로세스를 재사용하도록 전역에 보관
+export function getPythonPool() {
+  if (!globalThis.__pythonPool) {
+    const script = path.join(process.cwd(), 'extract_api.py');
+    globalThis.__pythonPool = new PythonPool(script, POOL_SIZE, WORKERS_PER_PROCESS, MAX_QUEUE);
+  }
+  return globalThis.__pythonPool;
+}
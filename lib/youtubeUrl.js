@@ -0,0 +1,18 @@
+// 유튜브 URL 인식 (youtube_core/urls.py 와 같은 주소 모양)
+// watch?v=(추적 파라미터 포함), youtu.be/, shorts/, embed/, live/, v/, e/, youtube-nocookie.com,
+// www./m./music. 하위 도메인 - 비디오 ID 는 정확히 11자
+// 호스트는 입력 시작, '//', 공백 바로 뒤에만 (다른 주소의 경로/파라미터 안에 든 유튜브 주소는 거절)
+// 주소 없이 ID 만 적은 입력은 allowBareId 를 줄 때만 받는다
+
+export const VIDEO_ID_PATTERN = /^[A-Za-z0-9_-]{11}$/;
+
+const URL_PATTERN =
+  /(?:^|\/\/|\s)(?:(?:www|m|music)\.)?youtu(?:be(?:-nocookie)?\.com\/(?:watch\/?\?(?:[^#\s]*?&)??v=|(?:shorts|embed|live|v|e)\/)|\.be\/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])/i;
+const BARE_ID_PATTERN = /^[\s'"]*([A-Za-z0-9_-]{11})[\s'"]*$/;
+
+// URL 에서 11자 비디오 ID 추출 (없으면 null)
+export function parseVideoId(text, { allowBareId = false } = {}) {
+  if (!text) return null;
+  const match = URL_PATTERN.exec(text) || (allowBareId && BARE_ID_PATTERN.exec(text));
+  return match ? match[1] : null;
+}
@@ -1,96 +1,164 @@
-import { spawn } from 'child_process';
-import path from 'path';
+import { getPythonPool, PoolBusyError, PoolTimeoutError } from '../../lib/pythonPool';
+import { VIDEO_ID_PATTERN, parseVideoId } from '../../lib/youtubeUrl';
+
+// GET 응답 캐시 시간(초): 브라우저 / CDN
+const HTTP_MAX_AGE = parseInt(process.env.YT_HTTP_MAX_AGE || '3600', 10);
+const HTTP_SHARED_MAX_AGE = parseInt(process.env.YT_HTTP_SHARED_MAX_AGE || '86400', 10);
 
 export default async function handler(req, res) {
+  // 캐시 가능한 추출: GET /api/extract?v=VIDEO_ID&format=srt&languages=ko,en&start=10:00&end=25:00
+  if (req.method === 'GET' && req.query.v) {
+    return handleGet(req, res);
+  }
+
   if (req.method !== 'POST') {
     return res.status(405).json({ error: 'Method not allowed' });
   }
 
-  const { url } = req.body;
+  const { url, urls, concurrency, languages, stream, format, start, end, max_chars, timings } = req.body;
+  // 자막 일부만 받기 (초 또는 'MM:SS', 원문 최대 글자 수)
+  const range = { start, end, max_chars };
+
+  // 배치 요청: 여러 URL을 한 번에 처리
+  if (Array.isArray(urls) && urls.length > 0) {
+    return handleBatch(res, urls, concurrency, languages, format);
+  }
 
   if (!url) {
     return res.status(400).json({ error: 'URL is required' });
   }
 
   // 유튜브 URL 유효성 검사
-  const urlPattern = /(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/live\/)([^&\n?#]+)/;
-  if (!urlPattern.test(url)) {
+  if (!parseVideoId(url)) {
     return res.status(400).json({ error: '올바른 유튜브 URL을 입력해주세요' });
   }
 
+  // 스트리밍 요청: 비디오 정보와 자막 조각을 NDJSON으로 바로바로 전달
+  if (stream) {
+    return handleStream(res, url, languages, format, range, timings);
+  }
+
   try {
-    // Python 스크립트 실행
-    const pythonScript = path.join(process.cwd(), 'extract_api.py');
-    
-    const pythonProcess = spawn('python', [pythonScript, url]);
-    
-    let stdout = '';
-    let stderr = '';
-
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
+    // 상주 Python 워커 풀에 요청 전달 (60초 타임아웃)
+    // timings: true 면 info.timings 에 단계별 소요 시간(ms)
+    const result = await getPythonPool().run({ url, languages, format, ...range, timings }, 60000);
 
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
+    if (result.success) {
+      return res.status(200).json({
+        success: true,
+        text: result.text,
+        format: result.format || 'text',
+        info: result.info
+      });
+    } else {
+      return res.status(400).json({
+        success: false,
+        error: result.error || '자막을 추출할 수 없습니다'
+      });
+    }
 
-    pythonProcess.on('close', (code) => {
-      clearTimeout(timeout); // 타임아웃 클리어
-      if (res.headersSent) return; // 이미 응답이 전송된 경우 중복 방지
-      
-      if (code === 0) {
-        try {
-          console.log('Python 출력:', stdout);
-          const result = JSON.parse(stdout);
-          
-          if (result.success) {
-            return res.status(200).json({
-              success: true,
-              text: result.text,
-              info: result.info
-            });
-          } else {
-            return res.status(400).json({
-              success: false,
-              error: result.error || '자막을 추출할 수 없습니다'
-            });
-          }
-        } catch (parseError) {
-          console.error('JSON 파싱 오류:', parseError);
-          console.error('원본 출력:', stdout);
-          return res.status(500).json({
-            success: false,
-            error: '서버에서 응답을 처리하는 중 오류가 발생했습니다'
-          });
-        }
-      } else {
-        console.error('Python 스크립트 오류:', stderr);
-        return res.status(500).json({
-          success: false,
-          error: 'Python 스크립트 실행 중 오류가 발생했습니다'
-        });
-      }
-    });
+  } catch (error) {
+    return sendPoolError(res, error);
+  }
+}
 
-    // 타임아웃 설정 (60초)
-    const timeout = setTimeout(() => {
-      if (!res.headersSent) {
-        pythonProcess.kill();
-        return res.status(408).json({
-          success: false,
-          error: '요청 시간이 초과되었습니다. 짧은 영상으로 다시 시도해주세요.'
-        });
-      }
+async function handleStream(res, url, languages, format, range, timings) {
+  const writeEvent = (event) => {
+    if (!res.headersSent) {
+      res.writeHead(200, {
+        'Content-Type': 'application/x-ndjson; charset=utf-8',
+        'Cache-Control': 'no-cache'
+      });
+    }
+    res.write(JSON.stringify(event) + '\n');
+  };
+
+  try {
+    await getPythonPool().run({ url, languages, format, ...range, timings, stream: true }, 60000, writeEvent);
+    return res.end();
+  } catch (error) {
+    // 첫 이벤트 전에 실패하면 일반 에러 응답
+    if (!res.headersSent) {
+      return sendPoolError(res, error);
+    }
+    console.error('스트리밍 오류:', error);
+    writeEvent({ type: 'error', error: '자막 전송 중 오류가 발생했습니다' });
+    return res.end();
+  }
+}
+
+// 같은 비디오/옵션이면 본문이 같으므로 ETag 로 304 를, Cache-Control 로 CDN 캐시를 쓸 수 있다
+// (압축은 Next.js 서버/Vercel 이 Accept-Encoding 에 맞춰 처리)
+// ETag 는 Python(youtube_core/http_cache.py)이 캐시된 자막으로 만든다 - If-None-Match 가 맞으면 추출 없이 not_modified
+async function handleGet(req, res) {
+  const { v, languages, format, start, end, max_chars } = req.query;
+  if (!VIDEO_ID_PATTERN.test(v)) {
+    res.setHeader('Cache-Control', 'no-store');
+    return res.status(400).json({ success: false, error: '올바른 비디오 ID가 아닙니다' });
+  }
+
+  let result;
+  try {
+    result = await getPythonPool().run({
+      url: `https://www.youtube.com/watch?v=${v}`, languages, format, start, end, max_chars,
+      etag: true, if_none_match: req.headers['if-none-match'] || null,
     }, 60000);
+  } catch (error) {
+    return sendPoolError(res, error);
+  }
 
+  if (!result.success) {
+    res.setHeader('Cache-Control', 'no-store');
+    return res.status(400).json({ success: false, error: result.error || '자막을 추출할 수 없습니다' });
+  }
 
+  res.setHeader('ETag', result.etag);
+  res.setHeader('Cache-Control',
+    `public, max-age=${HTTP_MAX_AGE}, s-maxage=${HTTP_SHARED_MAX_AGE}, stale-while-revalidate=${HTTP_SHARED_MAX_AGE}`);
+  if (result.not_modified) {
+    return res.status(304).end();
+  }
+  // 요청마다 달라지는 소요 시간/왕복 횟수는 Python 이 이미 뺐다
+  const body = JSON.stringify({ success: true, text: result.text, format: result.format || 'text', info: result.info });
+  res.setHeader('Content-Type', 'application/json; charset=utf-8');
+  return res.status(200).send(body);
+}
+
+const MAX_BATCH_URLS = 500;
+
+async function handleBatch(res, urls, concurrency, languages, format) {
+  if (urls.length > MAX_BATCH_URLS) {
+    return res.status(400).json({ error: `한 번에 최대 ${MAX_BATCH_URLS}개 URL까지 처리할 수 있습니다` });
+  }
 
+  try {
+    // 배치는 단건보다 오래 걸리므로 타임아웃을 길게 둔다
+    const result = await getPythonPool().run({ urls, concurrency, languages, format }, 300000);
+    return res.status(200).json(result);
   } catch (error) {
-    console.error('API 오류:', error);
-    res.status(500).json({
+    return sendPoolError(res, error);
+  }
+}
+
+function sendPoolError(res, error) {
+  if (error instanceof PoolBusyError) {
+    res.setHeader('Retry-After', '5');
+    return res.status(503).json({
+      success: false,
+      error: '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.'
+    });
+  }
+
+  if (error instanceof PoolTimeoutError) {
+    return res.status(408).json({
       success: false,
-      error: '서버 오류가 발생했습니다'
+      error: '요청 시간이 초과되었습니다. 짧은 영상으로 다시 시도해주세요.'
     });
   }
-} 
\ No newline at end of file
+
+  console.error('API 오류:', error);
+  return res.status(500).json({
+    success: false,
+    error: 'Python 스크립트 실행 중 오류가 발생했습니다'
+  });
+}
@@ -1,6 +1,27 @@
 import { useState } from 'react';
-import axios from 'axios';
 import styles from '../styles/Home.module.css';
+import { parseVideoId } from '../lib/youtubeUrl';
+
+// NDJSON 스트림을 한 줄씩 읽어서 이벤트 콜백 호출
+async function readEvents(body, onEvent) {
+  const reader = body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.filter((line) => line.trim()).forEach((line) => onEvent(JSON.parse(line)));
+  }
+
+  if (buffer.trim()) {
+    onEvent(JSON.parse(buffer));
+  }
+}
 
 export default function Home() {
   const [url, setUrl] = useState('');
@@ -10,10 +31,7 @@ export default function Home() {
   const [videoInfo, setVideoInfo] = useState(null);
 
   // 유튜브 URL 유효성 검사
-  const isValidYouTubeUrl = (url) => {
-    const pattern = /(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/live\/)([^&\n?#]+)/;
-    return pattern.test(url);
-  };
+  const isValidYouTubeUrl = (url) => parseVideoId(url) !== null;
 
   // 자막 추출 함수
   const extractSubtitles = async () => {
@@ -33,14 +51,29 @@ export default function Home() {
     setVideoInfo(null);
 
     try {
-      const response = await axios.post('/api/extract', { url });
-      
-      if (response.data.success) {
-        setSubtitles(response.data.text);
-        setVideoInfo(response.data.info);
-      } else {
-        setError(response.data.error || '자막을 추출할 수 없습니다');
+      // 스트리밍 모드: 비디오 정보가 먼저 오고 자막은 조각 단위로 이어 붙인다
+      const response = await fetch('/api/extract', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ url, stream: true })
+      });
+
+      const contentType = response.headers.get('content-type') || '';
+      if (!contentType.includes('application/x-ndjson')) {
+        const data = await response.json();
+        setError(data.error || '자막을 추출할 수 없습니다');
+        return;
       }
+
+      await readEvents(response.body, (event) => {
+        if (event.type === 'info') {
+          setVideoInfo(event.info);
+        } else if (event.type === 'chunk') {
+          setSubtitles((previous) => previous + event.text);
+        } else if (event.type === 'error') {
+          setError(event.error || '자막을 추출할 수 없습니다');
+        }
+      });
     } catch (err) {
       setError('서버 오류가 발생했습니다. 잠시 후 다시 시도해주세요.');
       console.error('Error:', err);
@@ -1,11 +1,19 @@
 import streamlit as st
 import sys
 import os
+import time
 
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
 from youtube_text_extractor import YouTubeTextExtractor
+from youtube_core.jobs import FAILED, QUEUED, RUNNING, JobQueue
+from youtube_core.prewarm import prewarm_enabled, start_prewarm
+
+# 동시에 추출할 영상 수
+JOB_WORKERS = int(os.environ.get('YT_JOB_WORKERS', '4'))
+# 진행 중인 작업 상태를 다시 확인하는 간격(초)
+POLL_INTERVAL = 1.0
 
 # 페이지 설정
 st.set_page_config(
@@ -75,108 +83,120 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_job_queue():
+    """모든 세션이 함께 쓰는 백그라운드 작업 대기열 (같은 영상은 한 번만 가져온다)"""
+    if prewarm_enabled():
+        start_prewarm()
+    return JobQueue(YouTubeTextExtractor, max_workers=JOB_WORKERS)
+
+
+def parse_urls(text):
+    """입력창의 URL 목록 (한 줄에 하나, 중복 제거)"""
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and line not in urls:
+            urls.append(line)
+    return urls
+
+
+def render_job(job):
+    """작업 하나의 진행 상태와 결과 표시"""
+    if job.status == QUEUED:
+        st.info(f"⏳ 대기 중: {job.url}")
+        return
+    if job.status == RUNNING:
+        st.info(f"🔄 추출 중 ({job.elapsed():.0f}초): {job.url}")
+        return
+
+    result = job.result
+    if job.status == FAILED:
+        st.markdown('<div class="error-box">', unsafe_allow_html=True)
+        st.error(f"❌ 자막을 추출할 수 없습니다: {job.url}")
+        st.write(f"**세부 오류:** {result.get('error', '알 수 없는 오류')}")
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+
+    info = result['info']
+    with st.expander(f"✅ {info.get('title', '제목 없음')}", expanded=True):
+        # 비디오 정보
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**📺 제목:** {info.get('title', '제목 없음')}")
+            st.write(f"**👤 채널:** {info.get('channel', '채널 없음')}")
+        with col2:
+            duration = info.get('duration', 0)
+            if duration:
+                minutes = duration // 60
+                seconds = duration % 60
+                st.write(f"**⏱️ 길이:** {minutes}분 {seconds}초")
+            st.write(f"**📝 자막 수:** {info.get('subtitle_count', 0)}개")
+
+        # 텍스트 영역에 결과 표시
+        st.text_area(
+            "결과 (Ctrl+A로 전체 선택 후 Ctrl+C로 복사)",
+            value=result['text'],
+            height=400,
+            help="텍스트를 선택하여 복사할 수 있습니다",
+            key=f"text-{job.job_id}"
+        )
+
+        # 다운로드 버튼
+        st.download_button(
+            label="💾 텍스트 파일로 다운로드",
+            data=result['text'],
+            file_name=f"{info.get('title', 'youtube_text')}.txt",
+            mime="text/plain",
+            key=f"download-{job.job_id}"
+        )
+
+
 def main():
     # 헤더
     st.markdown('<h1 class="main-header">📺 YT 텍스트 추출기</h1>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">📝 유튜브 영상의 자막을 텍스트로 쉽게 변환하세요</p>', unsafe_allow_html=True)
     
-    # URL 입력
-    url = st.text_input(
+    # URL 입력 (여러 개는 한 줄에 하나씩)
+    text = st.text_area(
         "🔗 유튜브 URL을 입력하세요",
         placeholder="https://www.youtube.com/watch?v=...",
-        help="유튜브 동영상 URL을 붙여넣으세요"
+        help="유튜브 동영상 URL을 붙여넣으세요. 여러 개는 한 줄에 하나씩 입력합니다",
+        height=100
     )
     
-    # 추출 버튼
+    queue = get_job_queue()
+    
+    # 추출 버튼 - 작업만 등록하고 바로 돌아온다 (추출은 백그라운드에서 진행)
     if st.button("📄 자막 추출", type="primary"):
-        if not url:
+        urls = parse_urls(text)
+        if not urls:
             st.error("⚠️ 유튜브 URL을 입력해주세요!")
             return
         
-        # URL 유효성 검사
-        if not any(domain in url.lower() for domain in ['youtube.com', 'youtu.be']):
-            st.error("⚠️ 올바른 유튜브 URL을 입력해주세요!")
-            return
-        
-        # 진행 상태 표시
-        with st.spinner('🔄 영상 정보를 가져오는 중...'):
-            try:
-                # 텍스트 추출 실행
-                extractor = YouTubeTextExtractor()
-                
-                success = extractor.process_youtube_url(url)
-                
-                if success and extractor.formatted_text:
-                    # 성공 - 비디오 정보 표시
-                    st.markdown('<div class="success-box">', unsafe_allow_html=True)
-                    st.success("✅ 자막 추출 완료!")
-                    
-                    # 비디오 정보
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**📺 제목:** {extractor.video_info.get('title', '제목 없음')}")
-                        st.write(f"**👤 채널:** {extractor.video_info.get('channel', '채널 없음')}")
-                    with col2:
-                        duration = extractor.video_info.get('duration', 0)
-                        if duration:
-                            minutes = duration // 60
-                            seconds = duration % 60
-                            st.write(f"**⏱️ 길이:** {minutes}분 {seconds}초")
-                        st.write(f"**📝 자막 수:** {len(extractor.transcript_data)}개")
-                    
-                    st.markdown('</div>', unsafe_allow_html=True)
-                    
-                    # 텍스트 결과
-                    st.subheader("📋 추출된 텍스트")
-                    
-                    # 텍스트 영역에 결과 표시
-                    st.text_area(
-                        "결과 (Ctrl+A로 전체 선택 후 Ctrl+C로 복사)",
-                        value=extractor.formatted_text,
-                        height=400,
-                        help="텍스트를 선택하여 복사할 수 있습니다"
-                    )
-                    
-                    # 다운로드 버튼
-                    st.download_button(
-                        label="💾 텍스트 파일로 다운로드",
-                        data=extractor.formatted_text,
-                        file_name=f"{extractor.video_info.get('title', 'youtube_text')}.txt",
-                        mime="text/plain"
-                    )
-                    
-                else:
-                    # 실패
-                    st.markdown('<div class="error-box">', unsafe_allow_html=True)
-                    st.error("❌ 자막을 추출할 수 없습니다")
-                    
-                    error_reasons = [
-                        "🔒 비디오가 비공개이거나 삭제되었을 수 있습니다",
-                        "🚫 자막이 비활성화되어 있을 수 있습니다", 
-                        "🌐 네트워크 연결 문제일 수 있습니다",
-                        "⏱️ 영상이 너무 길거나 처리할 수 없는 형식일 수 있습니다"
-                    ]
-                    
-                    st.write("**가능한 원인:**")
-                    for reason in error_reasons:
-                        st.write(f"• {reason}")
-                    
-                    # 에러 세부정보가 있으면 표시
-                    if hasattr(extractor, 'error_details') and extractor.error_details:
-                        st.write(f"**세부 오류:** {extractor.error_details}")
-                    
-                    st.markdown('</div>', unsafe_allow_html=True)
-                    
-            except Exception as e:
-                st.markdown('<div class="error-box">', unsafe_allow_html=True)
-                st.error(f"❌ 오류가 발생했습니다: {str(e)}")
-                st.markdown('</div>', unsafe_allow_html=True)
+        job_ids = []
+        for url, job in queue.submit_many(urls):
+            if job is None:
+                st.error(f"⚠️ 올바른 유튜브 URL이 아닙니다: {url}")
+            elif job.job_id not in job_ids:
+                job_ids.append(job.job_id)
+        st.session_state['job_ids'] = job_ids
+    
+    # 이번 세션의 작업 상태 표시 (다시 실행될 때마다 작업 ID로 조회)
+    jobs = [queue.get(job_id) for job_id in st.session_state.get('job_ids', [])]
+    jobs = [job for job in jobs if job is not None]
+    if jobs:
+        finished = sum(1 for job in jobs if job.finished)
+        st.progress(finished / len(jobs), text=f"{finished}/{len(jobs)}개 완료")
+        st.subheader("📋 추출된 텍스트")
+        for job in jobs:
+            render_job(job)
     
     # 사용 가이드
     with st.expander("📖 사용 가이드", expanded=False):
         st.markdown("""
         ### 📝 사용 방법
-        1. **유튜브 URL 입력**: 텍스트를 추출할 영상의 URL을 붙여넣으세요
+        1. **유튜브 URL 입력**: 텍스트를 추출할 영상의 URL을 붙여넣으세요 (여러 개는 한 줄에 하나씩)
         2. **자막 추출**: 버튼을 클릭하여 텍스트를 추출하세요
         3. **결과 복사**: 추출된 텍스트를 복사하거나 파일로 다운로드하세요
         
@@ -194,6 +214,11 @@ def main():
         테스트해보고 싶다면 이 URL을 사용해보세요:
         `https://www.youtube.com/watch?v=dQw4w9WgXcQ`
         """)
+    
+    # 진행 중인 작업이 있으면 잠시 뒤 다시 그려서 상태를 갱신
+    if any(not job.finished for job in jobs):
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+자막 보관소(youtube_core.archive) 테스트 스크립트
+
+임시 디렉터리의 SQLite 파일과 로컬 가짜 자막 서버(youtube_core.fake_server)로 네트워크 없이 실행된다.
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+
+from youtube_core.aio import AsyncHttpTranscriptBackend
+from youtube_core.archive import TranscriptArchive
+from youtube_core.backends import Track
+from youtube_core.fake_server import FakeTranscriptBackend, FakeTranscriptServer, make_entries, make_track
+from youtube_core.resolver import DEFAULT_PRIORITIES, fetch_transcript, fetch_transcript_async, parse_priorities
+
+
+TRANSCRIPTS = {
+    'koVideo0001': [
+        make_track('en', make_entries(3, 'hello')),
+        make_track('ko', make_entries(3, '안녕하세요'), is_generated=True),
+        make_track('ko', make_entries(3, '수동 자막')),
+    ],
+}
+
+
+def test_archive():
+    print("🧪 자막 보관소 테스트 중...")
+
+    async def run(archive):
+        priorities = parse_priorities(DEFAULT_PRIORITIES)
+        with FakeTranscriptServer(TRANSCRIPTS) as server:
+            backend = AsyncHttpTranscriptBackend(server.url)
+            try:
+                result = await fetch_transcript_async(backend, 'koVideo0001', priorities, archive=archive)
+                assert result.round_trips == 2
+            finally:
+                await backend.close()
+
+        # 서버가 없어도 보관소에서 바로 돌려준다
+        backend = AsyncHttpTranscriptBackend(server.url)
+        try:
+            result = await fetch_transcript_async(backend, 'koVideo0001', priorities, archive=archive)
+            assert result.round_trips == 0
+            assert [entry['text'] for entry in result.entries] == ['수동 자막 0', '수동 자막 1', '수동 자막 2']
+        finally:
+            await backend.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = TranscriptArchive(os.path.join(directory, 'archive.db'))
+        try:
+            asyncio.run(run(archive))
+
+            results = archive.search('수동')
+            assert [result['video_id'] for result in results] == ['koVideo0001']
+            assert [match['text'] for match in results[0]['matches']] == ['수동 자막 0', '수동 자막 1', '수동 자막 2']
+            assert archive.search('bonjour') == []
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+def test_search_ranks_all_matches():
+    print("🧪 보관소 검색 순위 테스트 중...")
+    track = Track('ko', '한국어')
+    with tempfile.TemporaryDirectory() as directory:
+        archive = TranscriptArchive(os.path.join(directory, 'archive.db'))
+        try:
+            # 먼저 보관한 영상이 가장 관련도가 높고, 나중에 보관한 영상들의 일치 문장이 훨씬 많다
+            archive.put_entries('oldVideo001', track, [{'text': '파이썬 파이썬 파이썬', 'start': 1.0, 'duration': 1.0}])
+            archive.put_info('oldVideo001', {'title': '오래된 영상'})
+            for i in range(30):
+                archive.put_entries(f'newVideo{i:03d}', track, [
+                    {'text': f'오늘 이야기 {j} 파이썬 그리고 다른 긴 문장들이 이어집니다', 'start': j, 'duration': 1.0}
+                    for j in range(50)
+                ])
+
+            results = archive.search('파이썬', limit=3, matches_per_video=2)
+            assert [result['video_id'] for result in results][0] == 'oldVideo001'
+            assert results[0]['title'] == '오래된 영상'
+            assert len(results) == 3 and all(len(result['matches']) == 2 for result in results[1:])
+            for result in results:
+                starts = [match['start_ms'] for match in result['matches']]
+                assert starts == sorted(starts)
+            assert results[0]['matches'][0]['snippet'] == '[파이썬] [파이썬] [파이썬]'
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+def test_put_entries_replaces_segments():
+    print("🧪 보관소 자막 교체 테스트 중...")
+    track = Track('ko', '한국어')
+    with tempfile.TemporaryDirectory() as directory:
+        archive = TranscriptArchive(os.path.join(directory, 'archive.db'))
+        try:
+            archive.put_entries('videoAAAAAA', track, [{'text': '첫 번째 버전', 'start': 0, 'duration': 1}])
+            archive.put_entries('videoBBBBBB', track, [{'text': '다른 영상 버전', 'start': 0, 'duration': 1}])
+            archive.put_entries('videoAAAAAA', track, [{'text': '두 번째 버전', 'start': 0, 'duration': 1},
+                                                       {'text': '추가 문장', 'start': 1, 'duration': 1}])
+
+            assert archive.search('첫') == []
+            assert [result['video_id'] for result in archive.search('두')] == ['videoAAAAAA']
+            assert {result['video_id'] for result in archive.search('버전')} == {'videoAAAAAA', 'videoBBBBBB'}
+            assert archive.get_entries('videoAAAAAA', 'ko', False)[1]['text'] == '추가 문장'
+
+            # rowid 범위를 기록하기 전에 보관한 자막도 지운다
+            archive._conn.execute('DELETE FROM segment_ranges')
+            archive.put_entries('videoBBBBBB', track, [{'text': '새 영상 문장', 'start': 0, 'duration': 1}])
+            assert [result['video_id'] for result in archive.search('버전')] == ['videoAAAAAA']
+            assert [result['video_id'] for result in archive.search('새')] == ['videoBBBBBB']
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+def test_shared_archive_writers():
+    print("🧪 여러 프로세스가 같은 보관소에 쓰는 경우 테스트 중...")
+    track = Track('ko', '한국어')
+    errors = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'archive.db')
+        # 연결을 따로 여는 보관소 = 같은 파일을 쓰는 extract_api.py 프로세스들
+        archives = [TranscriptArchive(path) for _ in range(4)]
+        try:
+            def write(number, archive):
+                try:
+                    for i in range(20):
+                        archive.put_entries(f'shared{number}{i:04d}', track,
+                                            [{'text': f'공유 문장 {j}', 'start': j, 'duration': 1} for j in range(5)])
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=write, args=(number, archive)) for number, archive in enumerate(archives)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == [], errors
+            reader = archives[0]
+            assert reader._conn.execute('SELECT COUNT(*) FROM segments').fetchone()[0] == 4 * 20 * 5
+            spans = reader._conn.execute('SELECT first_rowid, last_rowid FROM segment_ranges ORDER BY 1').fetchall()
+            # 자막마다 rowid 범위가 겹치지 않는다
+            assert all(last < following for (_, last), (following, _) in zip(spans, spans[1:]))
+        finally:
+            for archive in archives:
+                archive.close()
+    print("✅ 성공!")
+
+
+class LockedArchive(TranscriptArchive):
+    """저장할 때마다 다른 프로세스가 잠근 것처럼 실패하는 보관소"""
+
+    def put_tracks(self, video_id, tracks):
+        raise sqlite3.OperationalError('database is locked')
+
+    def put_entries(self, video_id, track, entries):
+        raise sqlite3.OperationalError('database is locked')
+
+
+def test_archive_write_failure():
+    print("🧪 보관소 저장 실패 시에도 추출 성공 테스트 중...")
+    with tempfile.TemporaryDirectory() as directory:
+        archive = LockedArchive(os.path.join(directory, 'archive.db'))
+        try:
+            result = fetch_transcript(FakeTranscriptBackend(TRANSCRIPTS), 'koVideo0001',
+                                      parse_priorities(DEFAULT_PRIORITIES), archive=archive)
+            assert result.round_trips == 2 and result.entries[0]['text'] == '수동 자막 0'
+            assert archive.get_tracks('koVideo0001') is None
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_archive()
+    test_search_ranks_all_matches()
+    test_put_entries_replaces_segments()
+    test_shared_archive_writers()
+    test_archive_write_failure()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+AsyncYouTubeTextExtractor 테스트 스크립트
+
+로컬 가짜 자막 서버(youtube_core.fake_server)를 띄워서 네트워크 없이 실행된다.
+"""
+
+import asyncio
+import threading
+
+from youtube_core.aio import AsyncConnectionPool, AsyncHttpTranscriptBackend
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptServer, make_entries, make_track
+from youtube_text_extractor import AsyncYouTubeTextExtractor
+
+
+TRANSCRIPTS = {
+    'koVideo0001': [
+        make_track('en', make_entries(3, 'hello')),
+        make_track('ko', make_entries(3, '안녕하세요'), is_generated=True),
+        make_track('ko', make_entries(3, '수동 자막')),
+    ],
+    'frVideo0001': [make_track('fr', make_entries(2, 'bonjour'))],
+    'longVideo01': [make_track('ko', make_entries(1000, '긴 방송'))],
+}
+
+# 서로 다른 영상 100개 (같은 영상 요청은 하나로 합쳐지므로 연결 재사용은 다른 영상으로 확인)
+MANY_TRANSCRIPTS = {f'video{i:06d}': [make_track('ko', make_entries(3, '자막'))] for i in range(100)}
+
+
+async def extract(backend, url):
+    extractor = AsyncYouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    success = await extractor.process_youtube_url(url)
+    return success, extractor
+
+
+def test_async_extraction():
+    print("🧪 비동기 추출 테스트 중...")
+
+    async def run():
+        with FakeTranscriptServer(TRANSCRIPTS) as server:
+            backend = AsyncHttpTranscriptBackend(server.url)
+            try:
+                success, extractor = await extract(backend, 'https://youtu.be/koVideo0001')
+                assert success, extractor.error_details
+                assert extractor.formatted_text == '수동 자막 0 수동 자막 1 수동 자막 2'
+                assert len(extractor.transcript_data) == 3
+
+                # 한국어/영어가 없으면 첫 번째 자막 사용
+                success, extractor = await extract(backend, 'https://youtu.be/frVideo0001')
+                assert success and extractor.formatted_text.startswith('bonjour 0')
+
+                success, extractor = await extract(backend, 'https://youtu.be/missing0001')
+                assert not success and 'No transcripts found' in extractor.error_details
+            finally:
+                await backend.close()
+
+    asyncio.run(run())
+    print("✅ 성공!")
+
+
+def test_concurrent_extractions_share_connections():
+    print("🧪 동시 추출 연결 재사용 테스트 중...")
+
+    async def run():
+        with FakeTranscriptServer(MANY_TRANSCRIPTS, latency=0.01) as server:
+            backend = AsyncHttpTranscriptBackend(server.url, AsyncConnectionPool(max_connections_per_host=8))
+            try:
+                results = await asyncio.gather(*[
+                    extract(backend, f'https://youtu.be/{video_id}') for video_id in MANY_TRANSCRIPTS
+                ])
+                assert all(success for success, _ in results)
+
+                # 요청 200개(목록 + 자막)를 최대 8개 연결로 처리
+                stats = backend.pool.stats()
+                print(f"📊 연결 통계: {stats}")
+                assert stats['opened'] <= 8
+                assert stats['reused'] >= 200 - 8
+            finally:
+                await backend.close()
+
+    asyncio.run(run())
+    print("✅ 성공!")
+
+
+def test_concurrent_same_video_coalesced():
+    print("🧪 같은 영상 동시 요청 합치기 테스트 중...")
+
+    async def run():
+        with FakeTranscriptServer(TRANSCRIPTS, latency=0.05) as server:
+            backend = AsyncHttpTranscriptBackend(server.url)
+            try:
+                results = await asyncio.gather(*[
+                    extract(backend, 'https://youtu.be/koVideo0001') for _ in range(50)
+                ])
+                assert all(success for success, _ in results)
+                assert all(extractor.formatted_text == '수동 자막 0 수동 자막 1 수동 자막 2' for _, extractor in results)
+
+                # 50개 요청이 목록 1회 + 자막 1회로 끝난다
+                assert server.request_count == 2
+                assert sum(extractor.round_trips for _, extractor in results) == 2
+            finally:
+                await backend.close()
+
+    asyncio.run(run())
+    print("✅ 성공!")
+
+
+def test_cancellation():
+    print("🧪 추출 취소 테스트 중...")
+
+    async def run():
+        with FakeTranscriptServer(TRANSCRIPTS, latency=1.0) as server:
+            backend = AsyncHttpTranscriptBackend(server.url)
+            try:
+                task = asyncio.create_task(extract(backend, 'https://youtu.be/koVideo0001'))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                try:
+                    await task
+                    raise AssertionError("취소되지 않았습니다")
+                except asyncio.CancelledError:
+                    pass
+
+                # 취소된 요청이 쓰던 연결은 풀로 돌아가지 않는다
+                assert backend.pool.stats()['idle'] == 0
+            finally:
+                await backend.close()
+
+    asyncio.run(run())
+    print("✅ 성공!")
+
+
+def test_pool_across_event_loops():
+    print("🧪 여러 이벤트 루프에서 연결 풀 공유 테스트 중...")
+    video_ids = list(MANY_TRANSCRIPTS)
+
+    with FakeTranscriptServer(MANY_TRANSCRIPTS) as server:
+        backend = AsyncHttpTranscriptBackend(server.url, AsyncConnectionPool(max_connections_per_host=4))
+
+        async def run(ids):
+            results = await asyncio.gather(*[extract(backend, f'https://youtu.be/{video_id}') for video_id in ids])
+            return all(success for success, _ in results)
+
+        # asyncio.run 을 여러 번: 닫힌 루프의 연결/Semaphore 를 다시 쓰지 않는다
+        assert asyncio.run(run(video_ids[:10]))
+        assert asyncio.run(run(video_ids[10:20]))
+        assert backend.pool.stats()['idle'] == 0  # 앞의 두 루프는 닫혔다
+
+        # 스레드마다 자기 루프
+        results = []
+        threads = [threading.Thread(target=lambda ids=video_ids[20 + i * 10:30 + i * 10]: results.append(
+            asyncio.run(run(ids)))) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == [True, True, True]
+        assert server.request_count == 100  # 50개 영상 × (목록 + 자막)
+    print("✅ 성공!")
+
+
+def test_time_range():
+    print("🧪 구간 추출 테스트 중...")
+
+    async def run():
+        with FakeTranscriptServer(TRANSCRIPTS) as server:
+            backend = AsyncHttpTranscriptBackend(server.url)
+            cache = TranscriptCache(MemoryTier())
+            try:
+                # 10:00 ~ 10:10 에 시작하는 항목 (2초 간격이므로 300 ~ 304번)
+                extractor = AsyncYouTubeTextExtractor(backend=backend, cache=cache)
+                assert await extractor.process_youtube_url('https://youtu.be/longVideo01', start='10:00', end=610)
+                assert extractor.formatted_text == ' '.join(f'긴 방송 {i}' for i in range(300, 305))
+                assert extractor.range_info['total_subtitles'] == 1000 and not extractor.range_info['truncated']
+
+                # 글자 수로 자르고 next_start 부터 이어 받기 (캐시된 전체 자막에서 자른다)
+                extractor = AsyncYouTubeTextExtractor(backend=backend, cache=cache)
+                assert await extractor.process_youtube_url('https://youtu.be/longVideo01', start=600, max_chars=20)
+                assert extractor.formatted_text == '긴 방송 300 긴 방송 301'
+                assert extractor.round_trips == 0
+                assert extractor.range_info['next_start'] == 604.0
+
+                extractor = AsyncYouTubeTextExtractor(backend=backend, cache=cache)
+                assert not await extractor.process_youtube_url('https://youtu.be/longVideo01', start=5000)
+                assert extractor.error_details == '지정한 구간에 자막이 없습니다'
+            finally:
+                await backend.close()
+
+    asyncio.run(run())
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_async_extraction()
+    test_concurrent_extractions_share_connections()
+    test_concurrent_same_video_coalesced()
+    test_cancellation()
+    test_pool_across_event_loops()
+    test_time_range()
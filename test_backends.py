@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+자막 백엔드 레지스트리(youtube_core.backends) 테스트 스크립트
+
+메모리에 둔 가짜 자막 백엔드와 임시 보관소로 네트워크 없이 실행된다.
+"""
+
+import os
+import tempfile
+
+from youtube_core.archive import TranscriptArchive
+from youtube_core.backends import ArchiveTranscriptBackend, create_backend, default_fallback_names
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import make_entries, make_track
+from youtube_core.resolver import DEFAULT_PRIORITIES, fetch_transcript, parse_priorities
+from youtube_text_extractor import YouTubeTextExtractor
+from api.youtube_text_extractor import YouTubeTextExtractor as ReactExtractor
+
+
+TRANSCRIPTS = {
+    'koVideo0001': [
+        make_track('en', make_entries(3, 'hello')),
+        make_track('ko', make_entries(3, '안녕하세요'), is_generated=True),
+        make_track('ko', make_entries(3, '수동 자막')),
+    ],
+    'frVideo0001': [make_track('fr', make_entries(2, 'bonjour'))],
+    'mixVideo001': [
+        make_track('ko', make_entries(2, '자동 한국어'), is_generated=True),
+        make_track('en', make_entries(2, 'manual english')),
+    ],
+}
+
+
+class StaticMetadata:
+    def fetch(self, video_id):
+        return {'title': '제목', 'channel': '채널', 'video_id': video_id}
+
+
+def test_backends():
+    print("🧪 자막 백엔드 테스트 중...")
+    backend = create_backend('fake', transcripts=TRANSCRIPTS)
+
+    # 어떤 형태의 URL이든 같은 비디오 ID로 인식한다
+    for url in ('https://www.youtube.com/watch?feature=share&v=koVideo0001', 'https://youtube.com/shorts/koVideo0001',
+                'https://www.youtube.com/embed/koVideo0001?start=3', 'https://youtu.be/koVideo0001'):
+        extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+        assert extractor.process_youtube_url(url), extractor.error_details
+        assert extractor.formatted_text == '수동 자막 0 수동 자막 1 수동 자막 2'
+
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    assert not extractor.process_youtube_url('https://example.com/watch')
+    assert extractor.error_details == '올바른 유튜브 URL이 아닙니다'
+
+    try:
+        create_backend('missing')
+        raise AssertionError("모르는 백엔드 이름이 허용되었습니다")
+    except ValueError:
+        pass
+
+    # 보관소 백엔드는 보관된 자막만 돌려준다
+    with tempfile.TemporaryDirectory() as directory:
+        archive = TranscriptArchive(os.path.join(directory, 'archive.db'))
+        try:
+            priorities = parse_priorities(DEFAULT_PRIORITIES)
+            fetch_transcript(backend, 'frVideo0001', priorities, archive=archive)
+
+            offline = ArchiveTranscriptBackend(archive)
+            extractor = YouTubeTextExtractor(backend=offline, cache=TranscriptCache(MemoryTier()))
+            assert extractor.process_youtube_url('https://youtu.be/frVideo0001')
+            assert extractor.formatted_text == 'bonjour 0 bonjour 1'
+
+            extractor = YouTubeTextExtractor(backend=offline, cache=TranscriptCache(MemoryTier()))
+            assert not extractor.process_youtube_url('https://youtu.be/koVideo0001')
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+def test_fallback_opt_in():
+    print("🧪 예비 백엔드 설정 테스트 중...")
+    previous = os.environ.pop('YT_TRANSCRIPT_FALLBACK', None)
+    try:
+        # yt_dlp 가 설치돼 있어도 지정하지 않으면 예비 백엔드 없음
+        assert default_fallback_names('youtube') == []
+        os.environ['YT_TRANSCRIPT_FALLBACK'] = ''
+        assert default_fallback_names('youtube') == []
+        os.environ['YT_TRANSCRIPT_FALLBACK'] = ' yt_dlp , archive,youtube'
+        # 자기 자신은 예비로 두지 않는다
+        assert default_fallback_names('youtube') == ['yt_dlp', 'archive']
+        assert default_fallback_names('http') == ['yt_dlp', 'archive', 'youtube']
+    finally:
+        os.environ.pop('YT_TRANSCRIPT_FALLBACK', None)
+        if previous is not None:
+            os.environ['YT_TRANSCRIPT_FALLBACK'] = previous
+    print("✅ 성공!")
+
+
+def test_react_extractor_priorities():
+    print("🧪 React 앱 추출기 자막 우선순위 테스트 중...")
+    backend = create_backend('fake', transcripts=TRANSCRIPTS)
+    # 공용 추출기는 언어 먼저(자동 한국어), React 앱 추출기는 수동 자막 먼저(수동 영어)
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    assert extractor.process_youtube_url('https://youtu.be/mixVideo001')
+    assert extractor.transcript_language == 'ko'
+
+    extractor = ReactExtractor(backend=backend, cache=TranscriptCache(MemoryTier()), metadata=StaticMetadata())
+    assert extractor.process_youtube_url('https://youtu.be/mixVideo001'), extractor.error_details
+    assert extractor.transcript_language == 'en' and extractor.formatted_text.startswith('manual english 0')
+    # 요청에 languages 를 주면 그 순서를 따른다
+    extractor = ReactExtractor(backend=backend, cache=TranscriptCache(MemoryTier()), languages=['ko'],
+                               metadata=StaticMetadata())
+    assert extractor.process_youtube_url('https://youtu.be/mixVideo001')
+    assert extractor.transcript_language == 'ko'
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_backends()
+    test_react_extractor_priorities()
+    test_fallback_opt_in()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+배치 추출(youtube_core.batch) 테스트 스크립트
+
+메모리에 둔 가짜 자막 백엔드를 쓰므로 네트워크 없이 실행된다.
+"""
+
+import functools
+import threading
+import time
+
+from youtube_core.backends import TranscriptBackend
+from youtube_core.batch import MAX_CONCURRENCY, extract_many, group_by_video_id, parse_batch
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+class CountingBackend(TranscriptBackend):
+    """동시에 진행 중인 조회 수의 최댓값을 기록하는 백엔드"""
+
+    def __init__(self, backend, latency=0.05):
+        self.backend = backend
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def list_tracks(self, video_id):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.latency)
+            return self.backend.list_tracks(video_id)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def fetch(self, video_id, track):
+        return self.backend.fetch(video_id, track)
+
+
+def make_factory(backend):
+    return functools.partial(YouTubeTextExtractor, backend=backend, cache=TranscriptCache(MemoryTier()))
+
+
+def test_group_by_video_id():
+    print("🧪 비디오 ID별 묶기 테스트 중...")
+    jobs, rejects = group_by_video_id([
+        'https://youtu.be/dQw4w9WgXcQ',
+        ' https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10 ',
+        None,
+        'https://www.youtube.com/shorts/jNQXAC9IVRw',
+        'not a url',
+    ])
+    assert jobs == [
+        (0, 'dQw4w9WgXcQ', ['https://youtu.be/dQw4w9WgXcQ', 'https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10']),
+        (3, 'jNQXAC9IVRw', ['https://www.youtube.com/shorts/jNQXAC9IVRw']),
+    ]
+    assert rejects == [(2, ''), (4, 'not a url')]
+
+    # 배치는 주소 없이 적은 비디오 ID도 받는다 (--normalize --bare-ids 출력)
+    jobs, rejects = group_by_video_id(['dQw4w9WgXcQ', 'https://youtu.be/dQw4w9WgXcQ'])
+    assert jobs == [(0, 'dQw4w9WgXcQ', ['dQw4w9WgXcQ', 'https://youtu.be/dQw4w9WgXcQ'])] and rejects == []
+    assert group_by_video_id(['dQw4w9WgXcQ'], allow_bare_id=False) == ([], [(0, 'dQw4w9WgXcQ')])
+    print("✅ 성공!")
+
+
+def test_parse_batch():
+    print("🧪 배치 입력 검증 테스트 중...")
+    urls = ['https://youtu.be/dQw4w9WgXcQ']
+    assert parse_batch(urls, '8') == (urls, 8)
+    assert parse_batch(urls, None) == parse_batch(urls)
+    assert parse_batch(urls, 0)[1] == 1 and parse_batch(urls, 10000)[1] == MAX_CONCURRENCY
+    for bad_urls, concurrency in (([], 4), ('https://youtu.be/dQw4w9WgXcQ', 4), ([1], 4), ([{'url': 'x'}], 4),
+                                  (urls, 'abc'), (urls, True), (urls, [2])):
+        try:
+            parse_batch(bad_urls, concurrency)
+            raise AssertionError(f"잘못된 입력이 허용되었습니다: {bad_urls!r}, {concurrency!r}")
+        except ValueError:
+            pass
+    print("✅ 성공!")
+
+
+def test_extract_many():
+    print("🧪 배치 추출 테스트 중...")
+    transcripts = {f'batchVid{i:03d}': [make_track('ko', make_entries(2, f'자막 {i}'))] for i in range(8)}
+    backend = CountingBackend(FakeTranscriptBackend(transcripts))
+    urls = [f'https://youtu.be/{video_id}' for video_id in transcripts]
+    urls += [urls[0] + '?si=share', 'https://example.com/nothing', 'https://youtu.be/missingVid1']
+
+    results = list(extract_many(urls, make_factory(backend), concurrency=3))
+    by_index = {result['index']: result for result in results}
+    assert len(results) == 10  # 같은 영상(0, 8)은 결과 하나
+    assert by_index[0]['urls'] == [urls[0], urls[8]] and by_index[0]['success']
+    assert by_index[9] == {'index': 9, 'url': 'https://example.com/nothing', 'urls': ['https://example.com/nothing'],
+                           'video_id': None, 'success': False, 'error': '올바른 유튜브 URL이 아닙니다'}
+    assert not by_index[10]['success'] and by_index[10]['video_id'] == 'missingVid1'
+    assert sum(result['success'] for result in results) == 8
+    # 동시 추출 수는 concurrency 를 넘지 않는다
+    assert backend.peak == 3, backend.peak
+
+    try:
+        next(extract_many(urls, make_factory(backend), concurrency='abc'))
+        raise AssertionError("잘못된 concurrency 가 허용되었습니다")
+    except ValueError:
+        pass
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_group_by_video_id()
+    test_parse_batch()
+    test_extract_many()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+자막 캐시(youtube_core.cache) 테스트 스크립트
+
+TTL 은 음수로 줘서 바로 만료시키므로 기다리지 않는다.
+"""
+
+import os
+import tempfile
+
+from youtube_core.cache import MemoryTier, SQLiteTier, TranscriptCache, get_default_cache, is_negative_error
+from youtube_core.compact import CompactTranscript
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_core.resolver import CachedError, fetch_transcript, parse_priorities
+
+
+def test_memory_lru():
+    print("🧪 메모리 계층 LRU 테스트 중...")
+    tier = MemoryTier(max_bytes=100)
+    far = float('inf')
+    tier.put('a', {'n': 'a'}, 40, far)
+    tier.put('b', {'n': 'b'}, 40, far)
+    assert tier.get('a') == {'n': 'a'}  # a 를 최근에 씀
+    tier.put('c', {'n': 'c'}, 40, far)
+    # 가장 오래 안 쓴 b 가 나간다
+    assert tier.get('b') is None and tier.get('a') and tier.get('c')
+    assert (tier.evictions, tier.current_bytes, len(tier)) == (1, 80, 2)
+
+    # 같은 키를 다시 넣으면 크기를 바꿔 센다
+    tier.put('a', {'n': 'a2'}, 10, far)
+    assert tier.current_bytes == 50 and tier.get('a') == {'n': 'a2'}
+    # 한도보다 큰 항목은 두지 않는다
+    tier.put('huge', {}, 101, far)
+    assert tier.get('huge') is None and tier.current_bytes == 50
+    print("✅ 성공!")
+
+
+def test_ttl_expiry():
+    print("🧪 TTL 만료 테스트 중...")
+    with tempfile.TemporaryDirectory() as directory:
+        disk = SQLiteTier(os.path.join(directory, 'cache.sqlite3'))
+        cache = TranscriptCache(MemoryTier(), disk, ttl=-1)
+        cache.put('ttlVideo001', make_entries(2), 'ko', False)
+        assert cache.get('ttlVideo001', 'ko', False) is None
+        assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 0
+        # 만료된 디스크 항목은 읽을 때 지우고, 남은 것은 purge_expired 로 지운다
+        assert disk.get('ttlVideo001|ko|0') is None
+        cache.put('ttlVideo002', make_entries(2), 'ko', False)
+        assert disk.purge_expired() == 1
+    print("✅ 성공!")
+
+
+def test_disk_promotion():
+    print("🧪 디스크 계층 → 메모리 계층 승격 테스트 중...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache.sqlite3')
+        TranscriptCache(MemoryTier(), SQLiteTier(path)).put('diskVideo01', make_entries(3), 'ko', False)
+
+        # 다른 프로세스처럼 메모리가 빈 캐시: 처음에는 디스크, 다음부터는 메모리에서 읽는다
+        cache = TranscriptCache(MemoryTier(), SQLiteTier(path))
+        record = cache.get('diskVideo01', 'ko', False)
+        assert isinstance(record['entries'], CompactTranscript) and len(record['entries']) == 3
+        assert cache.get('diskVideo01', 'ko', False)['entries'] is record['entries']
+        stats = cache.stats()
+        assert (stats['disk_hits'], stats['memory_hits'], stats['hits'], stats['misses']) == (1, 1, 2, 0)
+        assert stats['hit_ratio'] == 1.0 and stats['memory_items'] == 1
+    print("✅ 성공!")
+
+
+def test_negative_caching():
+    print("🧪 부정 캐싱 테스트 중...")
+    assert is_negative_error(Exception('No transcripts found for video x'))
+    assert is_negative_error(type('TranscriptsDisabled', (Exception,), {})())
+    assert not is_negative_error(Exception('HTTP Error 429: Too Many Requests'))
+
+    backend = FakeTranscriptBackend({})
+    cache = TranscriptCache(MemoryTier())
+    for _ in range(2):
+        try:
+            fetch_transcript(backend, 'missingVid1', parse_priorities('ko'), cache)
+            raise AssertionError("자막 없는 영상이 성공했습니다")
+        except CachedError:
+            pass
+        except Exception as e:
+            assert 'No transcripts found' in str(e)
+    # 두 번째는 백엔드에 묻지 않고 캐시된 실패를 돌려준다
+    assert backend.request_count == 1
+    stats = cache.stats()
+    assert stats['negative_stores'] == 1 and stats['negative_hits'] == 1
+
+    # 부정 캐싱은 더 짧은 negative_ttl 로 만료된다
+    cache = TranscriptCache(MemoryTier(), negative_ttl=-1)
+    cache.put_negative('missingVid1', 'No transcripts found')
+    assert cache.get('missingVid1') is None
+    print("✅ 성공!")
+
+
+def test_language_priority_keys():
+    print("🧪 언어 우선순위별 캐시 키 테스트 중...")
+    backend = FakeTranscriptBackend({'langVideo01': [make_track('en', make_entries(2, 'hello')),
+                                                     make_track('ko', make_entries(2, '안녕'))]})
+    cache = TranscriptCache(MemoryTier())
+
+    def texts(languages):
+        result = fetch_transcript(backend, 'langVideo01', parse_priorities(languages), cache)
+        return [entry['text'] for entry in result.entries], result.round_trips
+
+    # 같은 캐시를 써도 우선순위가 다르면 다른 자막 (자막은 영상/언어/자동 생성 여부로 저장)
+    assert texts('ko') == (['안녕 0', '안녕 1'], 2)
+    assert texts('en') == (['hello 0', 'hello 1'], 1)  # 목록은 영상 단위라 다시 받지 않는다
+    assert texts('ko') == (['안녕 0', '안녕 1'], 0)
+    assert texts('en') == (['hello 0', 'hello 1'], 0)
+    assert backend.request_count == 3
+    print("✅ 성공!")
+
+
+def test_default_cache_is_memory_only():
+    print("🧪 기본 캐시 설정 테스트 중...")
+    if os.environ.get('YT_CACHE_DISABLE') == '1' or 'YT_CACHE_PATH' in os.environ:
+        print("⏭️ 환경 변수로 캐시를 설정해서 건너뜀")
+        return
+    # 디스크 계층은 YT_CACHE_PATH 를 지정했을 때만
+    cache = get_default_cache()
+    assert cache.memory is not None and cache.disk is None
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_memory_lru()
+    test_ttl_expiry()
+    test_disk_promotion()
+    test_negative_caching()
+    test_language_priority_keys()
+    test_default_cache_is_memory_only()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+열 단위 자막 저장(youtube_core.compact) 테스트 스크립트
+"""
+
+from youtube_core.compact import CompactTranscript
+
+
+ENTRIES = [
+    {'text': '하나', 'start': 0.0, 'duration': 2.0},
+    {'text': '', 'start': 2.0, 'duration': 1.0},
+    {'text': 'three', 'start': 3.0, 'duration': 2.5},
+    {'text': '넷넷', 'start': 5.5, 'duration': 1.0},
+]
+
+
+def test_from_entries():
+    print("🧪 dict 리스트와 같은 항목 테스트 중...")
+    transcript = CompactTranscript.from_entries(ENTRIES)
+    assert len(transcript) == 4 and bool(transcript) and transcript.is_sorted
+    assert list(transcript) == ENTRIES and transcript.to_list() == ENTRIES
+    assert list(transcript.texts()) == ['하나', '', 'three', '넷넷']
+    assert list(transcript.rows())[2] == ('three', 3.0, 2.5)
+    assert transcript.text == '하나three넷넷' and list(transcript.offsets) == [0, 2, 2, 7, 9]
+    # 이미 CompactTranscript 면 그대로
+    assert CompactTranscript.from_entries(transcript) is transcript
+
+    # 빠진 값은 빈 문자열/0, 시작 시각이 뒤섞여 있으면 is_sorted=False
+    odd = CompactTranscript.from_entries([{'text': None, 'start': 5}, {'text': 'a', 'start': None, 'duration': 1}])
+    assert odd.to_list() == [{'text': '', 'start': 5.0, 'duration': 0.0}, {'text': 'a', 'start': 0.0, 'duration': 1.0}]
+    assert not odd.is_sorted
+
+    empty = CompactTranscript.from_entries(None)
+    assert len(empty) == 0 and not empty and empty.to_list() == []
+    print("✅ 성공!")
+
+
+def test_indexing_and_slicing():
+    print("🧪 인덱스/슬라이스 접근 테스트 중...")
+    transcript = CompactTranscript.from_entries(ENTRIES)
+    assert transcript[0] == ENTRIES[0] and transcript[-1] == ENTRIES[-1]
+    for index in (4, -5):
+        try:
+            transcript[index]
+            raise AssertionError(f"범위 밖 번호가 허용되었습니다: {index}")
+        except IndexError:
+            pass
+
+    # 슬라이스도 CompactTranscript 이고, 텍스트 위치는 0부터 다시 센다
+    for part in (slice(1, 3), slice(2, None), slice(None, -1), slice(3, 1), slice(10, 20), slice(None, None, 2),
+                 slice(None, None, -1)):
+        sliced = transcript[part]
+        assert isinstance(sliced, CompactTranscript), part
+        assert sliced.to_list() == ENTRIES[part], part
+        assert sliced.offsets[0] == 0 and sliced.offsets[-1] == len(sliced.text), part
+    assert transcript[2:].text == 'three넷넷'
+    assert len(transcript[3:1]) == 0 and list(transcript[3:1].offsets) == [0]
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_from_entries()
+    test_indexing_and_slicing()
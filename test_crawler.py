@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+채널/재생목록 크롤러(youtube_core.crawler) 테스트 스크립트
+
+yt_dlp 목록 대신 메모리에 둔 목록과 가짜 자막 백엔드, 임시 보관소로 네트워크 없이 실행된다.
+"""
+
+import os
+import tempfile
+
+from youtube_core.archive import TranscriptArchive
+from youtube_core.backends import create_backend
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.crawler import ChannelCrawler, normalize_source
+from youtube_core.fake_server import make_entries, make_track
+
+
+class Listing:
+    """flat 추출처럼 목록을 필요한 만큼만 읽게 하고, 읽은 항목 수를 센다"""
+
+    def __init__(self, videos):
+        self.videos = videos  # {소스 URL: [최신순 비디오 ID]}
+        self.calls = 0
+        self.read = 0
+
+    def __call__(self, url):
+        self.calls += 1
+
+        def entries():
+            for video_id in self.videos[url]:
+                self.read += 1
+                yield {'_type': 'url', 'id': video_id, 'title': f'제목 {video_id}', 'duration': 60}
+
+        return {'title': '테스트 채널 - Videos', 'channel': '테스트 채널', 'entries': entries()}
+
+
+def test_crawler():
+    print("🧪 채널 크롤러 테스트 중...")
+    assert normalize_source('@test') == ('https://www.youtube.com/@test/videos', 'channel')
+    assert normalize_source('https://youtube.com/@test/shorts') == ('https://www.youtube.com/@test/shorts', 'channel')
+    assert normalize_source('https://www.youtube.com/watch?v=abc&list=PL123') == (
+        'https://www.youtube.com/playlist?list=PL123', 'playlist')
+
+    channel = 'https://www.youtube.com/@test/videos'
+    transcripts = {f'chanVideo0{i}': [make_track('ko', make_entries(2, f'영상 {i}'))] for i in (1, 2, 3, 5)}
+    listing = Listing({channel: ['chanVideo03', 'chanVideo02', 'chanVideo01']})
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = TranscriptArchive(os.path.join(directory, 'archive.db'))
+        try:
+            crawler = ChannelCrawler(archive, backend=create_backend('fake', transcripts=transcripts),
+                                     cache=TranscriptCache(MemoryTier()), lister=listing)
+            report = crawler.sync('https://www.youtube.com/@test')
+            assert report['success'] and report['new'] == 3 and report['ok'] == 3, report
+            assert archive.get_info('chanVideo01')['channel'] == '테스트 채널'
+            assert archive.get_source(channel)['watermark'] == 'chanVideo03'
+
+            # 바뀐 게 없는 채널은 목록 첫 항목만 읽고 끝난다
+            listing.read = 0
+            report = crawler.sync('@test')
+            assert report['new'] == 0 and report['round_trips'] == 0 and listing.read == 1
+
+            # 새 영상만 가져오고, 자막이 없는 영상은 다시 시도하지 않는다
+            listing.videos[channel] = ['chanVideo05', 'chanVideo04'] + listing.videos[channel]
+            listing.read = 0
+            report = crawler.sync('@test')
+            assert (report['new'], report['ok'], report['unavailable'], listing.read) == (2, 1, 1, 3), report
+            report = crawler.sync('@test')
+            assert report['new'] == 0 and report['retried'] == 0
+            assert [result['video_id'] for result in archive.search('영상 5')] == ['chanVideo05']
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+class FlakyArchive(TranscriptArchive):
+    """지정한 영상의 크롤링 상태나 지정한 소스를 저장/조회하지 못하는 보관소"""
+
+    broken_videos = ('flakyVid002',)
+    broken_sources = ('https://www.youtube.com/@broken/videos',)
+
+    def put_source_video(self, url, video_id, status, error=None):
+        if video_id in self.broken_videos:
+            raise RuntimeError('disk I/O error')
+        super().put_source_video(url, video_id, status, error)
+
+    def get_source_videos(self, url):
+        if url in self.broken_sources:
+            raise RuntimeError('database is locked')
+        return super().get_source_videos(url)
+
+
+def test_crawler_failures_isolated():
+    print("🧪 영상/소스 하나의 실패가 나머지를 멈추지 않는지 테스트 중...")
+    channel = 'https://www.youtube.com/@flaky/videos'
+    transcripts = {f'flakyVid00{i}': [make_track('ko', make_entries(2, f'영상 {i}'))] for i in range(1, 4)}
+    listing = Listing({channel: ['flakyVid003', 'flakyVid002', 'flakyVid001']})
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = FlakyArchive(os.path.join(directory, 'archive.db'))
+        try:
+            crawler = ChannelCrawler(archive, backend=create_backend('fake', transcripts=transcripts),
+                                     cache=TranscriptCache(MemoryTier()), lister=listing, concurrency=1)
+            reports = {report['source']: report for report in crawler.sync_many(['@broken', '@flaky'])}
+            report = reports[channel]
+            # 상태를 저장하지 못한 영상은 error 로 세고 나머지 영상은 계속 가져온다
+            assert report['success'] and (report['ok'], report['error']) == (2, 1), report
+            assert archive.get_source_videos(channel)['flakyVid002'][0] == 'pending'
+            assert reports['@broken'] == {
+                'source': '@broken', 'success': False, 'error': 'database is locked'}
+        finally:
+            archive.close()
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_crawler()
+    test_crawler_failures_isolated()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+extract_api.py --serve 상주 서버 모드 테스트 스크립트
+
+가짜 자막 서버(youtube_core.fake_server)에 연결해서 네트워크 없이 실행된다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from youtube_core.fake_server import FakeTranscriptServer, make_entries, make_track
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TRANSCRIPTS = {f'serveVideo{i}': [make_track('ko', make_entries(3, f'상주 {i}'))] for i in range(3)}
+
+
+def cli_env(server):
+    env = dict(os.environ, YT_TRANSCRIPT_BACKEND_URL=server.url, YT_CACHE_PATH='', YT_TRANSCRIPT_FALLBACK='')
+    for name in ('YT_TRANSCRIPT_BACKEND', 'YT_ARCHIVE_PATH', 'YT_CACHE_DISABLE'):
+        env.pop(name, None)
+    return env
+
+
+def start_serve(server, workers=1, **variables):
+    env = dict(cli_env(server), **variables)
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'extract_api.py'), '--serve', '--workers', str(workers)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8', bufsize=1, env=env,
+    )
+    assert json.loads(process.stdout.readline()) == {'id': None, 'ready': True, 'workers': workers}
+    return process
+
+
+def test_serve_always_answers():
+    print("🧪 상주 서버 응답 테스트 중...")
+    with FakeTranscriptServer(TRANSCRIPTS, latency=0.05) as server:
+        process = start_serve(server)
+        try:
+            requests = [
+                {'id': 'ok', 'url': 'https://youtu.be/serveVideo0'},
+                # 처리 중 예외(잘못된 languages)가 나도 같은 id 로 실패 응답
+                {'id': 'crash', 'url': 'https://youtu.be/serveVideo1', 'languages': 5},
+                {'id': 'crash-stream', 'url': 'https://youtu.be/serveVideo1', 'languages': 5, 'stream': True},
+                # 입력 검증 실패는 실행하지 않고 바로 응답
+                {'id': 'bad-batch', 'urls': ['https://youtu.be/serveVideo2'], 'concurrency': 'abc'},
+                {'id': 'no-url'},
+            ]
+            # workers 1개의 두 배보다 많은 요청을 한꺼번에 보내도 모두 답한다
+            requests += [{'id': f'more{i}', 'url': f'https://youtu.be/serveVideo{i}'} for i in range(3)]
+            for request in requests:
+                process.stdin.write(json.dumps(request) + '\n')
+                # JSON 객체가 아닌 줄도 서버를 멈추지 않는다
+                process.stdin.write('[1]\n"x"\n')
+            process.stdin.close()
+            responses = {}
+            rejected = []
+            for line in process.stdout:
+                response = json.loads(line)
+                if response['id'] is None:
+                    rejected.append(response)
+                else:
+                    responses[response['id']] = response
+            assert process.wait(timeout=10) == 0
+        finally:
+            process.kill()
+
+    assert set(responses) == {request['id'] for request in requests}
+    assert rejected == [{'id': None, 'success': False, 'error': '요청은 JSON 객체여야 합니다'}] * (2 * len(requests))
+    assert responses['ok']['success'] and responses['ok']['text'] == '상주 0 0 상주 0 1 상주 0 2'
+    assert responses['crash'] == {'id': 'crash', 'success': False,
+                                  'error': "오류가 발생했습니다: 'int' object is not iterable"}
+    assert responses['crash-stream']['type'] == 'error' and not responses['crash-stream']['success']
+    assert not responses['bad-batch']['success'] and not responses['no-url']['success']
+    assert all(responses[f'more{i}']['success'] for i in range(3))
+    print("✅ 성공!")
+
+
+def test_serve_search_errors():
+    print("🧪 상주 서버 검색 실패 응답 테스트 중...")
+    with FakeTranscriptServer(TRANSCRIPTS) as server, tempfile.TemporaryDirectory() as directory:
+        process = start_serve(server, YT_ARCHIVE_PATH=os.path.join(directory, 'archive.db'))
+        try:
+            # limit 이 숫자가 아니어도 서버는 살아 있고 요청마다 한 줄로 답한다
+            requests = [{'id': 'bad-limit', 'search': '상주', 'limit': 'abc'},
+                        {'id': 'ok', 'search': '상주', 'limit': 5}]
+            process.stdin.write(''.join(json.dumps(request) + '\n' for request in requests))
+            process.stdin.close()
+            responses = [json.loads(line) for line in process.stdout]
+            assert process.wait(timeout=10) == 0
+        finally:
+            process.kill()
+
+    assert [response['id'] for response in responses] == ['bad-limit', 'ok']
+    assert not responses[0]['success'] and responses[0]['error'].startswith('오류가 발생했습니다')
+    assert responses[1]['success'] and responses[1]['results'] == []
+    print("✅ 성공!")
+
+
+def test_normalize_then_batch():
+    print("🧪 --normalize 출력을 --batch 에 넣기 테스트 중...")
+    lines = ['https://youtu.be/serveVideo0', 'serveVideo1', 'https://www.youtube.com/watch?v=serveVideo0', 'serveVideo2']
+    with FakeTranscriptServer(TRANSCRIPTS) as server, tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'in.txt')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        script = os.path.join(ROOT, 'extract_api.py')
+        normalized = subprocess.run([sys.executable, script, '--normalize', source, '--bare-ids'], env=cli_env(server),
+                                    capture_output=True, text=True, encoding='utf-8', timeout=30)
+        assert normalized.returncode == 0, normalized.stderr
+        assert normalized.stdout == 'serveVideo0\nserveVideo1\nserveVideo2\n'
+
+        ids = os.path.join(directory, 'ids.txt')
+        with open(ids, 'w', encoding='utf-8') as f:
+            f.write(normalized.stdout)
+        batch = subprocess.run([sys.executable, script, '--batch', ids], env=cli_env(server),
+                               capture_output=True, text=True, encoding='utf-8', timeout=30)
+        assert batch.returncode == 0, batch.stderr
+
+    results = sorted((json.loads(line) for line in batch.stdout.splitlines()), key=lambda result: result['index'])
+    assert [result['video_id'] for result in results] == ['serveVideo0', 'serveVideo1', 'serveVideo2']
+    assert all(result['success'] for result in results), results
+    assert results[1]['url'] == 'serveVideo1' and results[1]['text'] == '상주 1 0 상주 1 1 상주 1 2'
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_serve_always_answers()
+    test_serve_search_errors()
+    test_normalize_then_batch()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+HTTP 압축/캐시 검증(youtube_core.http_cache) 테스트 스크립트
+
+ETag/304 는 가짜 자막 서버에 연결한 extract_api.py --serve 와 api/extract.py 를 띄워 확인하므로
+네트워크 없이 실행된다.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, FakeTranscriptServer, make_entries, make_track
+from youtube_core.http_cache import (
+    MIN_COMPRESS_BYTES, compress, etag_matches, make_etag, matching_tag, negotiate_encoding, parse_accept_encoding,
+    representation_etag, select_encoding, transcript_etag
+)
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+VIDEO_ID = 'etagVideo01'
+TRANSCRIPTS = {VIDEO_ID: [make_track('ko', make_entries(200, '캐시 검증 자막')),
+                          make_track('en', make_entries(50, 'caption'), is_generated=True)]}
+
+
+def test_accept_encoding():
+    print("🧪 Accept-Encoding 협상 테스트 중...")
+    assert parse_accept_encoding('GZIP;q=0.5, br, *;q=0') == {'gzip': 0.5, 'br': 1.0, '*': 0.0}
+    assert parse_accept_encoding('gzip;q=abc') == {'gzip': 0.0}
+    assert negotiate_encoding('gzip, deflate') == 'gzip'
+    assert negotiate_encoding('*') is not None
+    for header in (None, '', 'identity', 'deflate', 'gzip;q=0, br;q=0', 'gzip;q=0'):
+        assert negotiate_encoding(header) is None, header
+
+    body = json.dumps({'text': '자막 ' * 2000}, ensure_ascii=False).encode('utf-8')
+    assert select_encoding(body[:MIN_COMPRESS_BYTES - 1], 'gzip') is None  # 작은 본문은 압축하지 않는다
+    assert select_encoding(body, 'gzip') == 'gzip'
+    # mtime=0 이라 같은 본문이면 압축 결과도 같다
+    assert compress(body, 'gzip') == compress(body, 'gzip')
+    assert gzip.decompress(compress(body, 'gzip')) == body
+    assert compress(body, None) is body
+    print("✅ 성공!")
+
+
+def test_etag_matching():
+    print("🧪 ETag 비교 테스트 중...")
+    etag = make_etag(b'body')
+    assert len(etag) == 34 and etag.startswith('"') and etag == make_etag(b'body') != make_etag(b'other')
+    gzip_etag = representation_etag(etag, 'gzip')
+    assert gzip_etag == etag[:-1] + '-gz"' and representation_etag(etag, None) == etag
+
+    # 압축한 표현이나 약한 태그도 같은 내용으로 본다
+    for header in (etag, gzip_etag, 'W/' + etag, f'"other", {gzip_etag}', '*'):
+        assert etag_matches(header, etag), header
+    assert matching_tag(f'"other", {gzip_etag}', etag) == gzip_etag
+    for header in (None, '', '"other"', etag[:-2] + '"'):
+        assert not etag_matches(header, etag), header
+    assert matching_tag(etag, None) is None
+    print("✅ 성공!")
+
+
+def make_extractor(backend, cache, **options):
+    return YouTubeTextExtractor(backend=backend, cache=cache, **options)
+
+
+def test_transcript_etag():
+    print("🧪 캐시된 자막으로 만든 ETag 테스트 중...")
+    backend = FakeTranscriptBackend(TRANSCRIPTS)
+    cache = TranscriptCache(MemoryTier())
+
+    first = make_extractor(backend, cache)
+    # 캐시에 없으면 추출 전에는 알 수 없다
+    assert transcript_etag(first, VIDEO_ID) is None
+    assert first.process_youtube_url(f'https://youtu.be/{VIDEO_ID}')
+    etag = transcript_etag(first, VIDEO_ID)
+    assert etag is not None
+
+    # 다음 요청은 자막을 가져오거나 포맷하지 않고 같은 ETag 를 얻는다
+    requests = backend.request_count
+    assert transcript_etag(make_extractor(backend, cache), VIDEO_ID) == etag
+    assert backend.request_count == requests
+
+    # 형식/구간/트랙이 다르면 본문이 다르므로 ETag 도 다르다
+    make_extractor(backend, cache, languages='en').process_youtube_url(f'https://youtu.be/{VIDEO_ID}')
+    others = [
+        transcript_etag(make_extractor(backend, cache, output_format='srt'), VIDEO_ID),
+        transcript_etag(make_extractor(backend, cache), VIDEO_ID, {'start': 10.0, 'end': None, 'max_chars': None}),
+        transcript_etag(make_extractor(backend, cache), VIDEO_ID, raw=True),
+        transcript_etag(make_extractor(backend, cache, languages='en'), VIDEO_ID),
+    ]
+    assert None not in others and len({etag, *others}) == 5
+
+    # 같은 트랙이라도 자막 내용이 바뀌면 ETag 가 바뀐다
+    cache.put(VIDEO_ID, make_entries(200, '고친 자막'), 'ko', False)
+    assert transcript_etag(make_extractor(backend, cache), VIDEO_ID) not in (None, etag)
+    # 자막 없는 영상
+    assert transcript_etag(make_extractor(backend, cache), 'missingVid1') is None
+    print("✅ 성공!")
+
+
+def server_env(server):
+    env = dict(os.environ, YT_TRANSCRIPT_BACKEND_URL=server.url, YT_CACHE_PATH='', YT_TRANSCRIPT_FALLBACK='',
+               YT_SINGLEFLIGHT_DISABLE='1')
+    for name in ('YT_TRANSCRIPT_BACKEND', 'YT_ARCHIVE_PATH', 'YT_CACHE_DISABLE'):
+        env.pop(name, None)
+    return env
+
+
+def test_serve_not_modified():
+    print("🧪 --serve 의 not_modified 응답 테스트 중...")
+    with FakeTranscriptServer(TRANSCRIPTS) as server:
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'extract_api.py'), '--serve', '--workers', '1'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding='utf-8', bufsize=1,
+            env=server_env(server),
+        )
+        try:
+            assert json.loads(process.stdout.readline())['ready']
+
+            def ask(**request):
+                process.stdin.write(json.dumps(dict(request, url=f'https://youtu.be/{VIDEO_ID}', etag=True)) + '\n')
+                return json.loads(process.stdout.readline())
+
+            response = ask(id=1)
+            assert response['success'] and response['etag'] and 'timings' not in response['info']
+            requests = server.request_count
+            assert ask(id=2, if_none_match=response['etag']) == {
+                'success': True, 'not_modified': True, 'etag': response['etag'], 'id': 2}
+            assert server.request_count == requests  # 추출하지 않았다
+
+            changed = ask(id=3, if_none_match=response['etag'], format='srt')
+            assert changed['success'] and 'not_modified' not in changed and changed['etag'] != response['etag']
+        finally:
+            process.stdin.close()
+            process.wait(timeout=10)
+    print("✅ 성공!")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_handler_304():
+    print("🧪 GET 추출의 304 응답 테스트 중...")
+    with FakeTranscriptServer(TRANSCRIPTS) as server:
+        port = free_port()
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'api', 'extract.py'), '--port', str(port)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=server_env(server))
+        try:
+            deadline = time.time() + 15
+            while True:
+                try:
+                    socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                    break
+                except OSError:
+                    assert time.time() < deadline and process.poll() is None, "서버가 뜨지 않았습니다"
+                    time.sleep(0.05)
+
+            def get(**headers):
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+                conn.request('GET', f'/api/extract?v={VIDEO_ID}&format=srt', headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                conn.close()
+                return response, body
+
+            response, body = get(**{'Accept-Encoding': 'gzip'})
+            etag = response.getheader('ETag')
+            assert response.status == 200 and response.getheader('Content-Encoding') == 'gzip'
+            assert etag.endswith('-gz"') and json.loads(gzip.decompress(body))['success']
+
+            requests = server.request_count
+            response, body = get(**{'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+            assert response.status == 304 and body == b'' and response.getheader('ETag') == etag
+            assert response.getheader('Cache-Control').startswith('public')
+            assert server.request_count == requests  # 자막을 다시 가져오지 않았다
+
+            # 압축하지 않은 표현의 태그로도 같은 내용으로 본다
+            response, _ = get(**{'If-None-Match': etag.replace('-gz', '')})
+            assert response.status == 304
+            response, body = get(**{'If-None-Match': '"stale"'})
+            assert response.status == 200 and response.getheader('ETag') == etag.replace('-gz', '')
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_accept_encoding()
+    test_etag_matching()
+    test_transcript_etag()
+    test_serve_not_modified()
+    test_handler_304()
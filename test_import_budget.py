@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+시작 시간(import 예산)과 서버 모드 미리 준비(youtube_core.prewarm) 테스트 스크립트
+
+benchmarks/bench_import.py 의 예산과 늦게 불러올 모듈 목록을 그대로 확인한다.
+느린 CI 머신에서는 IMPORT_BUDGET_SCALE=2 처럼 예산을 늘린다.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_bench_import():
+    spec = importlib.util.spec_from_file_location('bench_import', os.path.join(ROOT, 'benchmarks', 'bench_import.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_budget():
+    print("🧪 import 시간 예산 테스트 중...")
+    bench = load_bench_import()
+    scale = float(os.environ.get('IMPORT_BUDGET_SCALE', '1.0'))
+    failures = []
+    for module, budget in bench.BUDGETS_MS.items():
+        elapsed, profile = bench.measure(module, 3)
+        # 무거운 의존성은 첫 자막/메타데이터 조회 때 불러온다
+        eager = [name for name in bench.LAZY_MODULES if name in profile]
+        if eager:
+            failures.append(f"{module}: import 시점에 {', '.join(eager)} 를 불러옵니다")
+        if elapsed > budget * scale:
+            failures.append(f"{module}: {elapsed:.1f}ms > {budget * scale:.0f}ms "
+                            f"({', '.join(bench.heaviest(profile, module))})")
+    assert not failures, '\n'.join(failures)
+    print("✅ 성공!")
+
+
+PREWARM_SCRIPT = """
+import json, sys
+from youtube_core.prewarm import prewarm
+timings = prewarm()
+print(json.dumps({'timings': timings, 'modules': [name for name in ('youtube_transcript_api', 'yt_dlp')
+                                                   if name in sys.modules]}))
+"""
+
+
+def test_prewarm():
+    print("🧪 서버 모드 미리 준비 테스트 중...")
+    env = dict(os.environ, YT_CACHE_PATH='')
+    for name in ('YT_ARCHIVE_PATH', 'YT_TRANSCRIPT_BACKEND'):
+        env.pop(name, None)
+    # 앞선 테스트가 불러온 모듈이 섞이지 않도록 새 프로세스에서 확인
+    result = subprocess.run([sys.executable, '-c', PREWARM_SCRIPT], cwd=ROOT, env=env, capture_output=True,
+                            text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout)
+
+    # metadata=False 면 yt_dlp 는 건너뛰고 나머지 단계는 시간(ms)을 남긴다
+    assert list(report['timings']) == ['transcript_api', 'cache', 'formats']
+    assert all(value is not None for value in report['timings'].values()), report
+    assert report['modules'] == ['youtube_transcript_api']
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_import_budget()
+    test_prewarm()
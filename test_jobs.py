@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+백그라운드 추출 작업(youtube_core.jobs) 테스트 스크립트
+
+메모리에 둔 가짜 자막 백엔드를 쓰므로 네트워크 없이 실행된다.
+"""
+
+import functools
+import time
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_core.jobs import DONE, FAILED, JobQueue
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+TRANSCRIPTS = {f'jobVideo00{i}': [make_track('ko', make_entries(2, f'작업 {i}'))] for i in range(3)}
+
+
+def make_queue(latency=0.0, **kwargs):
+    backend = FakeTranscriptBackend(TRANSCRIPTS, latency=latency)
+    factory = functools.partial(YouTubeTextExtractor, backend=backend, cache=TranscriptCache(MemoryTier()))
+    return JobQueue(factory, max_workers=2, **kwargs)
+
+
+def wait(*jobs, timeout=5.0):
+    deadline = time.time() + timeout
+    while not all(job.finished for job in jobs):
+        assert time.time() < deadline, [job.to_dict() for job in jobs]
+        time.sleep(0.01)
+
+
+def test_dedupe_and_ttl():
+    print("🧪 작업 중복 제거/결과 재사용 테스트 중...")
+    queue = make_queue(latency=0.1)
+    assert queue.submit('not a url') is None
+
+    job = queue.submit('https://youtu.be/jobVideo000')
+    # 진행 중인 같은 영상은 같은 작업
+    assert queue.submit('https://www.youtube.com/watch?v=jobVideo000&t=5') is job
+    wait(job)
+    assert job.status == DONE and job.result['success'] and job.finished_at >= job.started_at
+    # result_ttl 안에 끝난 작업도 재사용
+    assert queue.submit('https://youtu.be/jobVideo000') is job
+    assert queue.reused == 2
+
+    queue.result_ttl = 0
+    again = queue.submit('https://youtu.be/jobVideo000')
+    assert again is not job
+    wait(again)
+    assert queue.stats() == {'queued': 0, 'running': 0, 'done': 2, 'failed': 0, 'reused': 2}
+    print("✅ 성공!")
+
+
+def test_eviction():
+    print("🧪 끝난 작업 정리 테스트 중...")
+    queue = make_queue(latency=0.2, max_jobs=1)
+    first = queue.submit('https://youtu.be/jobVideo000')
+    wait(first)
+    second = queue.submit('https://youtu.be/jobVideo001')
+    # 끝난 작업부터 지운다
+    assert queue.get(first.job_id) is None and queue.get(second.job_id) is second
+    # 진행 중인 작업은 max_jobs 를 넘어도 남긴다
+    third = queue.submit('https://youtu.be/jobVideo002')
+    assert not second.finished and queue.get(second.job_id) is second
+    wait(second, third)
+    # 지운 작업의 영상은 다시 가져온다
+    assert queue.submit('https://youtu.be/jobVideo000') is not first
+    print("✅ 성공!")
+
+
+def test_failed_jobs():
+    print("🧪 실패한 작업 테스트 중...")
+    queue = make_queue()
+    missing = queue.submit('https://youtu.be/missingVid1')
+    wait(missing)
+    assert missing.status == FAILED and not missing.result['success'] and missing.finished_at is not None
+    # 실패한 작업은 재사용하지 않는다
+    assert queue.submit('https://youtu.be/missingVid1') is not missing
+
+    # 추출기를 만들지 못해도 RUNNING 으로 남지 않고 FAILED 로 끝난다
+    def broken_factory():
+        raise RuntimeError('추출기 생성 실패')
+
+    queue.extractor_factory = broken_factory
+    broken = queue.submit('https://youtu.be/jobVideo001')
+    wait(broken)
+    assert broken.status == FAILED and broken.finished_at is not None
+    assert broken.result == {'success': False, 'error': '오류가 발생했습니다: 추출기 생성 실패'}
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_dedupe_and_ttl()
+    test_eviction()
+    test_failed_jobs()
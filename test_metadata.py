@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+비디오 메타데이터(youtube_core.metadata) 테스트 스크립트
+
+extract_info 응답을 메모리에서 돌려주는 YoutubeDL 대역을 써서 네트워크 없이 실행된다.
+"""
+
+import importlib.util
+import threading
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.metadata import YDL_OPTIONS, MetadataService, caption_tracks, placeholder_info
+from youtube_core.scheduler import OutboundScheduler
+
+
+INFO = {
+    'title': '메타데이터 영상',
+    'uploader': '채널',
+    'duration': 125,
+    'view_count': None,
+    'formats': [{'format_id': '18'}],
+    'subtitles': {
+        'ko': [{'ext': 'srv1', 'url': 'https://x/ko.srv1'}, {'ext': 'json3', 'url': 'https://x/ko.json3',
+                                                              'name': 'Korean'}],
+        'live_chat': [{'ext': 'json', 'url': 'https://x/chat'}],
+    },
+    'automatic_captions': {
+        'en': [{'ext': 'vtt', 'url': 'https://x/en.vtt', 'name': 'English'},
+               {'ext': 'json3', 'url': 'https://x/en.json3'}],
+    },
+}
+
+
+class FakeYoutubeDL:
+    """extract_info 호출을 기록하고 INFO 를 돌려주는 YoutubeDL 대역"""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def extract_info(self, url, download=True, process=True):
+        self.calls.append((url, download, process))
+        if self.error:
+            raise self.error
+        return dict(INFO)
+
+
+class FakeYdlMetadataService(MetadataService):
+    def __init__(self, ydl, **options):
+        super().__init__(scheduler=OutboundScheduler(burst=100, max_retries=0), **options)
+        self.fake_ydl = ydl
+
+    def _ydl(self):
+        return self.fake_ydl
+
+
+def test_caption_tracks():
+    print("🧪 자막 트랙 목록 테스트 중...")
+    # 수동 자막이 먼저, 받을 수 있는 형식(json3, vtt)이 없는 트랙은 뺀다
+    assert caption_tracks(INFO) == [
+        {'language_code': 'ko', 'language': 'Korean', 'is_generated': False,
+         'formats': {'json3': 'https://x/ko.json3'}},
+        {'language_code': 'en', 'language': 'English', 'is_generated': True,
+         'formats': {'vtt': 'https://x/en.vtt', 'json3': 'https://x/en.json3'}},
+    ]
+    assert caption_tracks({}) == []
+    print("✅ 성공!")
+
+
+def test_metadata_and_captions_cached():
+    print("🧪 메타데이터/자막 주소 캐시 테스트 중...")
+    ydl = FakeYoutubeDL()
+    service = FakeYdlMetadataService(ydl, cache=TranscriptCache(MemoryTier()))
+
+    metadata = service.fetch('metaVideo01')
+    assert metadata == {'title': '메타데이터 영상', 'channel': '채널', 'duration': 125, 'view_count': 0,
+                        'upload_date': '', 'description': '', 'video_id': 'metaVideo01'}
+    # 포맷 처리 없이(process=False) 한 번만 요청
+    assert ydl.calls == [('https://www.youtube.com/watch?v=metaVideo01', False, False)]
+
+    # 같은 응답의 자막 주소도 저장돼서 자막 백엔드가 다시 요청하지 않는다
+    assert [track['language_code'] for track in service.captions('metaVideo01')] == ['ko', 'en']
+    metadata['title'] = '바꾼 제목'  # 돌려준 dict 를 바꿔도 캐시는 그대로
+    assert service.fetch('metaVideo01')['title'] == '메타데이터 영상'
+    assert service.get('metaVideo01')['channel'] == '채널'
+    assert len(ydl.calls) == 1
+
+    # 자막 주소가 먼저 필요해도 extract_info 한 번으로 메타데이터까지 채운다
+    service.captions('metaVideo02')
+    service.fetch('metaVideo02')
+    assert len(ydl.calls) == 2
+
+    # 자막 주소는 만료 시각이 있어서 메타데이터와 따로 더 짧게 만료된다
+    service = FakeYdlMetadataService(ydl, cache=TranscriptCache(MemoryTier()), captions_ttl=-1)
+    service.fetch('metaVideo03')
+    service.fetch('metaVideo03')
+    service.captions('metaVideo03')
+    assert len(ydl.calls) == 4
+    print("✅ 성공!")
+
+
+def test_failure_placeholder():
+    print("🧪 메타데이터 실패 시 기본 정보 테스트 중...")
+    service = FakeYdlMetadataService(FakeYoutubeDL(error=ValueError('Private video')),
+                                     cache=TranscriptCache(MemoryTier()))
+    try:
+        service.fetch('metaVideo04')
+        raise AssertionError("실패가 성공으로 바뀌었습니다")
+    except ValueError:
+        pass
+    assert service.get('metaVideo04') == placeholder_info('metaVideo04')
+    assert service.submit('metaVideo04').result(timeout=5)['title'] == 'YouTube Video metaVideo04'
+    print("✅ 성공!")
+
+
+def test_youtubedl_reused_per_thread():
+    print("🧪 스레드마다 YoutubeDL 하나 재사용 테스트 중...")
+    if importlib.util.find_spec('yt_dlp') is None:
+        print("⏭️ yt_dlp 가 설치되지 않아서 건너뜀")
+        return
+    service = MetadataService(cache=TranscriptCache(MemoryTier()))
+    first = service._ydl()
+    assert service._ydl() is first
+    assert first.params['quiet'] and first.params['extractor_args'] == YDL_OPTIONS['extractor_args']
+
+    # YoutubeDL 은 스레드 안전하지 않으므로 다른 스레드는 자기 것을 만든다
+    others = []
+    thread = threading.Thread(target=lambda: others.extend([service._ydl(), service._ydl()]))
+    thread.start()
+    thread.join()
+    assert others[0] is others[1] and others[0] is not first
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_caption_tracks()
+    test_metadata_and_captions_cached()
+    test_failure_placeholder()
+    test_youtubedl_reused_per_thread()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+추출 지표(youtube_core.metrics) 테스트 스크립트
+
+가짜 자막 백엔드를 쓰므로 네트워크 없이 실행된다.
+"""
+
+import re
+
+from youtube_core import metrics
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_core.metrics import MetricsRegistry
+from youtube_core.response import run_extraction
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+# Prometheus 텍스트 형식 0.0.4 의 한 줄: 주석(HELP/TYPE) 또는 `이름{라벨="값",...} 숫자`
+SAMPLE_LINE = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*(\{[a-zA-Z_][a-zA-Z0-9_]*="[^"\\\n]*"'
+                         r'(,[a-zA-Z_][a-zA-Z0-9_]*="[^"\\\n]*")*\})? (-?[0-9.e+-]+|\+Inf|NaN)')
+COMMENT_LINE = re.compile(r'# (HELP [a-zA-Z_:][a-zA-Z0-9_:]* .+|TYPE [a-zA-Z_:][a-zA-Z0-9_:]* (counter|gauge|histogram))')
+
+
+def check_exposition(text):
+    """모든 줄이 형식에 맞고, 지표마다 HELP/TYPE 가 샘플보다 먼저 한 번씩 나오는지 확인"""
+    assert text.endswith('\n')
+    typed = {}
+    for line in text.splitlines():
+        if line.startswith('#'):
+            assert COMMENT_LINE.fullmatch(line), line
+            if line.startswith('# TYPE'):
+                _, _, name, kind = line.split(' ')
+                assert name not in typed, f"TYPE 가 두 번 나왔습니다: {name}"
+                typed[name] = kind
+            continue
+        assert SAMPLE_LINE.fullmatch(line), line
+        name = line.split('{')[0].split(' ')[0]
+        base = re.sub(r'_(bucket|sum|count)$', '', name) if name not in typed else name
+        assert base in typed, f"TYPE 없이 나온 샘플: {line}"
+    return typed
+
+
+def test_render_format():
+    print("🧪 Prometheus 텍스트 형식 테스트 중...")
+    registry = MetricsRegistry()
+    requests = registry.counter('test_requests_total', 'Requests by result', ('result',))
+    latency = registry.histogram('test_seconds', 'Latency', ('stage',), buckets=(0.1, 1.0))
+    registry.register_collector(lambda: [('test_rate', 'gauge', 'Current rate', [({}, 2.5)])])
+    requests.inc('success')
+    requests.inc('success')
+    requests.inc('failure')
+    for seconds in (0.05, 0.5, 3.0):
+        latency.observe(seconds, 'fetch')
+
+    assert registry.render() == '\n'.join([
+        '# HELP test_requests_total Requests by result',
+        '# TYPE test_requests_total counter',
+        'test_requests_total{result="failure"} 1',
+        'test_requests_total{result="success"} 2',
+        '# HELP test_seconds Latency',
+        '# TYPE test_seconds histogram',
+        # 구간 값은 누적, +Inf 는 전체 횟수와 같다
+        'test_seconds_bucket{stage="fetch",le="0.1"} 1',
+        'test_seconds_bucket{stage="fetch",le="1.0"} 2',
+        'test_seconds_bucket{stage="fetch",le="+Inf"} 3',
+        'test_seconds_sum{stage="fetch"} 3.55',
+        'test_seconds_count{stage="fetch"} 3',
+        '# HELP test_rate Current rate',
+        '# TYPE test_rate gauge',
+        'test_rate 2.5',
+    ]) + '\n'
+
+    # 공용 지표 전체(캐시/스케줄러 수집기와 서버 상태 포함)도 형식에 맞는다
+    text = metrics.render({'active': 1, 'queued': 0, 'handled': 5, 'rejected': 0})
+    typed = check_exposition(text)
+    assert typed['yt_stage_seconds'] == 'histogram' and typed['yt_server_rejected_total'] == 'counter'
+    print("✅ 성공!")
+
+
+def sample_value(name):
+    """render() 에서 라벨 없는 샘플 값 (없으면 0)"""
+    for line in metrics.render().splitlines():
+        if line.startswith(name + ' '):
+            return float(line.split(' ')[1])
+    return 0.0
+
+
+def test_record_extraction():
+    print("🧪 추출 지표 기록 테스트 중...")
+    backend = FakeTranscriptBackend({'metricVid01': [make_track('ko', make_entries(30, '지표 자막'))]})
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    successes = metrics.EXTRACTIONS.value('success')
+    count = sample_value('yt_transcript_chars_count')
+    chars = sample_value('yt_transcript_chars_sum')
+
+    assert run_extraction(extractor, 'https://youtu.be/metricVid01')['success']
+    assert metrics.EXTRACTIONS.value('success') == successes + 1
+    # 관측한 글자 수는 항목 텍스트 길이의 합
+    assert sample_value('yt_transcript_chars_count') == count + 1
+    expected = sum(len(entry['text']) for entry in make_entries(30, '지표 자막'))
+    assert sample_value('yt_transcript_chars_sum') - chars == expected
+    print("✅ 성공!")
+
+
+def test_optional_timings():
+    print("🧪 info.timings 선택 테스트 중...")
+    backend = FakeTranscriptBackend({'timingVid01': [make_track('ko', make_entries(3))]})
+    cache = TranscriptCache(MemoryTier())
+
+    def extract(**options):
+        extractor = YouTubeTextExtractor(backend=backend, cache=cache)
+        return run_extraction(extractor, 'https://youtu.be/timingVid01', **options)['info']
+
+    # 기본은 빼고, 요청하면 단계별 소요 시간(ms)을 넣는다
+    assert 'timings' not in extract()
+    timings = extract(timings=True)['timings']
+    assert {'parse', 'transcript', 'format', 'total'} <= set(timings)
+    assert 'timings' not in extract(timings=False, start=1.0)
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_render_format()
+    test_record_extraction()
+    test_optional_timings()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+출력 형식(youtube_core.formats) 테스트 스크립트
+
+이미 받아 온 transcript_data 로 각 형식을 만들므로 네트워크 없이 실행된다.
+"""
+
+import json
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+ENTRIES = [
+    {'text': '안녕하세요', 'start': 0.0, 'duration': 1.5},
+    {'text': '[음악]', 'start': 1.5, 'duration': 2.0},
+    {'text': 'A & B <tag>\n\n두 번째 줄', 'start': 3661.25, 'duration': 2.0},
+]
+
+
+def make_extractor(output_format='text'):
+    extractor = YouTubeTextExtractor(cache=TranscriptCache(MemoryTier()), output_format=output_format)
+    extractor.video_info = {'title': '테스트 영상', 'video_id': 'abc123'}
+    extractor.transcript_language = 'ko'
+    extractor.transcript_data = ENTRIES
+    extractor.format_transcript()
+    return extractor
+
+
+def test_srt_and_vtt():
+    print("🧪 SRT/WebVTT 형식 테스트 중...")
+    extractor = make_extractor('srt')
+
+    srt = extractor.render()
+    assert srt.startswith('1\n00:00:00,000 --> 00:00:01,500\n안녕하세요\n\n')
+    assert '3\n01:01:01,250 --> 01:01:03,250\nA & B <tag>\n두 번째 줄\n\n' in srt
+
+    vtt = extractor.render('vtt')
+    assert vtt.startswith('WEBVTT\n\n00:00:00.000 --> 00:00:01.500\n')
+    assert 'A &amp; B &lt;tag&gt;' in vtt
+    print("✅ 성공!")
+
+
+def test_json_and_markdown():
+    print("🧪 JSON/Markdown 형식 테스트 중...")
+    extractor = make_extractor()
+
+    data = json.loads(extractor.render('json'))
+    assert data['video_id'] == 'abc123' and data['language'] == 'ko'
+    assert [entry['start'] for entry in data['entries']] == [0.0, 1.5, 3661.25]
+
+    markdown = extractor.render('markdown')
+    assert markdown == '# 테스트 영상\n\n## 00:00:00\n\n안녕하세요\n\n## 01:00:00\n\nA & B <tag> 두 번째 줄\n'
+    print("✅ 성공!")
+
+
+def test_streaming_matches_render():
+    print("🧪 스트리밍 writer 테스트 중...")
+    extractor = make_extractor()
+    for name in ('text', 'srt', 'vtt', 'json', 'markdown'):
+        pieces = list(extractor.iter_render(name))
+        assert len(pieces) > 1 or name == 'text'
+        assert ''.join(pieces) == extractor.render(name)
+    assert extractor.render() == extractor.formatted_text
+
+    try:
+        make_extractor('docx')
+        raise AssertionError("지원하지 않는 형식이 허용되었습니다")
+    except ValueError:
+        pass
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_srt_and_vtt()
+    test_json_and_markdown()
+    test_streaming_matches_render()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+메타데이터/자막 동시 조회(youtube_core.pipeline) 테스트 스크립트
+
+메모리에 둔 가짜 자막 백엔드와 가짜 메타데이터 서비스를 쓰므로 네트워크 없이 실행된다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+from youtube_core import pipeline
+from youtube_core.aio import AsyncThreadedBackend
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_core.metadata import placeholder_info
+from youtube_text_extractor import AsyncYouTubeTextExtractor, YouTubeTextExtractor
+
+
+TRANSCRIPTS = {'pipeVideo01': [make_track('ko', make_entries(3, '동시 조회'))]}
+URL = 'https://youtu.be/pipeVideo01'
+
+
+class FakeMetadata:
+    """latency 초 뒤에 정보를 돌려주는(error 면 실패하는) 메타데이터 서비스"""
+
+    def __init__(self, latency=0.0, error=None):
+        self.latency = latency
+        self.error = error
+        self.released = threading.Event()
+
+    def fetch(self, video_id):
+        self.released.wait(self.latency)
+        if self.error:
+            raise self.error
+        return {'title': '가짜 제목', 'channel': '가짜 채널', 'video_id': video_id}
+
+
+def make_extractor(metadata, latency=0.0):
+    return YouTubeTextExtractor(backend=FakeTranscriptBackend(TRANSCRIPTS, latency=latency),
+                                cache=TranscriptCache(MemoryTier()), metadata=metadata)
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def test_concurrent_fetch():
+    print("🧪 메타데이터/자막 동시 조회 테스트 중...")
+    # 자막(목록+자막 0.15초씩)과 메타데이터(0.3초)를 동시에 가져오면 합이 아니라 긴 쪽만큼 걸린다
+    extractor = make_extractor(FakeMetadata(latency=0.3), latency=0.15)
+    success, elapsed = timed(extractor.process_youtube_url, URL)
+    assert success and extractor.video_info['title'] == '가짜 제목'
+    assert elapsed < 0.55, elapsed
+    assert extractor.timings['metadata'] >= 300 and extractor.timings['transcript'] >= 300
+
+    # 메타데이터가 실패하면 기본 정보로 응답
+    extractor = make_extractor(FakeMetadata(error=ValueError('Private video')))
+    assert extractor.process_youtube_url(URL)
+    assert extractor.video_info == placeholder_info('pipeVideo01')
+    assert extractor.timings['metadata'] is not None
+    print("✅ 성공!")
+
+
+def test_metadata_timeout():
+    print("🧪 메타데이터가 늦을 때 기본 정보 테스트 중...")
+    wait = pipeline.METADATA_WAIT
+    pipeline.METADATA_WAIT = 0.2
+    metadata = FakeMetadata(latency=5)
+    try:
+        # METADATA_WAIT 를 넘기면 자막만으로 응답하고 메타데이터는 백그라운드에서 마저 끝난다
+        extractor = make_extractor(metadata)
+        success, elapsed = timed(extractor.process_youtube_url, URL)
+        assert success and elapsed < 1.0, elapsed
+        assert extractor.video_info == placeholder_info('pipeVideo01')
+        assert extractor.timings['metadata'] is None
+        assert extractor.formatted_text == '동시 조회 0 동시 조회 1 동시 조회 2'
+
+        # asyncio 버전도 같다
+        extractor = AsyncYouTubeTextExtractor(backend=AsyncThreadedBackend(FakeTranscriptBackend(TRANSCRIPTS)),
+                                              cache=TranscriptCache(MemoryTier()), metadata=metadata)
+        success, elapsed = timed(asyncio.run, extractor.process_youtube_url(URL))
+        assert success and elapsed < 1.0, elapsed
+        assert extractor.video_info == placeholder_info('pipeVideo01') and extractor.timings['metadata'] is None
+    finally:
+        pipeline.METADATA_WAIT = wait
+        metadata.released.set()
+    print("✅ 성공!")
+
+
+def test_transcript_failure_skips_metadata():
+    print("🧪 자막 실패 시 메타데이터를 기다리지 않는지 테스트 중...")
+    metadata = FakeMetadata(latency=5)
+    try:
+        extractor = make_extractor(metadata)
+        success, elapsed = timed(extractor.process_youtube_url, 'https://youtu.be/missingVid1')
+        assert not success and elapsed < 1.0, elapsed
+        assert 'No transcripts found' in extractor.error_details
+    finally:
+        metadata.released.set()
+    print("✅ 성공!")
+
+
+def test_no_metadata_service_inline():
+    print("🧪 메타데이터 서비스가 없을 때 스레드 풀 없이 기본 정보 테스트 중...")
+
+    def no_executor():
+        raise AssertionError("메타데이터 서비스가 없는데 스레드 풀을 썼습니다")
+
+    get_executor = pipeline._get_executor
+    pipeline._get_executor = no_executor
+    try:
+        extractor = make_extractor(None)
+        assert extractor.process_youtube_url(URL)
+        assert extractor.video_info == placeholder_info('pipeVideo01')
+        assert extractor.video_info['title'] == 'YouTube Video pipeVideo01'
+        assert extractor.timings['metadata'] is not None
+
+        extractor = AsyncYouTubeTextExtractor(backend=AsyncThreadedBackend(FakeTranscriptBackend(TRANSCRIPTS)),
+                                              cache=TranscriptCache(MemoryTier()))
+        assert asyncio.run(extractor.process_youtube_url(URL))
+        assert extractor.video_info == placeholder_info('pipeVideo01')
+        assert not asyncio.run(extractor.process_youtube_url('https://youtu.be/missingVid1'))
+    finally:
+        pipeline._get_executor = get_executor
+    print("✅ 성공!")
+
+
+def test_pipeline_disabled():
+    print("🧪 YT_PIPELINE_DISABLE=1 순차 조회 테스트 중...")
+    previous = os.environ.get('YT_PIPELINE_DISABLE')
+    os.environ['YT_PIPELINE_DISABLE'] = '1'
+    try:
+        metadata = FakeMetadata(latency=0.1)
+        extractor = make_extractor(metadata, latency=0.05)
+        success, elapsed = timed(extractor.process_youtube_url, URL)
+        # 메타데이터 → 자막 순서라 두 시간의 합만큼 걸린다
+        assert success and extractor.video_info['title'] == '가짜 제목'
+        assert elapsed >= 0.2, elapsed
+    finally:
+        if previous is None:
+            os.environ.pop('YT_PIPELINE_DISABLE', None)
+        else:
+            os.environ['YT_PIPELINE_DISABLE'] = previous
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_concurrent_fetch()
+    test_metadata_timeout()
+    test_transcript_failure_skips_metadata()
+    test_no_metadata_service_inline()
+    test_pipeline_disabled()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+자막 구간 선택(youtube_core.ranges, CompactTranscript.between/head_chars) 테스트 스크립트
+"""
+
+from youtube_core.compact import CompactTranscript
+from youtube_core.ranges import parse_range, parse_time, slice_transcript
+
+
+# 텍스트 위치: 하나 [0, 2), 빈 항목 [2, 2), three [2, 7), 넷넷 [7, 9)
+ENTRIES = [
+    {'text': '하나', 'start': 0.0, 'duration': 2.0},
+    {'text': '', 'start': 2.0, 'duration': 1.0},
+    {'text': 'three', 'start': 3.0, 'duration': 2.5},
+    {'text': '넷넷', 'start': 5.5, 'duration': 1.0},
+]
+
+
+def starts(transcript):
+    return list(transcript.starts)
+
+
+def test_between():
+    print("🧪 시간 구간 자르기 테스트 중...")
+    transcript = CompactTranscript.from_entries(ENTRIES)
+    # 정렬되지 않은 자막(전체를 훑는 경로)도 같은 항목을 고른다
+    shuffled = CompactTranscript.from_entries(ENTRIES[2:] + ENTRIES[:2])
+    assert not shuffled.is_sorted
+
+    cases = [
+        ((None, None), [0.0, 2.0, 3.0, 5.5]),
+        ((2.0, 5.5), [2.0, 3.0]),   # start 와 같은 시각은 포함, end 와 같은 시각은 제외
+        ((2.5, None), [3.0, 5.5]),  # 2.0 에 시작해서 3.0 까지 이어지는 항목은 start 전에 시작했으므로 제외
+        ((1.0, 2.0), []),           # 0.0 항목이 걸쳐 있어도 구간 안에서 시작한 항목이 없다
+        ((3.0, 3.0), []),           # 빈 구간
+        ((6.0, 4.0), []),           # end 가 start 보다 앞
+        ((None, 0.0), []),
+        ((100.0, None), []),
+    ]
+    for (start, end), expected in cases:
+        assert starts(transcript.between(start, end)) == expected, (start, end)
+        assert sorted(starts(shuffled.between(start, end))) == expected, (start, end)
+
+    part = transcript.between(2.0, 5.5)
+    assert part.text == 'three' and list(part.offsets) == [0, 0, 5]
+    assert len(transcript.between(1.0, 2.0).text) == 0
+
+    # 앞 구간의 end 를 다음 구간의 start 로 쓰면 모든 항목이 정확히 한 번씩 나온다
+    pages = [transcript.between(start, start + 2.0) for start in (0.0, 2.0, 4.0, 6.0)]
+    assert sum((starts(page) for page in pages), []) == [0.0, 2.0, 3.0, 5.5]
+    print("✅ 성공!")
+
+
+def test_head_chars():
+    print("🧪 글자 수 한도 자르기 테스트 중...")
+    transcript = CompactTranscript.from_entries(ENTRIES)
+    cases = [
+        (1, 1),    # 첫 항목은 한도보다 길어도 포함
+        (2, 2),    # 한도와 딱 맞으면 뒤따르는 빈 항목까지
+        (6, 2),    # 'three' 중간에서 끊기면 그 항목은 빼고
+        (7, 3),
+        (8, 3),
+        (9, 4),
+        (1000, 4),
+    ]
+    for max_chars, count in cases:
+        head = transcript.head_chars(max_chars)
+        assert head.to_list() == ENTRIES[:count], max_chars
+    assert len(CompactTranscript.from_entries([]).head_chars(10)) == 0
+
+    # 잘라 낸 구간에서도 그 구간의 첫 글자부터 센다
+    assert transcript.between(3.0, None).head_chars(5).to_list() == ENTRIES[2:3]
+    print("✅ 성공!")
+
+
+def test_slice_transcript():
+    print("🧪 구간 정보와 이어 받기 테스트 중...")
+    assert slice_transcript(ENTRIES) == (ENTRIES, None)
+
+    part, info = slice_transcript(ENTRIES, max_chars=6)
+    assert part.to_list() == ENTRIES[:2]
+    assert info == {'start': None, 'end': None, 'max_chars': 6, 'total_subtitles': 4,
+                    'truncated': True, 'next_start': 3.0}
+
+    # next_start 를 다음 요청의 start 로 넘기면 이어서 받는다
+    part, info = slice_transcript(ENTRIES, start=info['next_start'], max_chars=6)
+    assert part.to_list() == ENTRIES[2:3] and info['next_start'] == 5.5
+    part, info = slice_transcript(ENTRIES, start='00:05.5', max_chars=6)
+    assert part.to_list() == ENTRIES[3:] and not info['truncated'] and info['next_start'] is None
+
+    part, info = slice_transcript(ENTRIES, start='0:02', end='0:05.5')
+    assert part.to_list() == ENTRIES[1:3] and (info['start'], info['end']) == (2.0, 5.5)
+    part, info = slice_transcript(ENTRIES, start=60)
+    assert len(part) == 0 and info['total_subtitles'] == 4 and not info['truncated']
+    print("✅ 성공!")
+
+
+def test_parse_range():
+    print("🧪 구간 입력 검증 테스트 중...")
+    assert parse_time(None) is None and parse_time('') is None
+    assert parse_time(90) == 90.0 and parse_time('1:30') == 90.0 and parse_time('01:00:01.5') == 3601.5
+    assert parse_range({}) == {}
+    assert parse_range({'start': '10:00', 'end': '25:00', 'max_chars': '5000'}) == {
+        'start': 600.0, 'end': 1500.0, 'max_chars': 5000}
+    for data in ({'start': '1:2:3:4'}, {'start': 'abc'}, {'start': -1}, {'start': True}, {'start': 'nan'},
+                 {'start': 10, 'end': 10}, {'start': 10, 'end': 5}, {'max_chars': 0}, {'max_chars': 'x'}):
+        try:
+            parse_range(data)
+            raise AssertionError(f"잘못된 구간이 허용되었습니다: {data}")
+        except ValueError:
+            pass
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_between()
+    test_head_chars()
+    test_slice_transcript()
+    test_parse_range()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+유튜브 요청 스케줄러(youtube_core.scheduler) 테스트 스크립트
+
+가짜 시계와 가짜 예외를 쓰므로 실제로 기다리거나 네트워크에 연결하지 않는다.
+"""
+
+import threading
+
+from youtube_core.ratelimit import TokenBucket
+from youtube_core.scheduler import (
+    BLOCKED, FATAL, RETRY, THROTTLED, CircuitBreaker, CircuitOpenError, OutboundScheduler, classify_error
+)
+
+
+class FakeClock:
+    """sleep 하면 시간만 앞으로 가는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def named_error(name, message='', **attributes):
+    """라이브러리 예외와 이름/속성만 같은 가짜 예외"""
+    error = type(name, (Exception,), {})(message)
+    for key, value in attributes.items():
+        setattr(error, key, value)
+    return error
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def test_classify_error():
+    print("🧪 실패 분류 테스트 중...")
+    cases = [
+        (named_error('TooManyRequests'), THROTTLED),
+        (named_error('HTTPError', status=429), THROTTLED),
+        (named_error('HTTPError', response=FakeResponse(429)), THROTTLED),
+        (Exception('HTTP Error 429: Too Many Requests'), THROTTLED),
+        (named_error('RequestBlocked'), BLOCKED),
+        (named_error('IpBlocked'), BLOCKED),
+        (named_error('HTTPError', response=FakeResponse(503)), RETRY),
+        (ConnectionResetError('reset'), RETRY),
+        (TimeoutError(), RETRY),
+        (named_error('ReadTimeout'), RETRY),
+        (named_error('YouTubeRequestFailed', '500 Server Error'), RETRY),
+        (named_error('HTTPError', response=FakeResponse(404)), FATAL),
+        (named_error('NoTranscriptFound'), FATAL),
+        # 영상 ID 에 든 '429' 는 429 응답이 아니다
+        (named_error('TranscriptsDisabled', 'Subtitles are disabled for this video: ab429cdEFgh'), FATAL),
+        (named_error('NoTranscriptFound', 'https://www.youtube.com/watch?v=ab429cdEFgh'), FATAL),
+        (ValueError('video ab429cdEFgh'), FATAL),
+        (ValueError('bad'), FATAL),
+    ]
+    for error, kind in cases:
+        assert classify_error(error) == kind, (error, kind)
+    print("✅ 성공!")
+
+
+def make_scheduler(clock, **options):
+    options.setdefault('burst', 1000)
+    return OutboundScheduler(clock=clock, sleep=clock.sleep, **options)
+
+
+def failing(errors):
+    """errors 를 차례로 던지고 다 쓰면 'ok' 를 돌려주는 함수와 호출 횟수"""
+    calls = []
+
+    def func():
+        calls.append(None)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return 'ok'
+    return func, calls
+
+
+def test_retry_and_backoff():
+    print("🧪 재시도/백오프 테스트 중...")
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_retries=3, base_delay=1.0, max_delay=3.0)
+
+    # 일시적인 실패는 다시 시도해서 성공
+    func, calls = failing([ConnectionError(), TimeoutError()])
+    assert scheduler.call(func) == 'ok' and len(calls) == 3
+    # 대기 시간은 base_delay * 2^attempt 와 max_delay 중 작은 값 이하 (full jitter)
+    assert len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= 2.0 and 0 <= clock.sleeps[1] <= 3.0
+
+    # max_retries 번까지만 다시 시도
+    func, calls = failing([ConnectionError()] * 10)
+    try:
+        scheduler.call(func)
+        raise AssertionError("재시도 한도를 넘었는데 성공했습니다")
+    except ConnectionError:
+        pass
+    assert len(calls) == 4
+    assert all(0 <= seconds <= 3.0 for seconds in clock.sleeps)
+
+    # 자막 없음 같은 실패는 바로 던진다
+    func, calls = failing([named_error('NoTranscriptFound')])
+    try:
+        scheduler.call(func)
+        raise AssertionError("실패가 성공으로 바뀌었습니다")
+    except Exception as e:
+        assert type(e).__name__ == 'NoTranscriptFound'
+    assert len(calls) == 1
+
+    stats = scheduler.stats()
+    assert (stats['calls'], stats['successes'], stats['failures'], stats['retries']) == (8, 1, 2, 5)
+    assert stats['circuit']['state'] == 'closed'  # 재시도 뒤 성공과 FATAL 은 연속 실패를 지운다
+    print("✅ 성공!")
+
+
+def test_rate_adaptation():
+    print("🧪 429 속도 조절 테스트 중...")
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, rate=4.0, min_rate=1.0, max_retries=0)
+    for expected in (2.0, 1.0, 1.0):
+        func, _ = failing([named_error('TooManyRequests')])
+        try:
+            scheduler.call(func)
+        except Exception:
+            pass
+        assert scheduler.bucket.rate == expected  # 절반씩, min_rate 아래로는 안 내려간다
+    for _ in range(25):
+        scheduler.call(lambda: None)
+    assert scheduler.bucket.rate == 4.0  # 성공마다 최대 속도의 5%씩, max_rate 를 넘지 않는다
+    assert scheduler.stats()['throttled'] == 3
+
+    # 여러 스레드가 동시에 바꿔도 더한 만큼 그대로 남는다
+    bucket = TokenBucket(0.0, 1)
+    threads = [threading.Thread(target=lambda: [bucket.adjust_rate(lambda rate: rate + 1) for _ in range(1000)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bucket.rate == 8000.0
+    print("✅ 성공!")
+
+
+def test_circuit_breaker():
+    print("🧪 회로 차단기 상태 전이 테스트 중...")
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, max_reset_timeout=30.0, clock=clock)
+
+    def rejected():
+        try:
+            breaker.before_call()
+        except CircuitOpenError as e:
+            return e.retry_after
+        return None
+
+    # CLOSED → OPEN: 연속 실패가 failure_threshold 번 쌓이면
+    breaker.record_failure(RETRY)
+    assert breaker.state == CircuitBreaker.CLOSED and rejected() is None
+    breaker.record_failure(RETRY)
+    assert breaker.state == CircuitBreaker.OPEN and rejected() == 10.0
+
+    # OPEN → HALF_OPEN: reset_timeout 이 지나면 확인 요청 하나만 보낸다
+    clock.now += 9.9
+    assert rejected() is not None
+    clock.now += 0.1
+    assert rejected() is None and breaker.state == CircuitBreaker.HALF_OPEN
+    assert rejected() == 0.0  # 확인 요청이 끝나기 전의 다른 요청
+
+    # HALF_OPEN → OPEN: 확인 요청이 실패하면 reset_timeout 을 두 배로 (max_reset_timeout 까지)
+    for expected in (20.0, 30.0, 30.0):
+        breaker.record_failure(RETRY)
+        assert breaker.state == CircuitBreaker.OPEN and breaker.reset_timeout == expected
+        assert rejected() == expected
+        clock.now += expected
+        assert rejected() is None
+
+    # HALF_OPEN → CLOSED: 확인 요청이 성공하면 닫고 reset_timeout 을 원래대로
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.reset_timeout == 10.0 and breaker.failures == 0
+    assert breaker.stats() == {'state': 'closed', 'failures': 0, 'trips': 4, 'retry_after': 0.0}
+
+    # 차단은 한 번에 연다
+    breaker.record_failure(BLOCKED)
+    assert breaker.state == CircuitBreaker.OPEN
+    print("✅ 성공!")
+
+
+def test_scheduler_rejects_when_open():
+    print("🧪 회로가 열렸을 때 요청 거절 테스트 중...")
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5.0, clock=clock)
+    scheduler = make_scheduler(clock, breaker=breaker, max_retries=3)
+
+    func, calls = failing([named_error('RequestBlocked')])
+    try:
+        scheduler.call(func)
+        raise AssertionError("차단이 성공으로 바뀌었습니다")
+    except Exception as e:
+        assert type(e).__name__ == 'RequestBlocked'
+    assert len(calls) == 1 and clock.sleeps == []  # 차단은 다시 시도하지 않는다
+
+    try:
+        scheduler.call(func)
+        raise AssertionError("회로가 열렸는데 요청했습니다")
+    except CircuitOpenError:
+        pass
+    assert len(calls) == 1 and scheduler.stats()['rejected'] == 1
+
+    clock.now += 5.0
+    assert scheduler.call(func) == 'ok' and breaker.state == CircuitBreaker.CLOSED
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_classify_error()
+    test_retry_and_backoff()
+    test_rate_adaptation()
+    test_circuit_breaker()
+    test_scheduler_rejects_when_open()
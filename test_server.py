@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+독립 실행 HTTP 서버(youtube_core.server) 테스트 스크립트
+
+추출 대신 신호를 받을 때까지 기다리는 가짜 handler 로 0번 포트(빈 포트)에 띄우므로 네트워크 없이 실행된다.
+"""
+
+import http.client
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from youtube_core.server import ExtractHTTPServer, make_keepalive_handler
+
+
+class BlockingHandler(BaseHTTPRequestHandler):
+    """release 가 설정될 때까지 응답하지 않는 handler"""
+
+    release = threading.Event()
+
+    def do_GET(self):
+        self.release.wait(10)
+        body = self.path.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(workers, max_queue):
+    BlockingHandler.release = threading.Event()
+    server = ExtractHTTPServer(('127.0.0.1', 0), make_keepalive_handler(BlockingHandler), workers=workers,
+                               max_queue=max_queue)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def request_in_background(server, path, results):
+    """path 를 GET 하고 (상태 코드, 본문)을 results[path] 에 담는 스레드"""
+    def run():
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=10)
+        conn.request('GET', path)
+        response = conn.getresponse()
+        results[path] = (response.status, response.read())
+        conn.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "기다리던 상태가 되지 않았습니다"
+        time.sleep(0.01)
+
+
+def test_busy_503():
+    print("🧪 대기열이 가득 찼을 때 503 테스트 중...")
+    server = start_server(workers=1, max_queue=1)
+    results = {}
+    try:
+        # 워커 하나가 /a 를 처리하는 동안 /b 가 대기열을 채운다
+        threads = [request_in_background(server, '/a', results)]
+        wait_for(lambda: server.stats()['active'] == 1)
+        threads.append(request_in_background(server, '/b', results))
+        wait_for(lambda: server.stats()['queued'] == 1)
+
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=10)
+        conn.request('GET', '/c')
+        response = conn.getresponse()
+        assert response.status == 503 and response.getheader('Retry-After') == '5'
+        assert '요청이 많아' in response.read().decode('utf-8')
+        conn.close()
+        assert server.stats()['rejected'] == 1
+
+        # 자리가 나면 기다리던 요청도 처리된다
+        BlockingHandler.release.set()
+        for thread in threads:
+            thread.join(10)
+        assert results == {'/a': (200, b'/a'), '/b': (200, b'/b')}
+    finally:
+        BlockingHandler.release.set()
+        server.graceful_shutdown(timeout=5)
+    print("✅ 성공!")
+
+
+def test_graceful_shutdown():
+    print("🧪 종료 때 진행 중인 요청 마치기 테스트 중...")
+    server = start_server(workers=2, max_queue=4)
+    results = {}
+    threads = [request_in_background(server, path, results) for path in ('/slow1', '/slow2')]
+    wait_for(lambda: server.stats()['active'] == 2)
+
+    shutdown = threading.Thread(target=server.graceful_shutdown, kwargs={'timeout': 10}, daemon=True)
+    shutdown.start()
+    wait_for(lambda: server.draining)
+    time.sleep(0.1)
+    # 진행 중인 요청이 끝날 때까지 종료하지 않는다
+    assert shutdown.is_alive() and results == {}
+
+    BlockingHandler.release.set()
+    shutdown.join(10)
+    assert not shutdown.is_alive()
+    for thread in threads:
+        thread.join(10)
+    assert results == {'/slow1': (200, b'/slow1'), '/slow2': (200, b'/slow2')}
+    stats = server.stats()
+    assert (stats['active'], stats['queued'], stats['handled']) == (0, 0, 2) and stats['draining']
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_busy_503()
+    test_graceful_shutdown()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+스트리밍 응답(youtube_core.streaming) 테스트 스크립트
+
+메모리에 둔 가짜 자막 백엔드를 쓰므로 네트워크 없이 실행된다.
+"""
+
+import json
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import FakeTranscriptBackend, make_entries, make_track
+from youtube_core.streaming import encode_ndjson, encode_sse, iter_chunks, iter_extraction_events
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+TRANSCRIPTS = {'streamVid01': [make_track('ko', make_entries(50, '스트리밍 자막'))]}
+
+
+def make_extractor(**options):
+    return YouTubeTextExtractor(backend=FakeTranscriptBackend(TRANSCRIPTS), cache=TranscriptCache(MemoryTier()),
+                                **options)
+
+
+def test_iter_chunks():
+    print("🧪 조각 묶기 테스트 중...")
+    assert list(iter_chunks(['ab', 'cd', 'e', 'fgh'], chunk_chars=3)) == ['abcd', 'efgh']
+    assert list(iter_chunks(['ab', 'c'], chunk_chars=10)) == ['abc']
+    assert list(iter_chunks([])) == []
+    print("✅ 성공!")
+
+
+def test_event_order():
+    print("🧪 스트리밍 이벤트 순서 테스트 중...")
+    events = list(iter_extraction_events(make_extractor(), 'https://youtu.be/streamVid01', chunk_chars=100))
+    types = [event['type'] for event in events]
+    # info 하나 → chunk 여러 개 → done 하나
+    assert types[0] == 'info' and types[-1] == 'done' and set(types[1:-1]) == {'chunk'} and len(types) > 3
+    assert events[0]['info']['subtitle_count'] == 50 and 'timings' not in events[0]['info']
+
+    # 조각을 이어 붙이면 일반 응답의 text 와 같다
+    text = ''.join(event['text'] for event in events[1:-1])
+    extractor = make_extractor()
+    assert extractor.process_youtube_url('https://youtu.be/streamVid01')
+    assert text == extractor.formatted_text
+    assert events[-1] == {'type': 'done', 'subtitle_count': 50, 'chars': len(text)}
+
+    # 구간/형식을 지정하면 그 부분만, timings=True 면 info 에 단계별 시간
+    events = list(iter_extraction_events(make_extractor(output_format='srt'), 'https://youtu.be/streamVid01',
+                                         start=10, end=20, timings=True))
+    assert events[0]['info']['range']['total_subtitles'] == 50 and 'transcript' in events[0]['info']['timings']
+    assert events[-1]['subtitle_count'] == 5 and events[1]['text'].startswith('1\n00:00:10,000 --> ')
+    print("✅ 성공!")
+
+
+class BrokenExtractor(YouTubeTextExtractor):
+    def extract_video_id(self, url):
+        raise RuntimeError('parser exploded')
+
+
+def test_error_events():
+    print("🧪 스트리밍 실패 이벤트 테스트 중...")
+    cases = [
+        (make_extractor(), 'https://example.com/x', '올바른 유튜브 URL이 아닙니다'),
+        (make_extractor(), 'https://youtu.be/missingVid1', 'No transcripts found for this video'),
+        (BrokenExtractor(backend=FakeTranscriptBackend(TRANSCRIPTS), cache=TranscriptCache(MemoryTier())),
+         'https://youtu.be/streamVid01', '오류가 발생했습니다: parser exploded'),
+    ]
+    for extractor, url, error in cases:
+        # 실패하면 info/chunk 없이 error 이벤트 하나로 끝난다
+        events = list(iter_extraction_events(extractor, url))
+        assert events == [{'type': 'error', 'error': error}], events
+
+    # 지정한 구간에 자막이 없을 때
+    events = list(iter_extraction_events(make_extractor(), 'https://youtu.be/streamVid01', start=1000))
+    assert events == [{'type': 'error', 'error': '지정한 구간에 자막이 없습니다'}]
+    print("✅ 성공!")
+
+
+def test_encoding():
+    print("🧪 NDJSON/SSE 인코딩 테스트 중...")
+    event = {'type': 'chunk', 'text': '줄\n바꿈'}
+    line = encode_ndjson(event)
+    assert line.endswith(b'\n') and line.count(b'\n') == 1 and json.loads(line) == event
+    message = encode_sse(event).decode('utf-8')
+    assert message.startswith('event: chunk\ndata: ') and message.endswith('\n\n')
+    assert json.loads(message.split('data: ', 1)[1]) == event
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_iter_chunks()
+    test_event_order()
+    test_error_events()
+    test_encoding()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+yt_dlp 자막 백엔드(youtube_core.subtitles) 테스트 스크립트
+
+메타데이터 서비스 대신 자막 트랙 목록/파일을 메모리에서 돌려주는 객체를 써서 네트워크 없이 실행된다.
+"""
+
+import json
+
+from youtube_core.backends import FallbackTranscriptBackend, create_backend
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.fake_server import make_entries, make_track
+from youtube_core.subtitles import YtDlpSubtitleBackend, parse_json3, parse_vtt
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+TRANSCRIPTS = {
+    'koVideo0001': [
+        make_track('en', make_entries(3, 'hello')),
+        make_track('ko', make_entries(3, '안녕하세요'), is_generated=True),
+        make_track('ko', make_entries(3, '수동 자막')),
+    ],
+}
+
+
+JSON3 = json.dumps({'events': [
+    {'tStartMs': 0, 'dDurationMs': 1500, 'segs': [{'utf8': '예비 '}, {'utf8': '자막'}]},
+    {'tStartMs': 1500, 'dDurationMs': 10, 'aAppend': 1, 'segs': [{'utf8': '\n'}]},
+    {'tStartMs': 2000, 'dDurationMs': 1000, 'segs': [{'utf8': '두 번째'}]},
+]}).encode('utf-8')
+
+ROLLING_VTT = """WEBVTT
+Kind: captions
+
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+hello<00:00:00.500><c> world</c>
+
+00:00:02.000 --> 00:00:04.000 align:start position:0%
+hello world
+again &amp; again
+"""
+
+
+class CaptionSource:
+    """MetadataService 의 자막 트랙 목록/파일 받기만 흉내 내는 객체"""
+
+    def __init__(self, captions, files):
+        self.captions_by_video = captions
+        self.files = files
+
+    def captions(self, video_id):
+        return self.captions_by_video.get(video_id, [])
+
+    def download(self, url):
+        return self.files[url]
+
+
+def test_yt_dlp_fallback():
+    print("🧪 yt_dlp 예비 백엔드 테스트 중...")
+    assert parse_json3(JSON3) == [
+        {'text': '예비 자막', 'start': 0.0, 'duration': 1.5},
+        {'text': '두 번째', 'start': 2.0, 'duration': 1.0},
+    ]
+    assert [(e['text'], e['start']) for e in parse_vtt(ROLLING_VTT)] == [('hello world', 0.0), ('again & again', 2.0)]
+
+    source = CaptionSource(
+        {'ytdlpVideo1': [{'language_code': 'ko', 'language': 'Korean', 'is_generated': True,
+                          'formats': {'json3': 'mem://ko.json3', 'vtt': 'mem://ko.vtt'}}]},
+        {'mem://ko.json3': JSON3}
+    )
+    backend = FallbackTranscriptBackend([create_backend('fake', transcripts=TRANSCRIPTS), YtDlpSubtitleBackend(source)])
+
+    # 앞 백엔드에 있는 영상은 그대로, 없는 영상은 yt_dlp 자막 트랙으로
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    assert extractor.process_youtube_url('https://youtu.be/koVideo0001')
+    assert extractor.formatted_text == '수동 자막 0 수동 자막 1 수동 자막 2'
+
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    assert extractor.process_youtube_url('https://youtu.be/ytdlpVideo1'), extractor.error_details
+    assert extractor.formatted_text == '예비 자막 두 번째' and extractor.round_trips == 2
+
+    # 모두 실패하면 첫 번째 백엔드의 오류
+    extractor = YouTubeTextExtractor(backend=backend, cache=TranscriptCache(MemoryTier()))
+    assert not extractor.process_youtube_url('https://youtu.be/missing0001')
+    assert extractor.error_details == 'No transcripts found for this video'
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_yt_dlp_fallback()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+URL 정규화(youtube_core.urls) 테스트 스크립트
+"""
+
+from youtube_core.cache import MemoryTier, TranscriptCache
+from youtube_core.urls import normalize_batch, parse_video_id
+from youtube_text_extractor import YouTubeTextExtractor
+
+
+def test_url_normalization():
+    print("🧪 URL 정규화 테스트 중...")
+    for url in ['https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+                'youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42s',
+                'https://youtu.be/dQw4w9WgXcQ?si=AbCd',
+                'https://m.youtube.com/watch?v=dQw4w9WgXcQ',
+                'https://music.youtube.com/watch?v=dQw4w9WgXcQ&list=RDdQw4w9WgXcQ',
+                'https://www.youtube-nocookie.com/embed/dQw4w9WgXcQ?start=3',
+                'https://www.youtube.com/shorts/dQw4w9WgXcQ',
+                'https://www.youtube.com/live/dQw4w9WgXcQ?feature=share',
+                'HTTPS://WWW.YouTube.com/watch?v=dQw4w9WgXcQ',
+                '링크: youtu.be/dQw4w9WgXcQ',
+                'https://evil.com/youtube.com/shorts/xxxxxxxxxxx https://youtu.be/dQw4w9WgXcQ']:
+        assert parse_video_id(url) == 'dQw4w9WgXcQ', url
+    for text in ['', 'https://youtu.be/dQw4w9WgXc', 'https://www.youtube.com/watch?v=dQw4w9WgXcQQ',
+                 'https://example.com/watch?v=dQw4w9WgXcQ', 'https://www.youtube.com/watch?list=PL01', 'dQw4w9WgXcQX',
+                 # 다른 주소의 경로/파라미터 안에 든 유튜브 주소
+                 'https://evil.com/youtube.com/shorts/dQw4w9WgXcQ', 'example.com/?r=youtu.be/dQw4w9WgXcQ',
+                 'https://notyoutube.com/watch?v=dQw4w9WgXcQ', 'https://evil-youtube.com/watch?v=dQw4w9WgXcQ',
+                 # 주소 없이 적은 ID는 기본으로 거절
+                 'helloworld1', ' "dQw4w9WgXcQ" ']:
+        assert parse_video_id(text) is None, text
+    assert parse_video_id(' "dQw4w9WgXcQ" ', allow_bare_id=True) == 'dQw4w9WgXcQ'
+    assert parse_video_id('ID는 dQw4w9WgXcQ', allow_bare_id=True) is None  # 입력 전체가 ID여야 한다
+    assert YouTubeTextExtractor(cache=TranscriptCache(MemoryTier())).extract_video_id('helloworld1') is None
+
+    lines = ['https://youtu.be/dQw4w9WgXcQ', 'not a url', 'jNQXAC9IVRw', '',
+             'https://www.youtube.com/shorts/dQw4w9WgXcQ', ' https://youtu.be/short ']
+    video_ids, rejects = normalize_batch(lines)
+    assert video_ids == ['dQw4w9WgXcQ']
+    assert rejects == [(1, 'not a url'), (2, 'jNQXAC9IVRw'), (3, ''), (5, 'https://youtu.be/short')]
+    video_ids, rejects = normalize_batch(lines, allow_bare_id=True)
+    assert video_ids == ['dQw4w9WgXcQ', 'jNQXAC9IVRw']
+    assert rejects == [(1, 'not a url'), (3, ''), (5, 'https://youtu.be/short')]
+    print("✅ 성공!")
+
+
+if __name__ == "__main__":
+    test_url_normalization()
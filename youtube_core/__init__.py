@@ -0,0 +1,17 @@
+"""
+YouTube 자막 추출기 공용 모듈
+
+루트 youtube_text_extractor.py, extract_api.py, api/ 아래 핸들러가 함께 쓰는 기능을 모은다.
+추출기는 youtube_core.extractor, 자막 백엔드 등록/생성은 youtube_core.backends 에 있다.
+"""
+
+from .cache import TranscriptCache, MemoryTier, SQLiteTier, get_default_cache
+from .entries import normalize_entries
+
+__all__ = [
+    'TranscriptCache',
+    'MemoryTier',
+    'SQLiteTier',
+    'get_default_cache',
+    'normalize_entries',
+]
@@ -0,0 +1,255 @@
+"""
+asyncio 자막 백엔드
+
+AsyncYouTubeTextExtractor 가 쓰는 비동기 백엔드.
+    - AsyncConnectionPool: keep-alive HTTP/1.1 연결 풀 (asyncio 스트림 기반)
+    - AsyncHttpTranscriptBackend: JSON 자막 서버(fake_server 등)를 연결 풀로 호출
+    - AsyncThreadedBackend: 동기 백엔드(youtube_transcript_api)를 공용 스레드 풀에서 실행 (기본 백엔드)
+
+AsyncHttpTranscriptBackend 의 요청은 취소하면 바로 멈춘다 - 사용 중이던 연결은 풀로 돌려주지 않고 닫는다.
+AsyncThreadedBackend 는 취소해도 기다리던 코루틴만 끝나고 이미 시작한 스레드의 요청은 끝까지 간다.
+
+asyncio 의 연결과 Semaphore 는 만든 이벤트 루프에서만 쓸 수 있으므로 연결 풀은 루프마다 따로 상태를 둔다
+(asyncio.run 을 여러 번 부르거나 스레드마다 루프를 돌려도 같은 백엔드를 쓸 수 있다).
+"""
+
+import asyncio
+import json
+import ssl
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+from .backends import HttpError, Track, get_default_backend
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class _LoopState:
+    """이벤트 루프 하나의 유휴 연결과 호스트별 동시 연결 제한"""
+
+    __slots__ = ('idle', 'limits')
+
+    def __init__(self):
+        self.idle = defaultdict(deque)
+        self.limits = {}
+
+
+class AsyncConnectionPool:
+    """호스트별 keep-alive 연결 풀 (이벤트 루프마다 따로)"""
+
+    def __init__(self, max_connections_per_host=32, timeout=30.0):
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.opened = 0
+        self.reused = 0
+        # 이벤트 루프 -> _LoopState
+        self._loops = {}
+        self._loops_lock = threading.Lock()
+        self._ssl_context = None
+
+    def _state(self):
+        loop = asyncio.get_running_loop()
+        with self._loops_lock:
+            state = self._loops.get(loop)
+            if state is None:
+                # 닫힌 루프의 연결은 더 쓸 수 없으므로 버린다 (새 루프가 처음 쓸 때 한 번만 확인)
+                for closed in [other for other in self._loops if other.is_closed()]:
+                    del self._loops[closed]
+                state = self._loops[loop] = _LoopState()
+            return state
+
+    def _limit(self, state, key):
+        limit = state.limits.get(key)
+        if limit is None:
+            limit = state.limits[key] = asyncio.Semaphore(self.max_connections_per_host)
+        return limit
+
+    async def _open(self, scheme, host, port):
+        ssl_context = None
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    async def _read_response(self, conn):
+        status_line = await conn.reader.readline()
+        if not status_line:
+            raise ConnectionResetError('서버가 연결을 닫았습니다')
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await conn.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await conn.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await conn.reader.readline()
+                    break
+                chunks.append(await conn.reader.readexactly(size))
+                await conn.reader.readline()
+            body = b''.join(chunks)
+        elif 'content-length' in headers:
+            body = await conn.reader.readexactly(int(headers['content-length']))
+        else:
+            body = await conn.reader.read()
+            headers['connection'] = 'close'
+
+        return status, headers, body
+
+    async def request(self, url, method='GET', headers=None):
+        """요청을 보내고 (status, headers, body) 반환"""
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {parts.netloc}', 'Connection: keep-alive']
+        for name, value in (headers or {}).items():
+            lines.append(f'{name}: {value}')
+        raw_request = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+        state = self._state()
+        async with self._limit(state, key):
+            idle = state.idle[key]
+            while True:
+                reused = bool(idle)
+                conn = idle.pop() if reused else await self._open(scheme, parts.hostname, port)
+                keep = False
+                try:
+                    conn.writer.write(raw_request)
+                    await conn.writer.drain()
+                    status, response_headers, body = await asyncio.wait_for(
+                        self._read_response(conn), self.timeout
+                    )
+                    keep = response_headers.get('connection', '').lower() != 'close'
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # 서버가 닫아버린 유휴 연결이면 새 연결로 한 번 더 시도
+                    if reused:
+                        continue
+                    raise
+                finally:
+                    if keep:
+                        idle.append(conn)
+                    else:
+                        conn.close()
+
+                if reused:
+                    self.reused += 1
+                return status, response_headers, body
+
+    async def get_json(self, url):
+        status, _, body = await self.request(url, headers={'Accept': 'application/json'})
+        data = json.loads(body.decode('utf-8')) if body else {}
+        if status >= 400:
+            raise HttpError(status, data.get('error', f'HTTP {status}'))
+        return data
+
+    def stats(self):
+        with self._loops_lock:
+            states = [state for loop, state in self._loops.items() if not loop.is_closed()]
+        idle = sum(len(connections) for state in states for connections in state.idle.values())
+        return {'opened': self.opened, 'reused': self.reused, 'idle': idle}
+
+    async def close(self):
+        """지금 이벤트 루프의 유휴 연결 닫기 (닫힌 루프의 연결은 다음 루프가 풀을 쓸 때 버린다)"""
+        loop = asyncio.get_running_loop()
+        with self._loops_lock:
+            state = self._loops.pop(loop, None)
+        if state is None:
+            return
+        for connections in state.idle.values():
+            while connections:
+                connections.pop().close()
+
+
+class AsyncHttpTranscriptBackend:
+    """JSON 자막 서버 백엔드
+
+    GET {base_url}/transcripts/{video_id}
+        -> {"tracks": [{"language_code", "language", "is_generated"}, ...]}
+    GET {base_url}/transcripts/{video_id}/{language_code}?generated=0|1
+        -> {"entries": [{"text", "start", "duration"}, ...]}
+    """
+
+    fetch_requires_listing = False
+
+    def __init__(self, base_url, pool=None):
+        self.base_url = base_url.rstrip('/')
+        self.pool = pool if pool is not None else AsyncConnectionPool()
+
+    async def list_tracks(self, video_id):
+        data = await self.pool.get_json(f'{self.base_url}/transcripts/{quote(video_id)}')
+        return [
+            Track(t['language_code'], t.get('language', ''), t.get('is_generated', False))
+            for t in data.get('tracks', [])
+        ]
+
+    async def fetch(self, video_id, track):
+        generated = '1' if track.is_generated else '0'
+        data = await self.pool.get_json(
+            f'{self.base_url}/transcripts/{quote(video_id)}/{quote(track.language_code)}?generated={generated}'
+        )
+        return data.get('entries', [])
+
+    async def close(self):
+        await self.pool.close()
+
+
+class AsyncThreadedBackend:
+    """동기 백엔드를 공용 스레드 풀에서 실행하는 비동기 래퍼
+
+    취소해도 요청은 멈추지 않는다 - 기다리던 코루틴은 즉시 끝나지만, 이미 시작된 스레드 작업은
+    끝까지 실행되고 스레드 풀 자리도 그때까지 차지한다. 아직 시작하지 않은 작업만 실행되지 않는다.
+    """
+
+    def __init__(self, backend, max_workers=32):
+        self.backend = backend
+        self.fetch_requires_listing = backend.fetch_requires_listing
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='transcript')
+
+    async def list_tracks(self, video_id):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.backend.list_tracks, video_id)
+
+    async def fetch(self, video_id, track):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.backend.fetch, video_id, track)
+
+    async def close(self):
+        pass
+
+
+_default_async_backend = None
+_default_async_backend_lock = threading.Lock()
+
+
+def get_default_async_backend():
+    """youtube_transcript_api 를 감싼 프로세스 공용 비동기 백엔드"""
+    global _default_async_backend
+
+    with _default_async_backend_lock:
+        if _default_async_backend is None:
+            _default_async_backend = AsyncThreadedBackend(get_default_backend())
+        return _default_async_backend
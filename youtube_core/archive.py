@@ -0,0 +1,356 @@
+"""
+자막 보관소
+
+한 번 가져온 자막(시간 정보 포함)과 비디오 정보를 SQLite 파일에 영구히 저장하고 전문 검색한다.
+    - 캐시와 달리 만료되지 않는다. 보관된 영상은 다음 추출 때 네트워크 요청 없이 바로 돌려준다
+    - 자막 문장은 FTS5 색인(segments)에 넣어 수만 개 영상에서도 밀리초 단위로 검색한다
+    - 검색어는 단어 앞부분으로 찾는다 ('자막' 은 '자막을', '자막이' 와도 맞는다)
+
+테이블
+    videos       video_id, 비디오 정보, 자막 트랙 목록
+    transcripts  (video_id, language_code, is_generated) 별 자막 항목 JSON
+    segments     FTS5 - 자막 문장, 시작 시각/길이(ms)
+    segment_ranges  자막(transcripts.id)별 segments rowid 범위 - 다시 보관할 때 rowid 로 지운다
+    sources        채널/재생목록 크롤러(youtube_core.crawler)의 소스별 워터마크
+    source_videos  (소스, video_id) 별 크롤링 상태 (pending, ok, unavailable, error)와 시도 횟수
+
+YT_ARCHIVE_PATH 를 지정하면 모든 추출기가 공용 보관소를 쓴다 (youtube_core.resolver, youtube_core.pipeline).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .backends import Track
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_LIMIT = 20
+# 영상 하나에서 돌려줄 최대 일치 수
+DEFAULT_MATCHES_PER_VIDEO = 5
+
+
+def build_match_query(query):
+    """검색어를 FTS5 MATCH 식으로 변환 (단어마다 앞부분 일치, 모두 포함)"""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return ' '.join(f'"{term}"*' for term in terms if term)
+
+
+def store_quietly(method, video_id, *args):
+    """보관소 저장 (archive.put_* 호출) - 실패해도(잠긴 파일, 디스크 부족 등) 이미 받은 결과로 응답하도록 기록만 남긴다"""
+    try:
+        method(video_id, *args)
+    except Exception:
+        logger.warning("자막 보관소 저장 실패: %s", video_id, exc_info=True)
+
+
+class TranscriptArchive:
+    """SQLite + FTS5 자막 보관소"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            self._create_tables()
+        except sqlite3.OperationalError as e:
+            raise RuntimeError(f"SQLite FTS5 를 사용할 수 없습니다: {e}")
+
+    def _create_tables(self):
+        self._conn.executescript(
+            'CREATE TABLE IF NOT EXISTS videos ('
+            ' video_id TEXT PRIMARY KEY,'
+            ' info TEXT,'
+            ' tracks TEXT,'
+            ' stored_at REAL NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS transcripts ('
+            ' id INTEGER PRIMARY KEY,'
+            ' video_id TEXT NOT NULL,'
+            ' language_code TEXT NOT NULL,'
+            ' is_generated INTEGER NOT NULL,'
+            ' entries TEXT NOT NULL,'
+            ' stored_at REAL NOT NULL,'
+            ' UNIQUE (video_id, language_code, is_generated));'
+            'CREATE VIRTUAL TABLE IF NOT EXISTS segments USING fts5('
+            ' text,'
+            ' transcript_id UNINDEXED,'
+            ' start_ms UNINDEXED,'
+            ' duration_ms UNINDEXED,'
+            " tokenize='unicode61 remove_diacritics 2',"
+            " prefix='2 3');"
+            'CREATE TABLE IF NOT EXISTS segment_ranges ('
+            ' transcript_id INTEGER PRIMARY KEY,'
+            ' first_rowid INTEGER NOT NULL,'
+            ' last_rowid INTEGER NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS sources ('
+            ' url TEXT PRIMARY KEY,'
+            ' kind TEXT NOT NULL,'
+            ' title TEXT,'
+            ' watermark TEXT,'
+            ' synced_at REAL);'
+            'CREATE TABLE IF NOT EXISTS source_videos ('
+            ' url TEXT NOT NULL,'
+            ' video_id TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' error TEXT,'
+            ' updated_at REAL NOT NULL,'
+            ' PRIMARY KEY (url, video_id));'
+        )
+
+    # 저장
+
+    def _touch_video(self, video_id):
+        self._conn.execute(
+            'INSERT OR IGNORE INTO videos (video_id, stored_at) VALUES (?, ?)', (video_id, time.time())
+        )
+
+    def put_tracks(self, video_id, tracks):
+        """자막 트랙 목록 저장 (Track 리스트)"""
+        payload = json.dumps([track.to_dict() for track in tracks], ensure_ascii=False)
+        with self._lock:
+            self._touch_video(video_id)
+            self._conn.execute('UPDATE videos SET tracks = ? WHERE video_id = ?', (payload, video_id))
+
+    def put_info(self, video_id, info):
+        """비디오 정보 저장"""
+        payload = json.dumps(info, ensure_ascii=False)
+        with self._lock:
+            self._touch_video(video_id)
+            self._conn.execute('UPDATE videos SET info = ? WHERE video_id = ?', (payload, video_id))
+
+    def put_entries(self, video_id, track, entries):
+        """자막 항목 저장 후 검색 색인 갱신 (같은 트랙이 이미 있으면 교체)"""
+        payload = json.dumps(entries, ensure_ascii=False, separators=(',', ':'))
+        rows = [
+            (entry['text'], int(entry['start'] * 1000), int(entry.get('duration', 0) * 1000))
+            for entry in entries if entry.get('text')
+        ]
+        with self._lock:
+            # 같은 파일을 여러 프로세스가 쓸 수 있으므로 쓰기 잠금을 먼저 잡는다 (아래 MAX(rowid) 를 다른 쓰기와 겹치지 않게)
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._touch_video(video_id)
+                old = self._conn.execute(
+                    'SELECT id FROM transcripts WHERE video_id = ? AND language_code = ? AND is_generated = ?',
+                    (video_id, track.language_code, int(track.is_generated))
+                ).fetchone()
+                if old is not None:
+                    self._delete_segments(old[0])
+                    self._conn.execute('DELETE FROM transcripts WHERE id = ?', old)
+                transcript_id = self._conn.execute(
+                    'INSERT INTO transcripts (video_id, language_code, is_generated, entries, stored_at)'
+                    ' VALUES (?, ?, ?, ?, ?)',
+                    (video_id, track.language_code, int(track.is_generated), payload, time.time())
+                ).lastrowid
+                # rowid 를 직접 이어서 붙여 자막 하나의 문장이 한 범위에 모이게 한다
+                first = self._conn.execute('SELECT COALESCE(MAX(rowid), 0) + 1 FROM segments').fetchone()[0]
+                self._conn.executemany(
+                    'INSERT INTO segments (rowid, text, transcript_id, start_ms, duration_ms) VALUES (?, ?, ?, ?, ?)',
+                    [(first + i, text, transcript_id, start_ms, duration_ms)
+                     for i, (text, start_ms, duration_ms) in enumerate(rows)]
+                )
+                if rows:
+                    self._conn.execute(
+                        'INSERT INTO segment_ranges (transcript_id, first_rowid, last_rowid) VALUES (?, ?, ?)',
+                        (transcript_id, first, first + len(rows) - 1)
+                    )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def _delete_segments(self, transcript_id):
+        """자막 하나의 검색 색인 삭제 (rowid 범위로 - transcript_id 는 색인되지 않은 열이라 조건으로 쓰면 전체를 훑는다)"""
+        span = self._conn.execute(
+            'SELECT first_rowid, last_rowid FROM segment_ranges WHERE transcript_id = ?', (transcript_id,)
+        ).fetchone()
+        if span is not None:
+            self._conn.execute('DELETE FROM segments WHERE rowid BETWEEN ? AND ?', span)
+            self._conn.execute('DELETE FROM segment_ranges WHERE transcript_id = ?', (transcript_id,))
+        else:
+            # 범위를 기록하기 전에 보관한 자막 (문장이 없었으면 지울 것도 없다)
+            self._conn.execute('DELETE FROM segments WHERE transcript_id = ?', (transcript_id,))
+
+    # 조회
+
+    def get_tracks(self, video_id):
+        """보관된 자막 트랙 목록 (Track 리스트, 없으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT tracks FROM videos WHERE video_id = ?', (video_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return [Track(t['language_code'], t.get('language', ''), t.get('is_generated', False))
+                for t in json.loads(row[0])]
+
+    def get_entries(self, video_id, language_code, is_generated):
+        """보관된 자막 항목 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT entries FROM transcripts WHERE video_id = ? AND language_code = ? AND is_generated = ?',
+                (video_id, language_code, int(is_generated))
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def get_info(self, video_id):
+        """보관된 비디오 정보 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT info FROM videos WHERE video_id = ?', (video_id,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    # 크롤러 동기화 상태
+
+    def get_source(self, url):
+        """소스 정보 {'url', 'kind', 'title', 'watermark', 'synced_at'} (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, kind, title, watermark, synced_at FROM sources WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('url', 'kind', 'title', 'watermark', 'synced_at'), row))
+
+    def put_source(self, url, kind, title, watermark):
+        """목록 조회를 마친 소스의 워터마크(가장 최근 영상) 저장"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO sources (url, kind, title, watermark, synced_at) VALUES (?, ?, ?, ?, ?)'
+                ' ON CONFLICT (url) DO UPDATE SET kind = excluded.kind, title = excluded.title,'
+                '  watermark = COALESCE(excluded.watermark, sources.watermark), synced_at = excluded.synced_at',
+                (url, kind, title, watermark, time.time())
+            )
+
+    def get_source_videos(self, url):
+        """소스에서 본 영상들의 {video_id: (status, attempts)}"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT video_id, status, attempts FROM source_videos WHERE url = ?', (url,)
+            ).fetchall()
+        return {video_id: (status, attempts) for video_id, status, attempts in rows}
+
+    def add_source_videos(self, url, video_ids):
+        """소스에서 새로 본 영상을 pending 상태로 추가 (이미 있으면 그대로)"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO source_videos (url, video_id, status, updated_at) VALUES (?, ?, 'pending', ?)",
+                [(url, video_id, now) for video_id in video_ids]
+            )
+
+    def put_source_video(self, url, video_id, status, error=None):
+        """영상 크롤링 결과 저장 (시도 횟수 1 증가)"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE source_videos SET status = ?, error = ?, attempts = attempts + 1, updated_at = ?'
+                ' WHERE url = ? AND video_id = ?',
+                (status, error, time.time(), url, video_id)
+            )
+
+    # 검색
+
+    def search(self, query, limit=DEFAULT_SEARCH_LIMIT, matches_per_video=DEFAULT_MATCHES_PER_VIDEO):
+        """자막 전문 검색
+
+        관련도 순으로 최대 limit 개 영상을 돌려준다. 영상(자막)의 순위는 가장 관련도가 높은 문장으로 매기고,
+        일치하는 문장 전체에서 매긴다.
+            [{'video_id', 'title', 'channel', 'language', 'is_generated',
+              'matches': [{'start_ms', 'end_ms', 'text', 'snippet'}, ...]}, ...]
+        matches 는 영상 안에서 관련도가 높은 matches_per_video 개를 시간 순으로 둔다.
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        with self._lock:
+            # 1) 일치하는 문장 전체에서 bm25 로 영상 순위와 영상별 상위 문장을 고른다 (rowid 와 점수만)
+            chosen = self._conn.execute(
+                'SELECT segment, score FROM ('
+                '  SELECT segment, score, n, DENSE_RANK() OVER (ORDER BY best, transcript_id) AS video_rank FROM ('
+                '   SELECT rowid AS segment, transcript_id, score,'
+                '    ROW_NUMBER() OVER (PARTITION BY transcript_id ORDER BY score, rowid) AS n,'
+                '    MIN(score) OVER (PARTITION BY transcript_id) AS best'
+                '   FROM (SELECT rowid, transcript_id, bm25(segments) AS score FROM segments WHERE segments MATCH ?)'
+                '  ) WHERE n <= ?'
+                ' ) WHERE video_rank <= ? ORDER BY video_rank, n',
+                (match, matches_per_video, limit)
+            ).fetchall()
+            if not chosen:
+                return []
+            # 2) 고른 문장만 다시 읽어 스니펫과 영상 정보를 붙인다
+            rows = self._conn.execute(
+                'SELECT m.rowid, m.transcript_id, m.start_ms, m.duration_ms, m.text, m.snippet,'
+                '  t.video_id, t.language_code, t.is_generated, v.info'
+                ' FROM ('
+                "  SELECT rowid, transcript_id, start_ms, duration_ms, text,"
+                "   snippet(segments, 0, '[', ']', '…', 16) AS snippet"
+                '  FROM segments WHERE segments MATCH ? AND rowid IN (SELECT value FROM json_each(?))'
+                ' ) m'
+                ' JOIN transcripts t ON t.id = m.transcript_id'
+                ' JOIN videos v ON v.video_id = t.video_id',
+                (match, json.dumps([segment for segment, _ in chosen]))
+            ).fetchall()
+
+        order = {segment: index for index, (segment, _) in enumerate(chosen)}
+        rows.sort(key=lambda row: order[row[0]])
+        rows = [row[1:] for row in rows]
+
+        results = {}
+        for transcript_id, start_ms, duration_ms, text, snippet, video_id, language, generated, info in rows:
+            result = results.get(transcript_id)
+            if result is None:
+                info = json.loads(info) if info else {}
+                result = results[transcript_id] = {
+                    'video_id': video_id,
+                    'title': info.get('title', ''),
+                    'channel': info.get('channel', ''),
+                    'language': language,
+                    'is_generated': bool(generated),
+                    'matches': [],
+                }
+            result['matches'].append({
+                'start_ms': start_ms,
+                'end_ms': start_ms + duration_ms,
+                'text': text,
+                'snippet': snippet,
+            })
+
+        for result in results.values():
+            result['matches'].sort(key=lambda m: m['start_ms'])
+        return list(results.values())
+
+    def stats(self):
+        with self._lock:
+            videos = self._conn.execute('SELECT COUNT(*) FROM videos').fetchone()[0]
+            transcripts = self._conn.execute('SELECT COUNT(*) FROM transcripts').fetchone()[0]
+            sources = self._conn.execute('SELECT COUNT(*) FROM sources').fetchone()[0]
+        return {'path': self.path, 'videos': videos, 'transcripts': transcripts, 'sources': sources}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_archive = None
+_default_archive_lock = threading.Lock()
+
+
+def get_default_archive():
+    """YT_ARCHIVE_PATH 로 지정한 프로세스 공용 보관소 (지정하지 않았으면 None)"""
+    global _default_archive
+
+    path = os.environ.get('YT_ARCHIVE_PATH')
+    if not path:
+        return None
+
+    with _default_archive_lock:
+        if _default_archive is None:
+            _default_archive = TranscriptArchive(path)
+        return _default_archive
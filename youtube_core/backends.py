@@ -0,0 +1,323 @@
+"""
+자막 백엔드
+
+추출기가 자막 목록을 조회(list_tracks)하고 선택한 트랙을 가져오는(fetch) 부분을 분리한다.
+    - YouTubeTranscriptBackend: youtube_transcript_api 사용 (0.6.x / 1.x 모두 지원)
+    - HttpTranscriptBackend: JSON 자막 서버(fake_server 등) 사용 - 벤치마크/테스트용
+    - ArchiveTranscriptBackend: 자막 보관소(youtube_core.archive)에 있는 자막만 사용 - 네트워크 없이 재처리
+    - FakeTranscriptBackend (youtube_core.fake_server): 메모리에 둔 가짜 자막 - 테스트용
+    - YtDlpSubtitleBackend (youtube_core.subtitles): yt_dlp 가 알려 준 자막 트랙(json3/vtt)
+    - FallbackTranscriptBackend: 앞 백엔드가 실패하면 다음 백엔드로 다시 조회
+
+백엔드는 이름으로 등록해 두고(register_backend) create_backend(name) 으로 만든다.
+공용 백엔드는 YT_TRANSCRIPT_BACKEND 로 고른다 (기본: youtube).
+예비 백엔드는 YT_TRANSCRIPT_FALLBACK 으로 지정했을 때만 둔다 (예: yt_dlp).
+
+유튜브로 나가는 요청은 공용 OutboundScheduler(속도 제한/재시도/회로 차단기)를 거친다.
+"""
+
+import os
+import threading
+from urllib.parse import quote
+
+from .entries import normalize_entries
+from .metrics import record_backend_fallback
+from .scheduler import get_default_scheduler
+
+
+class HttpError(Exception):
+    """2xx 가 아닌 HTTP 응답"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Track:
+    """자막 트랙 하나의 정보"""
+
+    __slots__ = ('language_code', 'language', 'is_generated', 'handle')
+
+    def __init__(self, language_code, language='', is_generated=False, handle=None):
+        self.language_code = language_code
+        self.language = language or language_code
+        self.is_generated = bool(is_generated)
+        # 백엔드가 fetch 할 때 쓰는 원본 객체 (youtube_transcript_api 의 Transcript 등)
+        self.handle = handle
+
+    def to_dict(self):
+        return {
+            'language_code': self.language_code,
+            'language': self.language,
+            'is_generated': self.is_generated,
+        }
+
+    def __repr__(self):
+        kind = 'auto' if self.is_generated else 'manual'
+        return f"Track({self.language_code!r}, {kind})"
+
+
+class TranscriptBackend:
+    """자막 백엔드 인터페이스"""
+
+    # fetch 에 list_tracks 가 돌려준 원본 트랙(handle)이 꼭 필요한지 여부
+    fetch_requires_listing = False
+
+    def list_tracks(self, video_id):
+        """사용 가능한 자막 트랙 목록 (Track 리스트)"""
+        raise NotImplementedError
+
+    def fetch(self, video_id, track):
+        """트랙의 자막 항목 ({'text', 'start', 'duration'} dict 리스트)"""
+        raise NotImplementedError
+
+
+def create_http_session(pool_maxsize=32):
+    """keep-alive 연결을 재사용하는 requests 세션"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class YouTubeTranscriptBackend(TranscriptBackend):
+    """youtube_transcript_api 백엔드
+
+    1.x 에서는 인스턴스 하나와 requests 세션 하나를 모든 호출이 공유해서
+    TLS 연결을 재사용한다. 0.6.x 는 정적 메서드만 있으므로 호출마다 새 연결을 쓴다.
+    자막 URL은 목록 응답에만 들어 있으므로 fetch 에는 목록에서 받은 트랙이 필요하다.
+    """
+
+    fetch_requires_listing = True
+
+    def __init__(self, session=None, scheduler=None):
+        try:
+            from youtube_transcript_api import YouTubeTranscriptApi
+        except ImportError:
+            raise RuntimeError("youtube-transcript-api 패키지가 설치되지 않았습니다")
+
+        self._api_class = YouTubeTranscriptApi
+        self._api = None
+        self.scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        if hasattr(YouTubeTranscriptApi, 'list'):
+            self.session = session if session is not None else create_http_session()
+            self._api = YouTubeTranscriptApi(http_client=self.session)
+
+    def list_tracks(self, video_id):
+        if self._api is not None:
+            transcript_list = self.scheduler.call(self._api.list, video_id)
+        else:
+            transcript_list = self.scheduler.call(self._api_class.list_transcripts, video_id)
+        return [
+            Track(t.language_code, t.language, t.is_generated, handle=t)
+            for t in transcript_list
+        ]
+
+    def fetch(self, video_id, track):
+        return normalize_entries(self.scheduler.call(track.handle.fetch))
+
+
+class HttpTranscriptBackend(TranscriptBackend):
+    """JSON 자막 서버 백엔드 (AsyncHttpTranscriptBackend 의 동기 버전)
+
+    GET {base_url}/transcripts/{video_id}
+        -> {"tracks": [{"language_code", "language", "is_generated"}, ...]}
+    GET {base_url}/transcripts/{video_id}/{language_code}?generated=0|1
+        -> {"entries": [{"text", "start", "duration"}, ...]}
+
+    유튜브가 아니므로 스케줄러를 따로 넘기지 않으면 속도 제한/재시도 없이 바로 요청한다.
+    """
+
+    def __init__(self, base_url, session=None, scheduler=None, timeout=30.0):
+        self.base_url = base_url.rstrip('/')
+        self.session = session if session is not None else create_http_session()
+        self.scheduler = scheduler
+        self.timeout = timeout
+
+    def _get_json(self, url):
+        response = self.session.get(url, headers={'Accept': 'application/json'}, timeout=self.timeout)
+        data = response.json() if response.content else {}
+        if response.status_code >= 400:
+            raise HttpError(response.status_code, data.get('error', f'HTTP {response.status_code}'))
+        return data
+
+    def _call(self, url):
+        if self.scheduler is None:
+            return self._get_json(url)
+        return self.scheduler.call(self._get_json, url)
+
+    def list_tracks(self, video_id):
+        data = self._call(f'{self.base_url}/transcripts/{quote(video_id)}')
+        return [
+            Track(t['language_code'], t.get('language', ''), t.get('is_generated', False))
+            for t in data.get('tracks', [])
+        ]
+
+    def fetch(self, video_id, track):
+        generated = '1' if track.is_generated else '0'
+        data = self._call(
+            f'{self.base_url}/transcripts/{quote(video_id)}/{quote(track.language_code)}?generated={generated}'
+        )
+        return data.get('entries', [])
+
+
+class ArchiveTranscriptBackend(TranscriptBackend):
+    """자막 보관소 백엔드 - 보관된 목록과 자막만 돌려주고 유튜브에는 요청하지 않는다
+
+    archive 를 넘기지 않으면 공용 보관소(YT_ARCHIVE_PATH)를 쓴다.
+    """
+
+    def __init__(self, archive=None):
+        from .archive import get_default_archive
+
+        self.archive = archive if archive is not None else get_default_archive()
+        if self.archive is None:
+            raise RuntimeError("보관소 백엔드에는 YT_ARCHIVE_PATH 가 필요합니다")
+
+    def list_tracks(self, video_id):
+        tracks = self.archive.get_tracks(video_id)
+        if tracks is None:
+            raise LookupError(f"보관소에 없는 영상입니다: {video_id}")
+        return tracks
+
+    def fetch(self, video_id, track):
+        entries = self.archive.get_entries(video_id, track.language_code, track.is_generated)
+        if entries is None:
+            raise LookupError(f"보관소에 없는 자막입니다: {video_id} ({track.language_code})")
+        return entries
+
+
+class FallbackTranscriptBackend(TranscriptBackend):
+    """앞 백엔드가 실패하면 다음 백엔드로 다시 조회하는 백엔드
+
+    트랙마다 목록을 받은 백엔드를 기억해 두고 fetch 도 그 백엔드로 한다. 목록은 받았지만 자막 조회가
+    실패하면 다음 백엔드에서 같은 언어/종류의 트랙을 찾아 받는다. 모두 실패하면 첫 번째 예외를 그대로
+    던지므로 오류 메시지와 부정 캐싱은 예비 백엔드가 없을 때와 같다.
+    """
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+        self.fetch_requires_listing = any(backend.fetch_requires_listing for backend in self.backends)
+
+    def list_tracks(self, video_id):
+        first_error = None
+        for backend in self.backends:
+            try:
+                tracks = backend.list_tracks(video_id)
+            except Exception as e:
+                if first_error is not None:
+                    record_backend_fallback('list', False)
+                first_error = first_error or e
+                continue
+            if first_error is not None:
+                record_backend_fallback('list', True)
+            return [Track(t.language_code, t.language, t.is_generated, handle=(backend, t)) for t in tracks]
+        raise first_error
+
+    def fetch(self, video_id, track):
+        if track.handle is None:
+            # 캐시/보관소에서 복원한 트랙 (어느 백엔드도 원본 트랙이 필요 없을 때만)
+            origin, original = self.backends[0], track
+        else:
+            origin, original = track.handle
+        try:
+            return origin.fetch(video_id, original)
+        except Exception as e:
+            first_error = e
+
+        for backend in self.backends[self.backends.index(origin) + 1:]:
+            try:
+                entries = self._fetch_same_track(backend, video_id, track)
+            except Exception:
+                record_backend_fallback('fetch', False)
+                continue
+            record_backend_fallback('fetch', True)
+            return entries
+        raise first_error
+
+    def _fetch_same_track(self, backend, video_id, track):
+        for candidate in backend.list_tracks(video_id):
+            if candidate.language_code == track.language_code and candidate.is_generated == track.is_generated:
+                return backend.fetch(video_id, candidate)
+        raise LookupError(f"No transcripts found for the requested language ({track.language_code})")
+
+
+def _create_http_backend(base_url=None, **options):
+    base_url = base_url or os.environ.get('YT_TRANSCRIPT_BACKEND_URL')
+    if not base_url:
+        raise RuntimeError("http 백엔드에는 YT_TRANSCRIPT_BACKEND_URL 이 필요합니다")
+    return HttpTranscriptBackend(base_url, **options)
+
+
+def _create_fake_backend(**options):
+    from .fake_server import FakeTranscriptBackend
+    return FakeTranscriptBackend(**options)
+
+
+def _create_yt_dlp_backend(**options):
+    from .subtitles import YtDlpSubtitleBackend
+    return YtDlpSubtitleBackend(**options)
+
+
+# 이름 -> 백엔드를 만드는 함수 (키워드 인자는 백엔드 생성자에 그대로 전달)
+BACKENDS = {
+    'youtube': YouTubeTranscriptBackend,
+    'http': _create_http_backend,
+    'archive': ArchiveTranscriptBackend,
+    'fake': _create_fake_backend,
+    'yt_dlp': _create_yt_dlp_backend,
+}
+
+
+def register_backend(name, factory):
+    """자막 백엔드 등록 (같은 이름이 있으면 바꾼다)"""
+    BACKENDS[name] = factory
+
+
+def create_backend(name, **options):
+    """등록된 이름으로 자막 백엔드 생성 - 모르는 이름이면 ValueError"""
+    factory = BACKENDS.get(name)
+    if factory is None:
+        raise ValueError(f"지원하지 않는 자막 백엔드입니다: {name} (사용 가능: {', '.join(sorted(BACKENDS))})")
+    return factory(**options)
+
+
+def default_backend_name():
+    """YT_TRANSCRIPT_BACKEND, 없으면 YT_TRANSCRIPT_BACKEND_URL 이 있을 때 http, 그 외에는 youtube"""
+    name = os.environ.get('YT_TRANSCRIPT_BACKEND')
+    if name:
+        return name
+    return 'http' if os.environ.get('YT_TRANSCRIPT_BACKEND_URL') else 'youtube'
+
+
+def default_fallback_names(name):
+    """name 백엔드의 예비 백엔드 이름 목록 (YT_TRANSCRIPT_FALLBACK, 쉼표 구분)
+
+    지정하지 않으면 예비 백엔드 없음 - yt_dlp 가 설치돼 있어도 저절로 켜지지 않는다.
+    """
+    names = os.environ.get('YT_TRANSCRIPT_FALLBACK', '')
+    return [n.strip() for n in names.split(',') if n.strip() and n.strip() != name]
+
+
+_default_backend = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend():
+    """프로세스 공용 자막 백엔드 (default_backend_name() 으로 고른 백엔드, 예비 백엔드가 있으면 함께)
+
+    YT_TRANSCRIPT_BACKEND_URL 을 지정하면 유튜브 대신 그 주소의 JSON 자막 서버를 쓴다 (벤치마크용).
+    """
+    global _default_backend
+
+    with _default_backend_lock:
+        if _default_backend is None:
+            name = default_backend_name()
+            backend = create_backend(name)
+            fallbacks = [create_backend(fallback) for fallback in default_fallback_names(name)]
+            _default_backend = FallbackTranscriptBackend([backend] + fallbacks) if fallbacks else backend
+        return _default_backend
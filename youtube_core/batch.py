@@ -0,0 +1,100 @@
+"""
+배치 추출
+
+여러 URL을 스레드 풀로 동시에 처리하고 끝나는 순서대로 결과를 돌려준다.
+같은 비디오 ID는 한 번만 가져온다. 유튜브로 나가는 요청의 속도는 백엔드가 공용 OutboundScheduler 로 제한한다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .response import run_extraction
+from .urls import canonical_url, parse_video_id
+
+
+DEFAULT_CONCURRENCY = 4
+MAX_CONCURRENCY = 32
+
+
+def parse_batch(urls, concurrency=DEFAULT_CONCURRENCY):
+    """배치 요청 검증 - (urls, concurrency) 반환, 잘못된 값이면 ValueError
+
+    스트리밍 응답은 헤더를 먼저 보내므로 추출을 시작하기 전에 불러서 400 으로 돌려줘야 한다.
+    urls 는 문자열(또는 None) 리스트, concurrency 는 정수(문자열 숫자 허용)이고 1..MAX_CONCURRENCY 로 맞춘다.
+    """
+    if not isinstance(urls, list) or not urls:
+        raise ValueError("urls 는 URL 문자열 목록이어야 합니다")
+    for url in urls:
+        if url is not None and not isinstance(url, str):
+            raise ValueError(f"urls 항목은 문자열이어야 합니다: {url!r}")
+    if concurrency is None:
+        concurrency = DEFAULT_CONCURRENCY
+    if isinstance(concurrency, bool):
+        raise ValueError(f"concurrency 는 정수여야 합니다: {concurrency!r}")
+    try:
+        concurrency = int(concurrency)
+    except (TypeError, ValueError):
+        raise ValueError(f"concurrency 는 정수여야 합니다: {concurrency!r}") from None
+    return urls, max(1, min(concurrency, MAX_CONCURRENCY))
+
+
+def group_by_video_id(urls, allow_bare_id=True):
+    """URL 목록을 비디오 ID별로 묶기 (URL 인식은 youtube_core.urls)
+
+    배치 입력은 URL 이나 비디오 ID 목록이므로 (--normalize --bare-ids 출력 그대로) 기본으로 ID만 적은 줄도 받는다.
+    반환값: (jobs, rejects)
+        jobs: 입력 순서대로 [(index, video_id, [url, ...]), ...]
+        rejects: 비디오 ID를 찾지 못한 [(index, url), ...]
+    """
+    jobs = {}
+    rejects = []
+    for index, url in enumerate(urls):
+        url = (url or '').strip()
+        video_id = parse_video_id(url, allow_bare_id=allow_bare_id)
+        if not video_id:
+            rejects.append((index, url))
+            continue
+        if video_id in jobs:
+            jobs[video_id][2].append(url)
+        else:
+            jobs[video_id] = (index, video_id, [url])
+    return list(jobs.values()), rejects
+
+
+def extract_many(urls, extractor_factory, concurrency=DEFAULT_CONCURRENCY, allow_bare_id=True):
+    """여러 URL 자막을 동시에 추출, 끝나는 순서대로 결과 dict를 yield
+
+    결과 dict는 run_extraction 응답에 index, url, urls, video_id가 더해진 형태.
+    allow_bare_id 는 group_by_video_id 와 같다 (추출은 비디오 ID의 표준 watch URL 로).
+    입력은 parse_batch 로 미리 검증해 둔다 (잘못된 값이면 첫 결과를 꺼낼 때 ValueError).
+    """
+    urls, concurrency = parse_batch(urls, concurrency)
+    jobs, rejects = group_by_video_id(urls, allow_bare_id=allow_bare_id)
+
+    for index, url in rejects:
+        yield {
+            "index": index,
+            "url": url,
+            "urls": [url],
+            "video_id": None,
+            "success": False,
+            "error": "올바른 유튜브 URL이 아닙니다"
+        }
+
+    def run(job):
+        index, video_id, job_urls = job
+        result = run_extraction(extractor_factory(), canonical_url(video_id))
+        result.update({"index": index, "url": job_urls[0], "urls": job_urls, "video_id": video_id})
+        return result
+
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(jobs))) as executor:
+        futures = [executor.submit(run, job) for job in jobs]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 작업은 취소
+            for future in futures:
+                future.cancel()
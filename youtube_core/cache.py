@@ -0,0 +1,306 @@
+"""
+자막 캐시
+
+(video_id, language, is_generated) 키로 자막을 저장하는 2단 캐시.
+    - MemoryTier: 프로세스 내 LRU, 전체 바이트 크기로 제한
+    - SQLiteTier: 디스크 캐시, TTL 적용 및 "자막 없음" 같은 실패 결과도 저장(부정 캐싱)
+
+language=None, is_generated=None 키에는 비디오의 자막 트랙 목록을,
+language=METADATA_KEY 키에는 비디오 메타데이터를, language=CAPTIONS_KEY 키에는 yt_dlp 가 알려 준
+자막 트랙 주소를 저장한다 (youtube_core.resolver, youtube_core.metadata, youtube_core.subtitles 참고).
+메모리 계층은 자막 항목을 CompactTranscript 로 들고 있으므로 캐시에서 꺼낸 전체 자막을
+그대로 구간 선택(youtube_core.ranges)에 쓸 수 있다.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .compact import CompactTranscript
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_NEGATIVE_TTL = 60 * 60
+
+# 메타데이터 레코드의 language 자리 값 (언어 코드와 겹치지 않는다)
+METADATA_KEY = '#meta'
+# yt_dlp 자막 트랙 주소 레코드의 language 자리 값
+CAPTIONS_KEY = '#captions'
+
+# 다시 시도해도 결과가 바뀌지 않을 실패 (부정 캐싱 대상)
+NEGATIVE_ERROR_MARKERS = (
+    'No transcripts found',
+    'No transcripts were found',
+    'Subtitles are disabled',
+)
+NEGATIVE_ERROR_TYPES = (
+    'NoTranscriptFound',
+    'NoTranscriptAvailable',
+    'TranscriptsDisabled',
+)
+
+
+def is_negative_error(error):
+    """부정 캐싱해도 되는 에러인지 확인"""
+    if type(error).__name__ in NEGATIVE_ERROR_TYPES:
+        return True
+    message = str(error)
+    return any(marker in message for marker in NEGATIVE_ERROR_MARKERS)
+
+
+def _memory_record(record):
+    """메모리 계층에 둘 레코드 (자막 항목은 열 단위로 변환)"""
+    if 'entries' in record:
+        return dict(record, entries=CompactTranscript.from_entries(record['entries']))
+    return record
+
+
+def make_key(video_id, language=None, is_generated=None):
+    """캐시 키 문자열 생성"""
+    if is_generated is None:
+        generated = ''
+    else:
+        generated = '1' if is_generated else '0'
+    return f"{video_id}|{language or ''}|{generated}"
+
+
+class MemoryTier:
+    """프로세스 내 LRU 캐시 (바이트 크기 제한)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            record, size, expires_at = item
+            if expires_at < time.time():
+                del self._items[key]
+                self.current_bytes -= size
+                return None
+            self._items.move_to_end(key)
+            return record
+
+    def put(self, key, record, size, expires_at):
+        # 한도보다 큰 항목은 메모리에 두지 않는다 (디스크 계층만 사용)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._items[key] = (record, size, expires_at)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._items.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._items)
+
+
+class SQLiteTier:
+    """SQLite 디스크 캐시 (TTL 적용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS transcripts ('
+            ' key TEXT PRIMARY KEY,'
+            ' payload TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL)'
+        )
+
+    def get(self, key):
+        """(record, size, expires_at) 또는 None 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload, expires_at FROM transcripts WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at = row
+            if expires_at < time.time():
+                self._conn.execute('DELETE FROM transcripts WHERE key = ?', (key,))
+                return None
+        return json.loads(payload), len(payload.encode('utf-8')), expires_at
+
+    def put(self, key, payload, expires_at):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO transcripts (key, payload, expires_at) VALUES (?, ?, ?)',
+                (key, payload, expires_at)
+            )
+
+    def purge_expired(self):
+        """만료된 항목 삭제, 삭제한 개수 반환"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM transcripts WHERE expires_at < ?', (time.time(),)
+            )
+            return cursor.rowcount
+
+
+class TranscriptCache:
+    """메모리 LRU + 디스크 2단 자막 캐시
+
+    get()은 캐시에 없으면 None, 있으면 record dict를 돌려준다.
+        자막: {'entries': [...], 'language': ..., 'is_generated': ...}  (메모리 계층에서는 entries 가 CompactTranscript)
+        목록: {'tracks': [...]}
+        메타데이터: {'metadata': {...}}
+        실패: {'error': '...'}  (부정 캐싱)
+    """
+
+    def __init__(self, memory=None, disk=None, ttl=DEFAULT_TTL, negative_ttl=DEFAULT_NEGATIVE_TTL):
+        self.memory = memory
+        self.disk = disk
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._counters = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'negative_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'negative_stores': 0,
+        }
+
+    def _count(self, *names):
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
+
+    def _count_hit(self, tier_counter, record):
+        if 'error' in record:
+            self._count('hits', tier_counter, 'negative_hits')
+        else:
+            self._count('hits', tier_counter)
+
+    def get(self, video_id, language=None, is_generated=None):
+        """캐시 조회"""
+        key = make_key(video_id, language, is_generated)
+
+        if self.memory is not None:
+            record = self.memory.get(key)
+            if record is not None:
+                self._count_hit('memory_hits', record)
+                return record
+
+        if self.disk is not None:
+            found = self.disk.get(key)
+            if found is not None:
+                record, size, expires_at = found
+                # 디스크에서 찾은 항목은 메모리 계층으로 올린다
+                if self.memory is not None:
+                    record = _memory_record(record)
+                    self.memory.put(key, record, size, expires_at)
+                self._count_hit('disk_hits', record)
+                return record
+
+        self._count('misses')
+        return None
+
+    def _store(self, key, record, ttl):
+        if isinstance(record.get('entries'), CompactTranscript):
+            record = dict(record, entries=record['entries'].to_list())
+        payload = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        expires_at = time.time() + ttl
+        if self.memory is not None:
+            self.memory.put(key, _memory_record(record), len(payload.encode('utf-8')), expires_at)
+        if self.disk is not None:
+            self.disk.put(key, payload, expires_at)
+
+    def put(self, video_id, entries, language=None, is_generated=None):
+        """성공한 자막 저장"""
+        record = {'entries': entries, 'language': language, 'is_generated': is_generated}
+        self._store(make_key(video_id, language, is_generated), record, self.ttl)
+        self._count('stores')
+
+    def put_tracks(self, video_id, tracks):
+        """자막 트랙 목록 저장 (트랙 dict 리스트)"""
+        self._store(make_key(video_id), {'tracks': tracks}, self.ttl)
+        self._count('stores')
+
+    def put_metadata(self, video_id, metadata, ttl=None):
+        """비디오 메타데이터 저장 (get(video_id, METADATA_KEY) 로 조회)"""
+        self._store(make_key(video_id, METADATA_KEY), {'metadata': metadata}, self.ttl if ttl is None else ttl)
+        self._count('stores')
+
+    def put_captions(self, video_id, captions, ttl=None):
+        """yt_dlp 자막 트랙 주소 저장 (get(video_id, CAPTIONS_KEY) 로 조회)"""
+        self._store(make_key(video_id, CAPTIONS_KEY), {'captions': captions}, self.ttl if ttl is None else ttl)
+        self._count('stores')
+
+    def put_negative(self, video_id, error, language=None, is_generated=None):
+        """자막 없음/비활성화 같은 실패 결과 저장"""
+        self._store(make_key(video_id, language, is_generated), {'error': str(error)}, self.negative_ttl)
+        self._count('negative_stores')
+
+    def stats(self):
+        """적중/실패/축출 카운터"""
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        if self.memory is not None:
+            stats['evictions'] = self.memory.evictions
+            stats['memory_items'] = len(self.memory)
+            stats['memory_bytes'] = self.memory.current_bytes
+            stats['memory_max_bytes'] = self.memory.max_bytes
+        return stats
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """환경 변수 설정으로 만든 프로세스 공용 캐시 (비활성화 시 None)
+
+    YT_CACHE_DISABLE=1          캐시 끄기
+    YT_CACHE_MAX_BYTES          메모리 계층 최대 바이트 (기본 64MB)
+    YT_CACHE_PATH               SQLite 파일 경로 (지정했을 때만 디스크 계층 사용)
+    YT_CACHE_TTL                성공 결과 TTL 초 (기본 1일)
+    YT_CACHE_NEGATIVE_TTL       실패 결과 TTL 초 (기본 1시간)
+    """
+    global _default_cache
+
+    if os.environ.get('YT_CACHE_DISABLE') == '1':
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            memory = MemoryTier(int(os.environ.get('YT_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)))
+            # 디스크 계층은 명시적으로 켠다 - 공용 임시 폴더의 파일은 다른 사용자가 읽거나 바꿀 수 있고
+            # 서로 다른 배포가 모르는 사이에 같은 파일을 나눠 쓰게 된다
+            path = os.environ.get('YT_CACHE_PATH', '')
+            disk = None
+            if path:
+                try:
+                    disk = SQLiteTier(path)
+                except sqlite3.Error:
+                    # 읽기 전용 파일 시스템 등에서는 메모리 계층만 사용
+                    disk = None
+            _default_cache = TranscriptCache(
+                memory=memory,
+                disk=disk,
+                ttl=float(os.environ.get('YT_CACHE_TTL', DEFAULT_TTL)),
+                negative_ttl=float(os.environ.get('YT_CACHE_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL)),
+            )
+        return _default_cache
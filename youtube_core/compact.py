@@ -0,0 +1,144 @@
+"""
+열 단위 자막 저장
+
+자막 항목마다 dict(또는 FetchedTranscriptSnippet) 하나를 두면 몇 시간짜리 영상은 수만 개의
+작은 파이썬 객체가 되고, 동시 요청이 많으면 핸들러 메모리가 크게 늘어난다.
+CompactTranscript 는 같은 내용을 열 단위로 담는다.
+
+    starts     array('d')  항목 시작 시각(초)
+    durations  array('d')  항목 길이(초)
+    text       str         모든 항목 텍스트를 이어 붙인 버퍼
+    offsets    array('I')  항목 i 의 텍스트는 text[offsets[i]:offsets[i + 1]]
+
+항목 수와 상관없이 객체는 네 개뿐이다. 기존 dict 리스트처럼 len(), 반복(항목 dict 생성),
+인덱스/슬라이스 접근을 지원하고, 포맷터는 rows()/texts() 로 dict 를 만들지 않고 바로 읽는다.
+시작 시각이 정렬돼 있으면 between(start, end) 는 이진 탐색으로 시간 구간을 자르고,
+head_chars(max_chars) 는 위치 배열을 이진 탐색해서 글자 수 한도만큼 자른다.
+
+메모리/속도 비교: python benchmarks/bench_transcript.py
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class CompactTranscript:
+    """열 단위로 저장한 자막 항목 목록 (읽기 전용)"""
+
+    __slots__ = ('starts', 'durations', 'text', 'offsets', 'is_sorted')
+
+    def __init__(self, starts, durations, text, offsets, is_sorted=None):
+        self.starts = starts
+        self.durations = durations
+        self.text = text
+        self.offsets = offsets
+        if is_sorted is None:
+            is_sorted = all(a <= b for a, b in zip(starts, starts[1:]))
+        self.is_sorted = is_sorted
+
+    @classmethod
+    def from_entries(cls, entries):
+        """dict 리스트(normalize_entries 결과)나 CompactTranscript 로 만들기"""
+        if isinstance(entries, cls):
+            return entries
+
+        starts = array('d')
+        durations = array('d')
+        offsets = array('I', [0])
+        texts = []
+        position = 0
+        previous = float('-inf')
+        is_sorted = True
+        for entry in entries or ():
+            text = entry.get('text') or ''
+            start = float(entry.get('start') or 0)
+            if start < previous:
+                is_sorted = False
+            previous = start
+            starts.append(start)
+            durations.append(float(entry.get('duration') or 0))
+            texts.append(text)
+            position += len(text)
+            offsets.append(position)
+        return cls(starts, durations, ''.join(texts), offsets, is_sorted)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __bool__(self):
+        return len(self.starts) > 0
+
+    def _text_at(self, index):
+        return self.text[self.offsets[index]:self.offsets[index + 1]]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._slice(*index.indices(len(self)))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('자막 항목 번호가 범위를 벗어났습니다')
+        return {'text': self._text_at(index), 'start': self.starts[index], 'duration': self.durations[index]}
+
+    def _slice(self, first, last, step=1):
+        if step != 1:
+            return self.from_entries([self[i] for i in range(first, last, step)])
+        last = max(first, last)
+        begin = self.offsets[first]
+        offsets = array('I', (offset - begin for offset in self.offsets[first:last + 1]))
+        return CompactTranscript(
+            self.starts[first:last], self.durations[first:last],
+            self.text[begin:self.offsets[last]], offsets, self.is_sorted
+        )
+
+    def __iter__(self):
+        """기존 dict 리스트와 같은 항목 dict 를 차례로 생성"""
+        for text, start, duration in self.rows():
+            yield {'text': text, 'start': start, 'duration': duration}
+
+    def texts(self):
+        """항목 텍스트를 차례로 생성"""
+        text = self.text
+        offsets = self.offsets
+        return (text[offsets[i]:offsets[i + 1]] for i in range(len(self.starts)))
+
+    def rows(self):
+        """(text, start, duration) 튜플을 차례로 생성"""
+        return zip(self.texts(), self.starts, self.durations)
+
+    def between(self, start=None, end=None):
+        """[start, end) 초 구간에서 시작하는 항목만 담은 CompactTranscript
+
+        start 전에 시작해서 아직 이어지는 항목은 넣지 않는다 (예전에는 구간과 겹치는 항목을 모두 넣었다).
+        그래서 end 를 다음 요청의 start 로 넘기면 구간끼리 겹치거나 빠지는 항목이 없다.
+        시작 시각이 정렬돼 있으면 이진 탐색으로 찾고, 아니면 전체를 훑는다.
+        """
+        start = float('-inf') if start is None else float(start)
+        end = float('inf') if end is None else float(end)
+        if not self.is_sorted:
+            return self.from_entries(
+                {'text': text, 'start': s, 'duration': d}
+                for text, s, d in self.rows() if start <= s < end
+            )
+
+        first = bisect_left(self.starts, start)
+        last = bisect_left(self.starts, end, first)
+        return self._slice(first, last)
+
+    def head_chars(self, max_chars):
+        """원문 글자 수 합이 max_chars 를 넘지 않는 앞쪽 항목들 (첫 항목은 길어도 포함)"""
+        count = bisect_right(self.offsets, self.offsets[0] + max_chars) - 1
+        return self._slice(0, max(count, min(1, len(self))))
+
+    def to_list(self):
+        """dict 리스트로 변환 (캐시/JSON 저장용)"""
+        return list(self)
+
+    def nbytes(self):
+        """대략적인 메모리 사용량 (바이트)"""
+        return (sys.getsizeof(self.text) + sys.getsizeof(self.starts)
+                + sys.getsizeof(self.durations) + sys.getsizeof(self.offsets))
+
+    def __repr__(self):
+        return f'<CompactTranscript entries={len(self)} chars={len(self.text)}>'
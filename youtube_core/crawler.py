@@ -0,0 +1,220 @@
+"""
+채널/재생목록 크롤러
+
+채널이나 재생목록 URL을 비디오 ID 목록으로 펼치고(yt_dlp flat 추출) 아직 가져오지 않은 영상의 자막만
+자막 보관소(youtube_core.archive)에 저장한다.
+    - 소스(채널/재생목록)마다 워터마크(가장 최근 영상)와 영상별 상태를 보관소에 둔다
+    - 채널 목록은 최신순이므로 이미 본 영상이 나오면 목록 넘기기를 멈춘다
+      (flat 추출의 목록은 필요한 만큼만 페이지를 받으므로 바뀐 게 없는 채널은 목록 요청 1회로 끝난다)
+    - 재생목록은 순서가 정해져 있지 않아 끝까지 보고 새 영상만 고른다
+    - 새 영상은 스레드 풀로 동시에 가져온다 (자막 목록/자막 조회는 공용 스케줄러의 속도 제한을 거친다)
+    - 목록에 있던 제목/채널/길이를 비디오 정보로 함께 저장하므로 영상마다 메타데이터를 따로 요청하지 않는다
+    - 일시적인 오류로 실패했거나 중간에 멈춘 영상은 다음 동기화 때 MAX_ATTEMPTS 번까지 다시 시도한다
+      ("자막 없음" 처럼 다시 해도 같은 실패는 unavailable 로 두고 다시 시도하지 않는다)
+
+    crawler = ChannelCrawler(get_default_archive())
+    for report in crawler.sync_many(['https://www.youtube.com/@channel', 'https://www.youtube.com/playlist?list=...']):
+        print(report)
+"""
+
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .backends import get_default_backend
+from .cache import get_default_cache, is_negative_error
+from .metadata import METADATA_FIELDS
+from .resolver import DEFAULT_PRIORITIES, fetch_transcript, parse_priorities
+from .scheduler import get_default_scheduler
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CRAWL_CONCURRENCY = 4
+DEFAULT_SOURCE_CONCURRENCY = 2
+MAX_ATTEMPTS = 3
+MAX_REDIRECTS = 3
+
+# 목록만 받고 영상 페이지는 열지 않는다
+FLAT_YDL_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': 'in_playlist',
+}
+
+PLAYLIST_ID_PATTERN = re.compile(r'[?&]list=([A-Za-z0-9_-]+)')
+CHANNEL_PATTERN = re.compile(
+    r'^(?:https?://)?(?:(?:www|m)\.)?(?:youtube\.com/)?((?:@|channel/|c/|user/)[^/?#\s]+)(?:/([a-z]+))?'
+)
+# 그대로 쓰는 채널 탭 (나머지는 동영상 탭으로)
+VIDEO_TABS = ('videos', 'shorts', 'streams')
+VIDEO_ID_LENGTH = 11
+
+
+def normalize_source(url):
+    """(정규화한 URL, 종류) - 재생목록은 list= 만 남기고 채널은 동영상 탭으로 바꾼다
+
+    'https://www.youtube.com/@name', '@name', '.../channel/UC...', '.../playlist?list=...' 등을 받는다.
+    채널도 재생목록도 아니면 ValueError.
+    """
+    url = (url or '').strip()
+    match = PLAYLIST_ID_PATTERN.search(url)
+    if match:
+        return f'https://www.youtube.com/playlist?list={match.group(1)}', 'playlist'
+    match = CHANNEL_PATTERN.match(url)
+    if match:
+        tab = match.group(2) if match.group(2) in VIDEO_TABS else 'videos'
+        return f'https://www.youtube.com/{match.group(1)}/{tab}', 'channel'
+    raise ValueError(f"채널 또는 재생목록 URL이 아닙니다: {url}")
+
+
+def entry_info(entry, listing):
+    """flat 목록 항목을 MetadataService 와 같은 형식의 비디오 정보로 변환"""
+    info = {key: entry.get(source) or default for key, source, default in METADATA_FIELDS}
+    channel = entry.get('channel') or entry.get('uploader') or listing.get('channel') or listing.get('uploader')
+    if channel:
+        info['channel'] = channel
+    info['video_id'] = entry['id']
+    return info
+
+
+class ChannelCrawler:
+    """채널/재생목록의 새 영상 자막을 보관소로 가져오는 크롤러
+
+    lister 를 넘기지 않으면 yt_dlp flat 추출로 목록을 받는다. lister(url) 는 'entries'(최신순 반복자)와
+    'title' 이 있는 dict 를 돌려주고, entries 는 필요한 만큼만 읽힌다.
+    max_new 를 주면 동기화 한 번에 가장 최근 영상 max_new 개까지만 가져온다
+    (처음 추적하는 채널의 예전 영상을 모두 받지 않으려면 - 건너뛴 영상은 다시 보지 않는다).
+    """
+
+    def __init__(self, archive, backend=None, cache=None, languages=None, concurrency=DEFAULT_CRAWL_CONCURRENCY,
+                 max_new=None, max_attempts=MAX_ATTEMPTS, lister=None, scheduler=None, ydl_options=None):
+        if archive is None:
+            raise ValueError("크롤러에는 자막 보관소(YT_ARCHIVE_PATH)가 필요합니다")
+        self.archive = archive
+        self.backend = backend
+        # 캐시를 따로 넘기지 않으면 프로세스 공용 캐시 사용
+        self.cache = cache if cache is not None else get_default_cache()
+        self.priorities = parse_priorities(languages or DEFAULT_PRIORITIES)
+        self.concurrency = max(1, int(concurrency))
+        self.max_new = max_new
+        self.max_attempts = max_attempts
+        self.lister = lister if lister is not None else self._list_with_ydl
+        self.scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        self.ydl_options = dict(ydl_options or FLAT_YDL_OPTIONS)
+        self._local = threading.local()
+
+    def _ydl(self):
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(self.ydl_options)
+        return ydl
+
+    def _list_with_ydl(self, url):
+        # process=False 면 entries 가 페이지를 필요할 때 받는 반복자다 (대신 다른 주소로 넘기는 결과는 직접 따라간다)
+        info = self._ydl().extract_info(url, download=False, process=False)
+        for _ in range(MAX_REDIRECTS):
+            if info.get('_type') not in ('url', 'url_transparent'):
+                break
+            info = self._ydl().extract_info(info['url'], download=False, process=False)
+        return info
+
+    def _new_videos(self, url, kind, seen, watermark=None):
+        """목록을 읽어 (소스 제목, 가장 최근 영상 ID, [(video_id, info), ...], 읽은 항목 수)"""
+        listing = self.lister(url)
+        newest = None
+        new = []
+        listed = 0
+        for entry in listing.get('entries') or ():
+            video_id = (entry or {}).get('id')
+            if not video_id or len(video_id) != VIDEO_ID_LENGTH or entry.get('_type') == 'playlist':
+                continue
+            listed += 1
+            newest = newest or video_id
+            if video_id in seen or video_id == watermark:
+                if kind == 'channel':
+                    break  # 최신순이므로 나머지는 모두 본 영상
+                continue
+            if self.max_new is not None and len(new) >= self.max_new:
+                break
+            new.append((video_id, entry_info(entry, listing)))
+        return listing.get('title'), newest, new, listed
+
+    def _extract(self, url, video_id):
+        """영상 하나의 자막을 보관소에 저장 (상태, 왕복 횟수) - 어떤 예외도 밖으로 내보내지 않는다"""
+        error = None
+        try:
+            backend = self.backend if self.backend is not None else get_default_backend()
+            result = fetch_transcript(backend, video_id, self.priorities, self.cache, archive=self.archive)
+            status, round_trips = 'ok', result.round_trips
+        except Exception as e:
+            status = 'unavailable' if is_negative_error(e) else 'error'
+            error, round_trips = str(e), getattr(e, 'round_trips', 0)
+        try:
+            self.archive.put_source_video(url, video_id, status, error)
+        except Exception:
+            # 상태를 남기지 못하면 pending 그대로라 다음 동기화 때 다시 시도한다
+            logger.warning("크롤링 상태 저장 실패: %s %s", url, video_id, exc_info=True)
+            status = 'error'
+        return status, round_trips
+
+    def sync(self, source):
+        """소스 하나 동기화 - 결과 요약 dict 반환 (목록을 받지 못하면 success=False)"""
+        started = time.perf_counter()
+        try:
+            url, kind = normalize_source(source)
+        except ValueError as e:
+            return {'source': source, 'success': False, 'error': str(e)}
+
+        known = self.archive.get_source_videos(url)
+        watermark = (self.archive.get_source(url) or {}).get('watermark')
+        try:
+            title, newest, new, listed = self.scheduler.call(self._new_videos, url, kind, known, watermark)
+        except Exception as e:
+            return {'source': url, 'success': False, 'error': str(e)}
+
+        new_ids = [video_id for video_id, _ in new]
+        for video_id, info in new:
+            if self.archive.get_info(video_id) is None:
+                self.archive.put_info(video_id, info)
+        self.archive.add_source_videos(url, new_ids)
+        self.archive.put_source(url, kind, title, newest)
+
+        # 지난번에 끝내지 못한 영상도 함께 (pending: 중간에 멈춤, error: 일시적인 실패)
+        retry = [video_id for video_id, (status, attempts) in known.items()
+                 if status in ('pending', 'error') and attempts < self.max_attempts]
+
+        report = {'source': url, 'success': True, 'kind': kind, 'title': title, 'listed': listed,
+                  'new': len(new_ids), 'retried': len(retry), 'ok': 0, 'unavailable': 0, 'error': 0,
+                  'round_trips': 0}
+        video_ids = new_ids + retry
+        if video_ids:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(video_ids))) as executor:
+                for status, round_trips in executor.map(lambda video_id: self._extract(url, video_id), video_ids):
+                    report[status] += 1
+                    report['round_trips'] += round_trips
+        report['took_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return report
+
+    def sync_many(self, sources, source_concurrency=DEFAULT_SOURCE_CONCURRENCY):
+        """여러 소스를 동시에 동기화하고 끝나는 순서대로 결과 요약을 yield"""
+        sources = [source for source in sources if source]
+        if not sources:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(source_concurrency, len(sources)))) as executor:
+            futures = {executor.submit(self.sync, source): source for source in sources}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        report = future.result()
+                    except Exception as e:
+                        # 소스 하나의 실패(보관소 오류 등)로 나머지 소스를 멈추지 않는다
+                        report = {'source': futures[future], 'success': False, 'error': str(e)}
+                    yield report
+            finally:
+                for future in futures:
+                    future.cancel()
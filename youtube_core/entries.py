@@ -0,0 +1,45 @@
+"""
+자막 항목 정규화
+
+youtube_transcript_api 버전에 따라 자막 항목이 dict(0.6.x)이거나
+FetchedTranscriptSnippet 객체(1.x)로 오기 때문에 공용 dict 형태로 맞춘다.
+
+포맷터는 iter_texts/iter_rows 로 읽으므로 dict 리스트와
+CompactTranscript(youtube_core.compact) 를 구분하지 않는다.
+"""
+
+
+def normalize_entry(entry):
+    """자막 항목 하나를 {'text', 'start', 'duration'} dict로 변환"""
+    if isinstance(entry, dict):
+        return {
+            'text': entry.get('text', ''),
+            'start': entry.get('start', 0.0),
+            'duration': entry.get('duration', 0.0),
+        }
+    return {
+        'text': getattr(entry, 'text', ''),
+        'start': getattr(entry, 'start', 0.0),
+        'duration': getattr(entry, 'duration', 0.0),
+    }
+
+
+def normalize_entries(transcript):
+    """자막 데이터 전체를 dict 리스트로 변환"""
+    if not transcript:
+        return []
+    return [normalize_entry(entry) for entry in transcript]
+
+
+def iter_texts(entries):
+    """자막 항목 텍스트를 차례로 생성 (dict 리스트 또는 CompactTranscript)"""
+    if hasattr(entries, 'texts'):
+        return entries.texts()
+    return (entry['text'] for entry in entries)
+
+
+def iter_rows(entries):
+    """(text, start, duration) 튜플을 차례로 생성 (dict 리스트 또는 CompactTranscript)"""
+    if hasattr(entries, 'rows'):
+        return entries.rows()
+    return ((entry['text'], entry.get('start', 0), entry.get('duration', 0)) for entry in entries)
@@ -0,0 +1,205 @@
+"""
+공용 자막 추출기
+
+루트 youtube_text_extractor.py, api/extract.py, extract_api.py, api/youtube_text_extractor.py 가 모두
+이 추출기를 쓴다. 자막 조회, 캐시, 요청 합치기, 구간 선택, 단계별 시간 측정이 한 곳에 있으므로
+진입점마다 URL 인식(youtube_core.urls)이나 오류 처리가 달라지지 않는다.
+    - 자막은 백엔드(youtube_core.backends)에서 가져온다 (넘기지 않으면 YT_TRANSCRIPT_BACKEND 공용 백엔드)
+    - 비디오 정보는 메타데이터 서비스(yt_dlp)를 쓰거나, 쓰지 않으면 기본 정보로 채운다
+    - 포맷팅은 자막을 공백으로 이어 붙이거나(기본) 문장 단위로 정리한다(sentence_format)
+
+진입점마다 다른 기본값(언어 우선순위, 메타데이터, 포맷팅)은 하위 클래스의 클래스 속성으로 바꾼다.
+"""
+
+import time
+
+from .backends import get_default_backend
+from .cache import get_default_cache
+from .compact import CompactTranscript
+from .entries import iter_texts
+from .formats import DEFAULT_FORMAT, get_format, iter_output, render_output
+from .formatting import format_sentences, iter_formatted_sentences
+from .metadata import placeholder_info
+from .pipeline import elapsed_ms, fetch_pipelined, fetch_pipelined_async, measure
+from .ranges import slice_transcript
+from .resolver import DEFAULT_PRIORITIES, fetch_transcript, fetch_transcript_async, parse_priorities
+from .urls import parse_video_id
+
+
+class YouTubeTextExtractor:
+    # 언어 우선순위 기본값 (예: ['ko', 'en:auto']), 맞는 자막이 없으면 첫 번째 자막 사용
+    LANGUAGE_PRIORITIES = DEFAULT_PRIORITIES
+    # True 면 metadata 를 넘기지 않아도 공용 메타데이터 서비스(yt_dlp)로 제목/채널을 가져온다
+    use_metadata_service = False
+    # True 면 문장 단위로 정리한 텍스트, False 면 자막을 공백으로 이어 붙인 텍스트
+    sentence_format = False
+
+    def __init__(self, cache=None, backend=None, languages=None, output_format=DEFAULT_FORMAT, metadata=None):
+        self.video_info = {}
+        self.transcript_data = []
+        self.formatted_text = ""
+        self.error_details = ""
+        self.transcript_language = None
+        self.round_trips = 0  # 이번 추출에 든 네트워크 왕복 횟수
+        self.timings = {}  # 단계별 소요 시간(ms): parse, metadata, transcript(list, fetch), format, total
+        self.range_info = None  # start/end/max_chars 로 잘랐을 때의 구간 정보
+        # 캐시를 따로 넘기지 않으면 프로세스 공용 캐시 사용
+        self.cache = cache if cache is not None else get_default_cache()
+        # 백엔드를 따로 넘기지 않으면 공용 백엔드(YT_TRANSCRIPT_BACKEND, 기본 youtube_transcript_api) 사용
+        self.backend = backend
+        self.language_priorities = parse_priorities(languages or self.LANGUAGE_PRIORITIES)
+        # 출력 형식 (text, srt, vtt, json, markdown) - 지원하지 않는 형식이면 ValueError
+        self.output_format = get_format(output_format).name
+        # 메타데이터 서비스 (None 이면 기본 정보)
+        if metadata is None and self.use_metadata_service:
+            from .metadata import get_default_metadata_service
+            metadata = get_default_metadata_service()
+        self.metadata = metadata
+
+    def extract_video_id(self, url):
+        """유튜브 URL에서 11자 비디오 ID 추출 (youtube_core.urls)"""
+        return parse_video_id(url)
+
+    def fetch_video_info(self, video_id):
+        """비디오 정보 조회 (메타데이터 서비스는 실패하면 예외)"""
+        if self.metadata is None:
+            return placeholder_info(video_id)
+        return self.metadata.fetch(video_id)
+
+    def get_video_info(self, video_id):
+        """비디오 정보 설정 (실패하면 기본 정보)"""
+        if self.metadata is None:
+            self.video_info = placeholder_info(video_id)
+        else:
+            self.video_info = self.metadata.get(video_id)
+
+    def _fetch_failed(self, error):
+        self.round_trips = getattr(error, 'round_trips', 0)
+        self.error_details = str(error)
+        return False
+
+    def _fetched(self, result):
+        self.round_trips = result.round_trips
+        self.timings.update(result.timings)
+        self.transcript_language = result.track.language_code
+        self.transcript_data = CompactTranscript.from_entries(result.entries)
+        return len(self.transcript_data) > 0
+
+    def extract_transcript(self, video_id):
+        """자막 추출 (자막 목록 1회 + 선택한 자막 1회 조회)"""
+        try:
+            backend = self.backend if self.backend is not None else get_default_backend()
+            result = fetch_transcript(backend, video_id, self.language_priorities, self.cache)
+        except Exception as e:
+            return self._fetch_failed(e)
+        return self._fetched(result)
+
+    def iter_formatted(self):
+        """포맷팅된 텍스트를 조각 단위로 생성 (이어 붙이면 formatted_text 와 같다)"""
+        if self.sentence_format:
+            yield from iter_formatted_sentences(self.transcript_data)
+            return
+        separator = ''
+        for text in iter_texts(self.transcript_data):
+            text = text.strip()
+            if text:
+                yield separator + text
+                separator = ' '
+
+    def format_transcript(self):
+        """자막 포맷팅"""
+        if not self.transcript_data:
+            return ""
+
+        if self.sentence_format:
+            self.formatted_text = format_sentences(self.transcript_data)
+        else:
+            self.formatted_text = ''.join(self.iter_formatted())
+        return self.formatted_text
+
+    def iter_render(self, output_format=None):
+        """받아 온 자막을 지정한 형식(기본: self.output_format)으로 조각 단위 생성"""
+        return iter_output(self, output_format or self.output_format)
+
+    def render(self, output_format=None):
+        """받아 온 자막을 지정한 형식의 문자열로 변환 (자막을 다시 조회하지 않음)"""
+        return render_output(self, output_format or self.output_format)
+
+    def select_range(self, start=None, end=None, max_chars=None):
+        """받아 온 자막에서 [start, end) 초 구간, 원문 max_chars 글자까지만 남기기 (남은 자막이 없으면 False)"""
+        self.transcript_data, self.range_info = slice_transcript(self.transcript_data, start, end, max_chars)
+        if not self.transcript_data:
+            self.error_details = "지정한 구간에 자막이 없습니다"
+            return False
+        return True
+
+    def _parse(self, url):
+        video_id = measure(self.timings, 'parse', self.extract_video_id, url)
+        if not video_id:
+            self.error_details = "올바른 유튜브 URL이 아닙니다"
+        return video_id
+
+    def _finish(self, started):
+        measure(self.timings, 'format', self.format_transcript)
+        self.timings['total'] = elapsed_ms(started)
+        return True
+
+    def process_youtube_url(self, url, start=None, end=None, max_chars=None):
+        """메인 처리 함수 (start/end/max_chars 를 주면 그 부분만 포맷팅)"""
+        try:
+            video_id = self._parse(url)
+            if not video_id:
+                return False
+
+            # 비디오 정보와 자막을 동시에 가져오기 (단계별 소요 시간은 self.timings)
+            started = time.perf_counter()
+            if fetch_pipelined(self, video_id) and self.select_range(start, end, max_chars):
+                return self._finish(started)
+            return False
+
+        except Exception as e:
+            self.error_details = str(e)
+            return False
+
+
+class AsyncYouTubeTextExtractor(YouTubeTextExtractor):
+    """asyncio 버전 추출기
+
+    process_youtube_url 이 코루틴이라는 점만 빼면 YouTubeTextExtractor 와 같다.
+    기본 백엔드(AsyncThreadedBackend)는 동기 백엔드를 공용 스레드 풀에서 실행하므로 task.cancel() 은
+    기다림만 끝내고 이미 시작한 요청은 멈추지 않는다. AsyncHttpTranscriptBackend 를 넘기면 keep-alive
+    연결 풀을 공유해 수백 개의 추출을 동시에 진행하고, 취소하면 요청도 바로 멈춘다.
+    """
+
+    def __init__(self, backend=None, cache=None, languages=None, output_format=DEFAULT_FORMAT, metadata=None):
+        super().__init__(cache=cache, backend=backend, languages=languages, output_format=output_format,
+                         metadata=metadata)
+        if self.backend is None:
+            # asyncio 백엔드는 비동기 추출기를 쓸 때만 불러온다 (동기 추출기의 시작 시간 절약)
+            from .aio import get_default_async_backend
+            self.backend = get_default_async_backend()
+
+    async def extract_transcript(self, video_id):
+        """자막 추출 (자막 목록 1회 + 선택한 자막 1회 조회)"""
+        try:
+            result = await fetch_transcript_async(self.backend, video_id, self.language_priorities, self.cache)
+        except Exception as e:
+            return self._fetch_failed(e)
+        return self._fetched(result)
+
+    async def process_youtube_url(self, url, start=None, end=None, max_chars=None):
+        """메인 처리 함수 (start/end/max_chars 를 주면 그 부분만 포맷팅)"""
+        try:
+            video_id = self._parse(url)
+            if not video_id:
+                return False
+
+            # 비디오 정보와 자막을 동시에 가져오기 (단계별 소요 시간은 self.timings)
+            started = time.perf_counter()
+            if await fetch_pipelined_async(self, video_id) and self.select_range(start, end, max_chars):
+                return self._finish(started)
+            return False
+
+        except Exception as e:
+            self.error_details = str(e)
+            return False
@@ -0,0 +1,188 @@
+"""
+로컬 가짜 자막 서버
+
+AsyncHttpTranscriptBackend 가 쓰는 JSON 프로토콜을 흉내 내는 테스트/벤치마크용 서버.
+실제 유튜브에 요청하지 않고 지연 시간, 오류 비율, 자막 크기를 조절하며 추출기를 돌려볼 수 있다.
+
+    with FakeTranscriptServer({'abc': [make_track('ko', make_entries(100))]}, latency=0.05) as server:
+        backend = AsyncHttpTranscriptBackend(server.url)
+
+동기 추출기는 HttpTranscriptBackend(server.url) 또는 YT_TRANSCRIPT_BACKEND_URL=server.url 로 연결한다.
+HTTP 까지 거칠 필요가 없는 테스트는 같은 자막 모음으로 FakeTranscriptBackend 를 바로 쓴다.
+"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .backends import TranscriptBackend, Track
+
+
+def make_entries(count, text='테스트 자막 문장입니다', duration=2.0):
+    """가짜 자막 항목 생성"""
+    return [
+        {'text': f'{text} {i}', 'start': i * duration, 'duration': duration}
+        for i in range(count)
+    ]
+
+
+def make_track(language_code, entries, is_generated=False, language=''):
+    """가짜 자막 트랙 생성"""
+    return {
+        'language_code': language_code,
+        'language': language or language_code,
+        'is_generated': is_generated,
+        'entries': entries,
+    }
+
+
+def make_corpus(count, entries_per_video=100, prefix='bench'):
+    """비디오 count개짜리 가짜 자막 모음 ({video_id: [track]}) - 비디오 ID는 11자"""
+    return {
+        f'{prefix}{i:0{11 - len(prefix)}d}': [make_track('ko', make_entries(entries_per_video))]
+        for i in range(count)
+    }
+
+
+class FakeTranscriptBackend(TranscriptBackend):
+    """메모리에 둔 가짜 자막을 돌려주는 백엔드 (FakeTranscriptServer 와 같은 자막 모음 형식)
+
+    transcripts: {video_id: [make_track(...), ...]}
+    latency: 호출마다 지연시킬 시간(초)
+    """
+
+    def __init__(self, transcripts=None, latency=0.0):
+        self.transcripts = transcripts if transcripts is not None else {}
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def _tracks(self, video_id):
+        with self._lock:
+            self.request_count += 1
+        if self.latency:
+            time.sleep(self.latency)
+        tracks = self.transcripts.get(video_id)
+        if not tracks:
+            raise LookupError('No transcripts found for this video')
+        return tracks
+
+    def list_tracks(self, video_id):
+        return [Track(t['language_code'], t['language'], t['is_generated']) for t in self._tracks(video_id)]
+
+    def fetch(self, video_id, track):
+        for t in self._tracks(video_id):
+            if t['language_code'] == track.language_code and t['is_generated'] == track.is_generated:
+                return list(t['entries'])
+        raise LookupError('No transcripts found for the requested language')
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 쓰므로 Nagle 을 끄지 않으면 keep-alive 요청마다 지연된 ACK 만큼 늦어진다
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        fake = self.server.fake
+        delay, error_status = fake.next_response()
+        if delay:
+            time.sleep(delay)
+        if error_status:
+            self._send(error_status, {'error': f'Fake server error {error_status}'})
+            return
+
+        parts = urlsplit(self.path)
+        segments = [unquote(segment) for segment in parts.path.strip('/').split('/')]
+        if len(segments) < 2 or segments[0] != 'transcripts':
+            self._send(404, {'error': 'Not found'})
+            return
+
+        tracks = fake.transcripts.get(segments[1])
+        if not tracks:
+            self._send(404, {'error': 'No transcripts found for this video'})
+            return
+
+        if len(segments) == 2:
+            self._send(200, {'tracks': [
+                {key: track[key] for key in ('language_code', 'language', 'is_generated')}
+                for track in tracks
+            ]})
+            return
+
+        generated = parse_qs(parts.query).get('generated', ['0'])[0] == '1'
+        for track in tracks:
+            if track['language_code'] == segments[2] and track['is_generated'] == generated:
+                self._send(200, {'entries': track['entries']})
+                return
+        self._send(404, {'error': 'No transcripts found for the requested language'})
+
+
+class FakeTranscriptServer:
+    """스레드로 도는 가짜 자막 서버
+
+    transcripts: {video_id: [make_track(...), ...]}
+    latency: 응답마다 지연시킬 시간(초)
+    jitter: 지연 시간에 더할 0~jitter 초의 무작위 값
+    error_rate: 이 비율의 요청에 error_status 로 응답 (0~1)
+    """
+
+    def __init__(self, transcripts=None, latency=0.0, host='127.0.0.1', port=0, jitter=0.0, error_rate=0.0,
+                 error_status=503, seed=None):
+        self.transcripts = transcripts if transcripts is not None else {}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.request_count = 0
+        self.error_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _FakeHandler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = None
+
+    def next_response(self):
+        """(지연 시간, 오류 상태 코드 또는 None) - 요청 수를 센다"""
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            error_status = None
+            if self.error_rate and self._random.random() < self.error_rate:
+                error_status = self.error_status
+                self.error_count += 1
+            return delay, error_status
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,155 @@
+"""
+출력 형식
+
+한 번 받아 온 transcript_data(start/duration 포함)로 여러 형식을 다시 조회 없이 만든다.
+모든 형식은 문자열 조각을 차례로 내보내는 스트리밍 writer 라서
+긴 자막도 전체 문자열을 중간에 만들 필요가 없다.
+
+    text      추출기의 기본 텍스트 (formatted_text 와 같음)
+    srt       SubRip 자막
+    vtt       WebVTT 자막
+    json      타임스탬프가 붙은 JSON
+    markdown  일정 간격 챕터로 나눈 Markdown 문단
+
+새 형식은 register_format(name, writer, content_type, extension) 으로 추가한다.
+writer(extractor) 는 문자열 조각을 yield 하는 함수다.
+transcript_data 는 dict 리스트든 CompactTranscript 든 iter_rows 로 읽는다.
+"""
+
+import json
+
+from .entries import iter_rows
+from .formatting import clean_line
+
+
+DEFAULT_FORMAT = 'text'
+
+# Markdown 챕터 간격(초)
+CHAPTER_SECONDS = 300
+
+
+class OutputFormat:
+    """등록된 출력 형식 하나"""
+
+    __slots__ = ('name', 'writer', 'content_type', 'extension')
+
+    def __init__(self, name, writer, content_type, extension):
+        self.name = name
+        self.writer = writer
+        self.content_type = content_type
+        self.extension = extension
+
+
+FORMATS = {}
+
+
+def register_format(name, writer, content_type='text/plain; charset=utf-8', extension='txt'):
+    """출력 형식 등록 (같은 이름이 있으면 교체)"""
+    FORMATS[name] = OutputFormat(name, writer, content_type, extension)
+    return FORMATS[name]
+
+
+def get_format(name):
+    """이름으로 출력 형식 찾기 (없으면 ValueError)"""
+    output_format = FORMATS.get(name or DEFAULT_FORMAT)
+    if output_format is None:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {name} (가능한 형식: {', '.join(FORMATS)})")
+    return output_format
+
+
+def iter_output(extractor, name=None):
+    """추출기의 자막을 지정한 형식으로 조각 단위 생성"""
+    if name is None:
+        name = getattr(extractor, 'output_format', DEFAULT_FORMAT)
+    return get_format(name).writer(extractor)
+
+
+def render_output(extractor, name=None):
+    """추출기의 자막을 지정한 형식의 문자열로 변환"""
+    return ''.join(iter_output(extractor, name))
+
+
+def _timestamp(seconds, separator):
+    millis = int(round(float(seconds or 0) * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _cue_lines(text):
+    # 빈 줄은 자막 블록의 끝을 뜻하므로 남기지 않는다
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def _iter_cues(entries):
+    """(start, end, text) 를 차례로 생성 (텍스트가 빈 항목은 건너뜀)"""
+    for text, start, duration in iter_rows(entries):
+        text = _cue_lines(text)
+        if text:
+            start = start or 0
+            yield start, start + (duration or 0), text
+
+
+def write_text(extractor):
+    if hasattr(extractor, 'iter_formatted'):
+        return extractor.iter_formatted()
+    return iter([extractor.format_transcript()])
+
+
+def write_srt(extractor):
+    for number, (start, end, text) in enumerate(_iter_cues(extractor.transcript_data), 1):
+        yield f"{number}\n{_timestamp(start, ',')} --> {_timestamp(end, ',')}\n{text}\n\n"
+
+
+def write_vtt(extractor):
+    yield "WEBVTT\n\n"
+    for start, end, text in _iter_cues(extractor.transcript_data):
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        yield f"{_timestamp(start, '.')} --> {_timestamp(end, '.')}\n{text}\n\n"
+
+
+def write_json(extractor):
+    video_info = extractor.video_info
+    header = {
+        "video_id": video_info.get('video_id'),
+        "title": video_info.get('title'),
+        "language": getattr(extractor, 'transcript_language', None),
+    }
+    # 머리 객체의 닫는 괄호 대신 entries 배열을 열고 항목을 하나씩 이어 쓴다
+    yield json.dumps(header, ensure_ascii=False)[:-1] + ', "entries": ['
+    separator = ''
+    for text, start, duration in iter_rows(extractor.transcript_data):
+        item = {"text": text, "start": start, "duration": duration}
+        yield separator + json.dumps(item, ensure_ascii=False)
+        separator = ', '
+    yield ']}'
+
+
+def write_markdown(extractor):
+    title = extractor.video_info.get('title')
+    if title:
+        yield f"# {title}\n\n"
+
+    chapter = None
+    for text, start, _ in iter_rows(extractor.transcript_data):
+        line = clean_line(text)
+        if not line:
+            continue
+        current = int((start or 0) // CHAPTER_SECONDS)
+        if current != chapter:
+            if chapter is not None:
+                yield "\n\n"
+            yield f"## {_timestamp(current * CHAPTER_SECONDS, ',')[:8]}\n\n{line}"
+            chapter = current
+        else:
+            yield ' ' + line
+    if chapter is not None:
+        yield "\n"
+
+
+register_format('text', write_text)
+register_format('srt', write_srt, 'application/x-subrip; charset=utf-8', 'srt')
+register_format('vtt', write_vtt, 'text/vtt; charset=utf-8', 'vtt')
+register_format('json', write_json, 'application/json; charset=utf-8', 'json')
+register_format('markdown', write_markdown, 'text/markdown; charset=utf-8', 'md')
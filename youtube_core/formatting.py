@@ -0,0 +1,102 @@
+"""
+문장 단위 자막 포맷터
+
+api/youtube_text_extractor.py 의 format_transcript 가 쓰는 포맷팅 엔진.
+자막 항목을 한 번만 훑으면서 공백 정리, 잡음 토큰([음악] 등) 제거, 문장 나누기를
+함께 처리한다. 예전 구현(항목마다 re.sub 두 번 → 전체 join → re.split → 다시 join)과
+결과가 바이트 단위로 같다.
+
+    예전 구현                         이 구현
+    strip + re.sub(\\n+) + re.sub(\\s+)  ' '.join(text.split())  (같은 공백 문자 집합)
+    list 에서 잡음 토큰 찾기            frozenset 조회
+    전체 문자열에 re.split([.!?]\\s+)   항목마다 미리 컴파일한 [.!?] 로 나누고
+                                      항목 경계(연결 공백)는 따로 처리
+"""
+
+import re
+
+from .entries import iter_texts
+
+
+# 자막 텍스트 전체가 이것뿐이면 버리는 토큰
+NOISE_TOKENS = frozenset(['[음악]', '[Music]', '[Applause]', '[박수]'])
+
+SENTENCE_TERMINATORS = '.!?'
+
+# 공백이 정리된 텍스트에서는 문장 끝 뒤의 공백이 항상 한 칸이다
+_SENTENCE_BREAK = re.compile(r'[.!?] ')
+
+# 이보다 짧은 문장(공백 제거 후 글자 수)은 버린다
+MIN_SENTENCE_CHARS = 4
+
+
+def iter_clean_lines(entries, noise_tokens=NOISE_TOKENS):
+    """공백을 정리하고 빈 항목/잡음 토큰을 뺀 자막 텍스트를 차례로 생성"""
+    for text in iter_texts(entries):
+        text = ' '.join(text.split())
+        if text and text not in noise_tokens:
+            yield text
+
+
+def clean_line(text, noise_tokens=NOISE_TOKENS):
+    """iter_clean_lines 의 항목 하나 버전 (버릴 항목이면 빈 문자열)"""
+    text = ' '.join(text.split())
+    return '' if text in noise_tokens else text
+
+
+def _finish_sentence(parts):
+    sentence = ''.join(parts).strip()
+    if len(sentence) < MIN_SENTENCE_CHARS:
+        return None
+    if sentence[-1] not in SENTENCE_TERMINATORS:
+        sentence += '.'
+    return sentence
+
+
+def iter_sentences(entries, noise_tokens=NOISE_TOKENS):
+    """자막 항목을 한 번 훑으면서 완성된 문장을 차례로 생성
+
+    항목들은 공백 한 칸으로 이어진 것처럼 다루므로, 앞 항목이 문장 부호로 끝나면
+    그 경계에서 문장이 끝난다.
+    """
+    split = _SENTENCE_BREAK.split
+    pending = []
+    previous_end = ''
+
+    for line in iter_clean_lines(entries, noise_tokens):
+        if previous_end in SENTENCE_TERMINATORS and pending:
+            # 앞 항목 끝의 문장 부호 + 연결 공백이 문장 경계
+            pending[-1] = pending[-1][:-1]
+            sentence = _finish_sentence(pending)
+            if sentence:
+                yield sentence
+            pending = []
+        elif pending:
+            pending.append(' ')
+
+        pieces = split(line)
+        pending.append(pieces[0])
+        for piece in pieces[1:]:
+            sentence = _finish_sentence(pending)
+            if sentence:
+                yield sentence
+            pending = [piece]
+        previous_end = line[-1]
+
+    if pending:
+        sentence = _finish_sentence(pending)
+        if sentence:
+            yield sentence
+
+
+def iter_formatted_sentences(entries, separator='\n\n', noise_tokens=NOISE_TOKENS):
+    """문장을 구분자와 함께 조각 단위로 생성 (이어 붙이면 format_sentences 결과와 같다)"""
+    prefix = ''
+    for sentence in iter_sentences(entries, noise_tokens):
+        yield prefix + sentence
+        prefix = separator
+
+
+def format_sentences(entries, separator='\n\n', noise_tokens=NOISE_TOKENS):
+    """자막 항목을 문장 단위 텍스트로 포맷팅"""
+    return separator.join(iter_sentences(entries, noise_tokens))
@@ -0,0 +1,169 @@
+"""
+HTTP 응답 압축과 캐시 검증
+
+긴 영상의 응답은 한국어 JSON 만으로 수백 KB 가 되므로
+    - Accept-Encoding 에 따라 brotli(설치돼 있을 때) 또는 gzip 으로 압축한다
+    - 강한 ETag 를 붙이고, If-None-Match 가 맞으면 304 로 본문 없이 답한다
+    - 성공한 GET 응답에는 CDN 이 캐시할 수 있는 Cache-Control 을 붙인다
+
+ETag 는 되도록 transcript_etag 로 "무엇을 응답할지"(비디오 ID, 고른 트랙과 그 자막, 형식, 구간 옵션)에서
+만든다. 캐시에 자막이 있으면 자막을 가져오거나 포맷하기 전에 계산할 수 있으므로 If-None-Match 가 맞는
+요청은 추출 없이 바로 304 로 끝난다. 캐시가 없을 때만 본문으로 만든다(make_etag).
+해시는 sha256 앞 32자리 하나만 쓴다 - Next.js 라우트(pages/api/extract.js)는 ETag 를 직접 만들지 않고
+extract_api.py --serve 가 돌려준 값을 그대로 쓴다.
+
+같은 본문이면 압축 결과도 항상 같다 (gzip mtime=0). 압축한 표현은 ETag 에 인코딩 이름을 붙여
+구분하고("...-br"), If-None-Match 비교 때는 어느 표현이든 같은 내용으로 본다.
+
+YT_HTTP_MAX_AGE          브라우저 캐시 시간(초, 기본 3600)
+YT_HTTP_SHARED_MAX_AGE   CDN(공유 캐시) 캐시 시간(초, 기본 86400)
+"""
+
+import gzip
+import hashlib
+import os
+
+from .compact import CompactTranscript
+from .resolver import peek_transcript
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# 이보다 작은 본문은 압축하지 않는다 (헤더/CPU 비용이 더 크다)
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# 응답 모양(info 필드 등)이 바뀌면 올려서 예전 ETag 가 맞지 않게 한다
+ETAG_VERSION = 1
+
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+_SUFFIXES = {'br': '-br', 'gzip': '-gz'}
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 을 {코딩: q값} 으로 변환"""
+    codings = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[name] = quality
+    return codings
+
+
+def negotiate_encoding(header):
+    """지원하는 압축 중 클라이언트가 받는 것 (br 우선, 없으면 None)"""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get('*', 0.0)
+    for name in SUPPORTED_ENCODINGS:
+        if codings.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+def select_encoding(body, accept_encoding):
+    """본문에 쓸 압축 (작은 본문이나 받을 수 있는 압축이 없으면 None)"""
+    if len(body) < MIN_COMPRESS_BYTES:
+        return None
+    return negotiate_encoding(accept_encoding)
+
+
+def _quoted(digest):
+    return '"' + digest.hexdigest()[:32] + '"'
+
+
+def make_etag(body):
+    """압축 전 본문으로 만든 강한 ETag"""
+    return _quoted(hashlib.sha256(body))
+
+
+def transcript_etag(extractor, video_id, selection=None, raw=False):
+    """캐시에 있는 자막으로 만든 ETag - 자막을 가져오거나 포맷하기 전에 계산한다
+
+    extractor 의 캐시/언어 우선순위/출력 형식으로 fetch_transcript 가 고를 트랙을 찾고, 그 트랙의 자막 내용과
+    형식/구간 옵션을 해시한다. 같은 값이면 본문도 같다. 캐시에 없거나 메타데이터 서비스를 써서
+    본문이 자막 밖의 정보에 달려 있으면 None.
+    """
+    if not video_id or getattr(extractor, 'metadata', None) is not None:
+        return None
+    result = peek_transcript(video_id, extractor.language_priorities, extractor.cache)
+    if result is None:
+        return None
+    entries = CompactTranscript.from_entries(result.entries)
+    identity = (ETAG_VERSION, type(extractor).__name__, extractor.sentence_format, video_id,
+                result.track.language_code, result.track.is_generated, extractor.output_format,
+                sorted((selection or {}).items()), bool(raw))
+    digest = hashlib.sha256(repr(identity).encode('utf-8'))
+    for column in (entries.starts, entries.durations, entries.offsets):
+        digest.update(column.tobytes())
+    digest.update(entries.text.encode('utf-8'))
+    return _quoted(digest)
+
+
+def representation_etag(etag, encoding):
+    """압축한 표현의 ETag ("...-br", "...-gz")"""
+    if encoding is None:
+        return etag
+    return etag[:-1] + _SUFFIXES[encoding] + '"'
+
+
+def _opaque_tag(tag):
+    tag = tag.strip()
+    if tag.startswith('W/'):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in _SUFFIXES.values():
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)]
+    return tag
+
+
+def matching_tag(if_none_match, etag):
+    """If-None-Match 에서 etag 와 같은 내용을 가리키는 태그 (약한 비교, 없으면 None)
+
+    304 응답에는 클라이언트가 가진 표현의 태그("...-gz" 등)를 그대로 돌려준다.
+    """
+    if not if_none_match or not etag:
+        return None
+    if if_none_match.strip() == '*':
+        return etag
+    target = _opaque_tag(etag)
+    for tag in if_none_match.split(','):
+        if _opaque_tag(tag) == target:
+            return tag.strip()
+    return None
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더가 etag 와 같은 내용을 가리키는지 (약한 비교)"""
+    return matching_tag(if_none_match, etag) is not None
+
+
+def cache_control(success):
+    """성공 응답은 브라우저/CDN 캐시 허용, 실패 응답은 저장하지 않는다"""
+    if not success:
+        return 'no-store'
+    max_age = int(os.environ.get('YT_HTTP_MAX_AGE', '3600'))
+    shared_max_age = int(os.environ.get('YT_HTTP_SHARED_MAX_AGE', '86400'))
+    return f'public, max-age={max_age}, s-maxage={shared_max_age}, stale-while-revalidate={shared_max_age}'
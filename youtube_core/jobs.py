@@ -0,0 +1,151 @@
+"""
+백그라운드 추출 작업
+
+추출을 스레드 풀에서 실행하고 작업 ID로 상태를 조회한다 (Streamlit 앱처럼 화면을 막으면 안 되는 곳에서 사용).
+    - submit(url) 은 바로 작업을 돌려주고, get(job_id) 로 진행 상태와 결과를 확인한다
+    - 같은 비디오 ID는 진행 중이거나 result_ttl 안에 성공한 작업을 그대로 돌려준다 (다시 가져오지 않음)
+    - 끝난 작업은 최대 max_jobs 개까지 보관하고 오래된 것부터 지운다
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .response import run_extraction, translate_error
+
+
+DEFAULT_JOB_WORKERS = 4
+DEFAULT_RESULT_TTL = 60 * 60
+DEFAULT_MAX_JOBS = 256
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class Job:
+    """추출 작업 하나"""
+
+    __slots__ = ('job_id', 'url', 'video_id', 'status', 'result', 'created_at', 'started_at', 'finished_at')
+
+    def __init__(self, job_id, url, video_id):
+        self.job_id = job_id
+        self.url = url
+        self.video_id = video_id
+        self.status = QUEUED
+        # run_extraction 응답 dict (끝난 뒤에만 채워진다)
+        self.result = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def elapsed(self):
+        """시작 후 지난 시간(초) - 아직 시작하지 않았으면 0"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self):
+        return {
+            'job_id': self.job_id,
+            'url': self.url,
+            'video_id': self.video_id,
+            'status': self.status,
+            'elapsed': round(self.elapsed(), 2),
+            'result': self.result,
+        }
+
+
+class JobQueue:
+    """추출 작업을 백그라운드에서 실행하는 대기열"""
+
+    def __init__(self, extractor_factory, max_workers=DEFAULT_JOB_WORKERS, result_ttl=DEFAULT_RESULT_TTL,
+                 max_jobs=DEFAULT_MAX_JOBS):
+        self.extractor_factory = extractor_factory
+        self.result_ttl = result_ttl
+        self.max_jobs = max_jobs
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._parser = extractor_factory()
+        self._ids = itertools.count(1)
+        self._jobs = OrderedDict()
+        self._by_video = {}
+        self._lock = threading.Lock()
+        self.reused = 0
+
+    def _reusable(self, job):
+        if job is None or job.status == FAILED:
+            return False
+        if job.status == DONE:
+            return time.time() - job.finished_at < self.result_ttl
+        return True
+
+    def submit(self, url):
+        """작업 등록 후 Job 반환 (잘못된 URL이면 None)"""
+        url = (url or '').strip()
+        video_id = self._parser.extract_video_id(url) if url else None
+        if not video_id:
+            return None
+
+        with self._lock:
+            job = self._jobs.get(self._by_video.get(video_id))
+            if self._reusable(job):
+                self.reused += 1
+                return job
+            job = Job(f'job-{next(self._ids)}', url, video_id)
+            self._jobs[job.job_id] = job
+            self._by_video[video_id] = job.job_id
+            self._evict()
+
+        self.executor.submit(self._run, job)
+        return job
+
+    def submit_many(self, urls):
+        """여러 URL 등록 - [(url, Job 또는 None), ...]"""
+        return [(url, self.submit(url)) for url in urls]
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job):
+        job.started_at = time.time()
+        job.status = RUNNING
+        result = {'success': False, 'error': '작업이 중단되었습니다'}
+        try:
+            result = run_extraction(self.extractor_factory(), job.url)
+        except Exception as e:
+            # 추출기 생성 실패 등 run_extraction 밖의 예외
+            result = {'success': False, 'error': translate_error(str(e), default_prefix=True)}
+        finally:
+            # 어떤 경우에도 RUNNING 으로 남지 않게 (남으면 재사용/정리 대상에서 영영 빠진다)
+            job.result = result
+            job.finished_at = time.time()
+            job.status = DONE if result.get('success') else FAILED
+
+    def _evict(self):
+        # 끝난 작업 중 오래된 것부터 지운다 (진행 중인 작업은 남긴다)
+        excess = len(self._jobs) - self.max_jobs
+        for job_id in list(self._jobs):
+            if excess <= 0:
+                break
+            job = self._jobs[job_id]
+            if job.finished:
+                del self._jobs[job_id]
+                if self._by_video.get(job.video_id) == job_id:
+                    del self._by_video[job.video_id]
+                excess -= 1
+
+    def stats(self):
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        counts['reused'] = self.reused
+        return counts
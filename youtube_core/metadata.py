@@ -0,0 +1,191 @@
+"""
+비디오 메타데이터
+
+yt_dlp 로 제목/채널/길이 등 응답에 쓰는 필드만 가져온다.
+    - 워커 스레드마다 YoutubeDL 을 하나씩 만들어 계속 재사용한다 (YoutubeDL 은 스레드 안전하지 않다)
+    - extract_info(process=False) 로 포맷 목록 처리와 DASH/HLS 매니페스트 조회를 건너뛴다
+    - 결과는 공용 캐시에 TTL 을 두고 저장한다
+    - submit() 으로 자막 조회와 동시에 실행할 수 있다
+    - 요청은 자막과 같은 OutboundScheduler(속도 제한/재시도/회로 차단기)를 거친다
+    - 보관소(YT_ARCHIVE_PATH)를 쓰면 가져온 정보를 영구히 저장하고, 캐시에 없을 때 보관소에서 먼저 찾는다
+    - 같은 extract_info 응답의 자막 트랙 주소(subtitles/automatic_captions)도 저장해 두고
+      yt_dlp 자막 백엔드(youtube_core.subtitles)가 목록 요청 없이 쓴다
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .archive import get_default_archive, store_quietly
+from .cache import CAPTIONS_KEY, METADATA_KEY, get_default_cache
+from .scheduler import get_default_scheduler
+from .singleflight import get_default_singleflight
+
+
+DEFAULT_METADATA_TTL = 6 * 60 * 60
+DEFAULT_METADATA_WORKERS = 4
+# 자막 주소에는 만료 시각이 들어 있으므로 메타데이터보다 짧게 둔다
+DEFAULT_CAPTIONS_TTL = 60 * 60
+
+# 받아 올 자막 파일 형식 (앞쪽 우선)
+CAPTION_FORMATS = ('json3', 'vtt')
+
+# 응답에 쓰는 필드: 결과 키 -> yt_dlp info 키
+METADATA_FIELDS = (
+    ('title', 'title', '제목 없음'),
+    ('channel', 'uploader', '채널 없음'),
+    ('duration', 'duration', 0),
+    ('view_count', 'view_count', 0),
+    ('upload_date', 'upload_date', ''),
+    ('description', 'description', ''),
+)
+
+YDL_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'noplaylist': True,
+    'extractor_args': {'youtube': {'skip': ['dash', 'hls', 'translated_subs']}},
+}
+
+
+def placeholder_info(video_id):
+    """메타데이터 서비스를 쓰지 않거나 가져오지 못했을 때의 기본 정보 (모든 진입점이 같은 값을 쓴다)"""
+    return {'title': f'YouTube Video {video_id}', 'channel': 'Unknown', 'duration': 0, 'video_id': video_id}
+
+
+def caption_tracks(info):
+    """extract_info 결과에서 자막 트랙 목록 추출
+
+    [{'language_code', 'language', 'is_generated', 'formats': {'json3': url, 'vtt': url}}, ...]
+    수동 자막(subtitles)이 자동 자막(automatic_captions)보다 앞에 온다.
+    """
+    tracks = []
+    for source, is_generated in (('subtitles', False), ('automatic_captions', True)):
+        for language_code, formats in (info.get(source) or {}).items():
+            urls = {f['ext']: f['url'] for f in formats if f.get('ext') in CAPTION_FORMATS and f.get('url')}
+            if not urls:
+                continue
+            name = next((f['name'] for f in formats if f.get('name')), '')
+            tracks.append({'language_code': language_code, 'language': name,
+                           'is_generated': is_generated, 'formats': urls})
+    return tracks
+
+
+class MetadataService:
+    """오래 유지되는 YoutubeDL 로 비디오 메타데이터를 가져오는 서비스"""
+
+    def __init__(self, cache=None, ttl=DEFAULT_METADATA_TTL, max_workers=DEFAULT_METADATA_WORKERS,
+                 ydl_options=None, scheduler=None, archive=None, captions_ttl=DEFAULT_CAPTIONS_TTL):
+        # 캐시를 따로 넘기지 않으면 프로세스 공용 캐시 사용
+        self.cache = cache if cache is not None else get_default_cache()
+        self.ttl = ttl
+        self.captions_ttl = captions_ttl
+        self.scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        self.archive = archive if archive is not None else get_default_archive()
+        self.ydl_options = dict(ydl_options or YDL_OPTIONS)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='metadata')
+        self._local = threading.local()
+
+    def _ydl(self):
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+            ydl = self._local.ydl = yt_dlp.YoutubeDL(self.ydl_options)
+        return ydl
+
+    def fetch(self, video_id):
+        """메타데이터 dict 반환 (실패하면 예외) - 같은 비디오의 동시 조회는 하나로 합친다"""
+        flight = get_default_singleflight()
+        if flight is None:
+            return self._fetch(video_id)
+        metadata, _ = flight.do(('metadata', id(self), video_id), lambda: self._fetch(video_id))
+        return dict(metadata)
+
+    def _fetch(self, video_id):
+        record = self.cache.get(video_id, METADATA_KEY) if self.cache else None
+        if record is not None and 'metadata' in record:
+            return dict(record['metadata'])
+
+        metadata = self.archive.get_info(video_id) if self.archive is not None else None
+        if metadata is not None:
+            if self.cache:
+                self.cache.put_metadata(video_id, metadata, self.ttl)
+            return dict(metadata)
+
+        metadata, _ = self._extract(video_id)
+        return dict(metadata)
+
+    def _extract(self, video_id):
+        """extract_info 1회로 (메타데이터, 자막 트랙 목록)을 가져와 저장 - 동시 조회는 하나로 합친다"""
+        flight = get_default_singleflight()
+        if flight is None:
+            return self._extract_info(video_id)
+        result, _ = flight.do(('video_info', id(self), video_id), lambda: self._extract_info(video_id))
+        return result
+
+    def _extract_info(self, video_id):
+        info = self.scheduler.call(
+            self._ydl().extract_info,
+            f'https://www.youtube.com/watch?v={video_id}', download=False, process=False
+        )
+        metadata = {key: info.get(source) or default for key, source, default in METADATA_FIELDS}
+        metadata['video_id'] = video_id
+        captions = caption_tracks(info)
+
+        if self.cache:
+            self.cache.put_metadata(video_id, metadata, self.ttl)
+            self.cache.put_captions(video_id, captions, self.captions_ttl)
+        if self.archive is not None:
+            store_quietly(self.archive.put_info, video_id, metadata)
+        return metadata, captions
+
+    def captions(self, video_id):
+        """yt_dlp 자막 트랙 목록 (caption_tracks 형식) - 캐시에 없으면 extract_info 1회, 실패하면 예외"""
+        record = self.cache.get(video_id, CAPTIONS_KEY) if self.cache else None
+        if record is not None and 'captions' in record:
+            return record['captions']
+        _, captions = self._extract(video_id)
+        return captions
+
+    def download(self, url):
+        """자막 파일 등 작은 파일을 같은 YoutubeDL(쿠키/헤더/프록시)로 받아 bytes 로 반환"""
+        return self.scheduler.call(self._read_url, url)
+
+    def _read_url(self, url):
+        with self._ydl().urlopen(url) as response:
+            return response.read()
+
+    def get(self, video_id):
+        """메타데이터 dict 반환 (실패하면 기본 정보)"""
+        try:
+            return self.fetch(video_id)
+        except Exception:
+            return placeholder_info(video_id)
+
+    def submit(self, video_id):
+        """백그라운드에서 get() 실행, Future 반환"""
+        return self.executor.submit(self.get, video_id)
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_default_metadata_service():
+    """프로세스 공용 메타데이터 서비스
+
+    YT_METADATA_TTL      메타데이터 TTL 초 (기본 6시간)
+    YT_METADATA_WORKERS  동시에 가져올 수 있는 메타데이터 수 (기본 4)
+    YT_CAPTIONS_TTL      yt_dlp 자막 트랙 주소 TTL 초 (기본 1시간)
+    """
+    global _default_service
+
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = MetadataService(
+                ttl=float(os.environ.get('YT_METADATA_TTL', DEFAULT_METADATA_TTL)),
+                max_workers=int(os.environ.get('YT_METADATA_WORKERS', DEFAULT_METADATA_WORKERS)),
+                captions_ttl=float(os.environ.get('YT_CAPTIONS_TTL', DEFAULT_CAPTIONS_TTL)),
+            )
+        return _default_service
@@ -0,0 +1,250 @@
+"""
+추출 지표
+
+단계별 소요 시간, 언어 대체 횟수, 자막 크기 등을 모아서 Prometheus 텍스트 형식으로 내보낸다.
+    - Counter / Histogram: 라벨별로 값을 모으는 스레드 안전한 지표
+    - observe_stage(stage, seconds): 단계(parse, metadata, transcript, list, fetch, format) 소요 시간 기록
+    - render(): GET /metrics 응답 본문 (캐시/요청 합치기/유튜브 스케줄러 상태도 함께 내보낸다)
+
+YT_METRICS_DISABLE=1 이면 기록 함수가 아무것도 하지 않는다 (ENABLED 확인 한 번의 비용만 남는다).
+"""
+
+import os
+import threading
+from bisect import bisect_left
+
+from .compact import CompactTranscript
+from .entries import iter_texts
+
+
+ENABLED = os.environ.get('YT_METRICS_DISABLE') != '1'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ENTRY_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+CHAR_BUCKETS = (1000, 5000, 10000, 25000, 50000, 100000, 250000, 500000)
+
+
+def _label_text(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{value}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """증가만 하는 지표"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            yield f'{self.name}{_label_text(self.labelnames, labels)} {_number(value)}'
+
+
+class Histogram:
+    """구간별 관측 횟수와 합계를 모으는 지표"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                # [구간별 횟수..., +Inf 횟수, 합계]
+                state = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def count(self, *labels):
+        with self._lock:
+            state = self._values.get(labels)
+            return sum(state[:-1]) if state else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((labels, list(state)) for labels, state in self._values.items())
+        names = self.labelnames + ('le',)
+        for labels, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), state[:-1]):
+                cumulative += count
+                yield f'{self.name}_bucket{_label_text(names, labels + (bound,))} {cumulative}'
+            label_text = _label_text(self.labelnames, labels)
+            yield f'{self.name}_sum{label_text} {_number(state[-1])}'
+            yield f'{self.name}_count{label_text} {cumulative}'
+
+
+class MetricsRegistry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, help_text, labelnames=()):
+        metric = Counter(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        metric = Histogram(name, help_text, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        """render() 때마다 호출해서 (이름, 종류, 설명, [(라벨 dict, 값), ...]) 들을 받는 함수 등록"""
+        self._collectors.append(collector)
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples())
+        for collector in self._collectors:
+            for name, kind, help_text, samples in collector():
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in samples:
+                    lines.append(f'{name}{_label_text(tuple(labels), tuple(labels.values()))} {_number(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'yt_stage_seconds', 'Time spent in each extraction stage', ('stage',))
+EXTRACTIONS = REGISTRY.counter(
+    'yt_extractions_total', 'Transcript extractions by result', ('result',))
+TRACK_SELECTIONS = REGISTRY.counter(
+    'yt_track_selections_total', 'Selected transcript track: preferred language or fallback', ('kind',))
+BACKEND_FALLBACKS = REGISTRY.counter(
+    'yt_backend_fallbacks_total', 'Transcript requests retried on a fallback backend', ('stage', 'result'))
+TRANSCRIPT_ENTRIES = REGISTRY.histogram(
+    'yt_transcript_entries', 'Number of entries per extracted transcript', buckets=ENTRY_BUCKETS)
+TRANSCRIPT_CHARS = REGISTRY.histogram(
+    'yt_transcript_chars', 'Characters per extracted transcript', buckets=CHAR_BUCKETS)
+
+
+def observe_stage(stage, seconds):
+    if ENABLED:
+        STAGE_SECONDS.observe(seconds, stage)
+
+
+def record_selection(fallback):
+    """우선순위 언어를 찾았는지(preferred), 첫 번째 자막으로 대체했는지(fallback) 기록"""
+    if ENABLED:
+        TRACK_SELECTIONS.inc('fallback' if fallback else 'preferred')
+
+
+def record_backend_fallback(stage, success):
+    """앞 백엔드가 실패해서 예비 백엔드로 목록(list)/자막(fetch)을 다시 조회한 결과 기록"""
+    if ENABLED:
+        BACKEND_FALLBACKS.inc(stage, 'success' if success else 'failure')
+
+
+def record_extraction(extractor, success):
+    """추출 결과와 자막 크기 기록"""
+    if not ENABLED:
+        return
+    EXTRACTIONS.inc('success' if success else 'failure')
+    if success:
+        entries = extractor.transcript_data
+        TRANSCRIPT_ENTRIES.observe(len(entries))
+        # CompactTranscript 는 텍스트를 한 문자열로 들고 있어서 글자 수를 항목을 돌지 않고 안다
+        if isinstance(entries, CompactTranscript):
+            TRANSCRIPT_CHARS.observe(len(entries.text))
+        else:
+            TRANSCRIPT_CHARS.observe(sum(map(len, iter_texts(entries))))
+
+
+def _collect_shared_state():
+    """캐시, 요청 합치기, 유튜브 스케줄러의 누적 카운터"""
+    from .cache import get_default_cache
+    from .scheduler import get_default_scheduler
+    from .singleflight import get_default_singleflight
+
+    cache = get_default_cache()
+    if cache:
+        stats = cache.stats()
+        yield ('yt_cache_lookups_total', 'counter', 'Transcript cache lookups by result', [
+            ({'result': 'memory_hit'}, stats['memory_hits']),
+            ({'result': 'disk_hit'}, stats['disk_hits']),
+            ({'result': 'miss'}, stats['misses']),
+        ])
+        yield ('yt_cache_negative_hits_total', 'counter', 'Cached failures served', [
+            ({}, stats['negative_hits']),
+        ])
+
+    flight = get_default_singleflight()
+    if flight:
+        stats = flight.stats()
+        yield ('yt_singleflight_calls_total', 'counter', 'Coalesced calls by role', [
+            ({'role': 'leader'}, stats['leaders']),
+            ({'role': 'shared'}, stats['shared']),
+        ])
+
+    stats = get_default_scheduler().stats()
+    yield ('yt_youtube_requests_total', 'counter', 'Outbound YouTube requests by outcome', [
+        ({'outcome': name}, stats[name])
+        for name in ('calls', 'successes', 'failures', 'retries', 'throttled', 'blocked', 'rejected')
+    ])
+    yield ('yt_youtube_rate', 'gauge', 'Current outbound request rate limit (req/s)', [({}, stats['rate'])])
+    yield ('yt_youtube_circuit_open', 'gauge', '1 if the circuit breaker is not closed', [
+        ({}, 0 if stats['circuit']['state'] == 'closed' else 1),
+    ])
+
+
+REGISTRY.register_collector(_collect_shared_state)
+
+
+def _server_lines(stats):
+    lines = []
+    for name, kind, key, help_text in (
+        ('yt_server_active_requests', 'gauge', 'active', 'Connections being handled by a worker'),
+        ('yt_server_queued_requests', 'gauge', 'queued', 'Connections waiting for a worker'),
+        ('yt_server_handled_total', 'counter', 'handled', 'Connections handled'),
+        ('yt_server_rejected_total', 'counter', 'rejected', 'Connections rejected with 503'),
+    ):
+        lines.extend((f'# HELP {name} {help_text}', f'# TYPE {name} {kind}', f'{name} {stats[key]}'))
+    return '\n'.join(lines) + '\n'
+
+
+def render(server_stats=None):
+    """Prometheus 텍스트 형식 지표 (자체 서버면 server_stats 로 워커/대기열 상태도 포함)"""
+    text = REGISTRY.render()
+    if server_stats is not None:
+        text += _server_lines(server_stats)
+    return text
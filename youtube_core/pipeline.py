@@ -0,0 +1,143 @@
+"""
+메타데이터/자막 동시 조회
+
+비디오 ID만 알면 메타데이터와 자막은 서로 기다릴 필요가 없으므로 함께 가져온다.
+    - 자막은 호출한 스레드(또는 코루틴)에서, 메타데이터는 공용 스레드 풀에서 가져온다
+      (메타데이터 서비스가 없으면 기본 정보를 바로 채우고 스레드 풀은 쓰지 않는다)
+    - 메타데이터가 실패하거나 METADATA_WAIT 초 안에 끝나지 않으면 기본 정보를 쓴다
+    - 자막을 가져오지 못하면 메타데이터는 기다리지 않는다 (실패 응답에는 쓰지 않는다)
+
+단계별 소요 시간(ms)은 extractor.timings 에 기록되고 응답 info.timings 로 나간다.
+    parse, metadata, transcript (list, fetch), format, total
+같은 값은 youtube_core.metrics 의 yt_stage_seconds 로도 모인다.
+
+YT_PIPELINE_DISABLE=1 이면 예전처럼 메타데이터 → 자막 순서로 가져온다.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .metadata import placeholder_info
+from .metrics import observe_stage, record_extraction
+
+
+METADATA_WAIT = float(os.environ.get('YT_METADATA_WAIT', '5'))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def pipeline_enabled():
+    return os.environ.get('YT_PIPELINE_DISABLE') != '1'
+
+
+def _get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='pipeline')
+        return _executor
+
+
+def elapsed_ms(started):
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def measure(timings, name, func, *args):
+    """func(*args) 를 실행하고 걸린 시간을 timings[name] 에 기록"""
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        seconds = time.perf_counter() - started
+        timings[name] = round(seconds * 1000, 1)
+        observe_stage(name, seconds)
+
+
+def _timed_video_info(extractor, video_id):
+    """(video_info, 걸린 시간 ms) 반환, 실패하면 기본 정보"""
+    started = time.perf_counter()
+    try:
+        video_info = extractor.fetch_video_info(video_id)
+    except Exception:
+        video_info = placeholder_info(video_id)
+    seconds = time.perf_counter() - started
+    observe_stage('metadata', seconds)
+    return video_info, round(seconds * 1000, 1)
+
+
+def fetch_pipelined(extractor, video_id):
+    """메타데이터와 자막을 동시에 가져와 extractor 에 채운다 (extract_transcript 결과 반환)"""
+    success = _fetch_pipelined(extractor, video_id)
+    record_extraction(extractor, success)
+    return success
+
+
+def _fetch_pipelined(extractor, video_id):
+    timings = extractor.timings
+    extractor.video_info = placeholder_info(video_id)
+
+    if extractor.metadata is None or not pipeline_enabled():
+        # 메타데이터 서비스가 없으면 기본 정보는 바로 만들 수 있으므로 스레드 풀을 거치지 않는다
+        extractor.video_info, timings['metadata'] = _timed_video_info(extractor, video_id)
+        return measure(timings, 'transcript', extractor.extract_transcript, video_id)
+
+    future = _get_executor().submit(_timed_video_info, extractor, video_id)
+    success = measure(timings, 'transcript', extractor.extract_transcript, video_id)
+    if not success:
+        future.cancel()
+        return False
+
+    try:
+        extractor.video_info, timings['metadata'] = future.result(timeout=METADATA_WAIT)
+    except Exception:
+        # 메타데이터가 늦으면 자막만으로 응답 (결과는 백그라운드에서 캐시에 저장된다)
+        timings['metadata'] = None
+    return True
+
+
+async def fetch_pipelined_async(extractor, video_id):
+    """fetch_pipelined 의 asyncio 버전 (extract_transcript 가 코루틴)"""
+    success = await _fetch_pipelined_async(extractor, video_id)
+    record_extraction(extractor, success)
+    return success
+
+
+async def _fetch_pipelined_async(extractor, video_id):
+    import asyncio
+
+    timings = extractor.timings
+    metadata = None
+    if extractor.metadata is None:
+        # 기본 정보는 바로 만들 수 있으므로 스레드 풀을 거치지 않는다
+        extractor.video_info, timings['metadata'] = _timed_video_info(extractor, video_id)
+    else:
+        extractor.video_info = placeholder_info(video_id)
+        metadata = asyncio.get_running_loop().run_in_executor(_get_executor(), _timed_video_info, extractor, video_id)
+
+    started = time.perf_counter()
+    try:
+        success = await extractor.extract_transcript(video_id)
+    except BaseException:
+        if metadata is not None:
+            metadata.cancel()
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        timings['transcript'] = round(seconds * 1000, 1)
+        observe_stage('transcript', seconds)
+
+    if metadata is None:
+        return success
+    if not success:
+        metadata.cancel()
+        return False
+
+    try:
+        extractor.video_info, timings['metadata'] = await asyncio.wait_for(asyncio.shield(metadata), METADATA_WAIT)
+    except asyncio.TimeoutError:
+        timings['metadata'] = None
+    return True
@@ -0,0 +1,77 @@
+"""
+서버 모드 미리 준비
+
+무거운 의존성(youtube_transcript_api, yt_dlp)과 공용 객체는 첫 사용 때 불러오므로
+서버리스 콜드 스타트는 빠르지만 상주 서버의 첫 요청이 그 비용을 낸다.
+상주 서버 모드(api/extract.py 자체 서버, extract_api.py --serve, Streamlit)는 시작할 때
+prewarm() 을 불러 첫 요청 전에 미리 준비할 수 있다.
+
+    --prewarm 옵션 또는 YT_PREWARM=1 로 켠다
+    background=True 면 데몬 스레드에서 준비해서 서버 시작을 늦추지 않는다
+"""
+
+import os
+import threading
+import time
+
+
+def prewarm_enabled():
+    return os.environ.get('YT_PREWARM') == '1'
+
+
+def _load_transcript_api():
+    import youtube_transcript_api  # noqa: F401
+    from .backends import get_default_backend
+    get_default_backend()
+
+
+def _load_metadata():
+    import yt_dlp  # noqa: F401
+    from .metadata import get_default_metadata_service
+    get_default_metadata_service()
+
+
+def _load_shared_state():
+    from .archive import get_default_archive
+    from .cache import get_default_cache
+    get_default_cache()
+    get_default_archive()
+
+
+def _load_formats():
+    from . import formats, formatting  # noqa: F401
+
+
+STEPS = (
+    ('transcript_api', _load_transcript_api),
+    ('metadata', _load_metadata),
+    ('cache', _load_shared_state),
+    ('formats', _load_formats),
+)
+
+
+def prewarm(metadata=False):
+    """무거운 모듈과 공용 객체를 미리 준비하고 단계별 소요 시간(ms)을 돌려준다
+
+    metadata=True 면 yt_dlp 와 메타데이터 서비스도 준비한다 (MetadataService 를 쓰는 추출기만 필요).
+    설치되지 않은 의존성처럼 실패한 단계는 건너뛰고 None 으로 기록한다 (첫 요청 때 원래 오류가 난다).
+    """
+    timings = {}
+    for name, step in STEPS:
+        if name == 'metadata' and not metadata:
+            continue
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            timings[name] = None
+            continue
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
+
+
+def start_prewarm(metadata=False):
+    """데몬 스레드에서 prewarm() 실행 (스레드 반환)"""
+    thread = threading.Thread(target=prewarm, kwargs={'metadata': metadata}, name='prewarm', daemon=True)
+    thread.start()
+    return thread
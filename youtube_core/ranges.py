@@ -0,0 +1,101 @@
+"""
+자막 구간 선택
+
+세 시간짜리 방송에서 10~25분만 필요할 때 전체를 포맷팅해서 보내지 않도록
+받아 온 자막(캐시에 있는 전체 자막)에서 필요한 부분만 잘라 포맷팅한다.
+    start, end   [start, end) 구간에서 시작하는 항목만 (초 숫자, 'MM:SS', 'HH:MM:SS')
+    max_chars    원문 글자 수 한도 (항목 단위로 자른다)
+
+CompactTranscript 의 이진 탐색으로 자르므로 포맷팅 시간과 응답 크기는 영상 길이가 아니라
+구간 크기에 비례한다. max_chars 로 잘렸으면 range.next_start 를 다음 요청의 start 로 넘겨
+이어서 받을 수 있다.
+"""
+
+from .compact import CompactTranscript
+
+
+RANGE_FIELDS = ('start', 'end', 'max_chars')
+
+
+def parse_time(value):
+    """초 숫자 또는 'MM:SS', 'HH:MM:SS(.sss)' 문자열을 초(float)로 변환 (None 이면 None)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"올바른 시간이 아닙니다: {value}")
+    if isinstance(value, (int, float)):
+        seconds = float(value)
+    else:
+        parts = str(value).strip().split(':')
+        if len(parts) > 3:
+            raise ValueError(f"올바른 시간이 아닙니다: {value}")
+        try:
+            numbers = [float(part) for part in parts]
+        except ValueError:
+            raise ValueError(f"올바른 시간이 아닙니다: {value}")
+        seconds = 0.0
+        for number in numbers:
+            seconds = seconds * 60 + number
+    if seconds < 0 or seconds != seconds:
+        raise ValueError(f"올바른 시간이 아닙니다: {value}")
+    return seconds
+
+
+def parse_range(data):
+    """요청 dict 의 start/end/max_chars 를 검사해서 process_youtube_url 키워드 인자 dict 로 변환
+
+    지정하지 않은 값은 빠진다 (아무것도 없으면 빈 dict). 잘못된 값이면 ValueError.
+    """
+    selection = {}
+    start = parse_time(data.get('start'))
+    end = parse_time(data.get('end'))
+    if start is not None:
+        selection['start'] = start
+    if end is not None:
+        if start is not None and end <= start:
+            raise ValueError("end 는 start 보다 커야 합니다")
+        selection['end'] = end
+
+    max_chars = data.get('max_chars')
+    if max_chars is not None and max_chars != '':
+        try:
+            max_chars = int(max_chars)
+        except (TypeError, ValueError):
+            raise ValueError(f"max_chars 는 양의 정수여야 합니다: {max_chars}")
+        if max_chars <= 0:
+            raise ValueError(f"max_chars 는 양의 정수여야 합니다: {max_chars}")
+        selection['max_chars'] = max_chars
+    return selection
+
+
+def slice_transcript(entries, start=None, end=None, max_chars=None):
+    """자막에서 구간/글자 수 한도에 맞는 부분만 남긴다 (start/end 는 parse_time 이 받는 형식)
+
+    반환값: (잘라낸 자막, 구간 정보)
+        아무것도 지정하지 않으면 (entries, None) - 그대로 돌려준다
+        구간 정보: {'start', 'end', 'max_chars', 'total_subtitles', 'truncated', 'next_start'}
+    """
+    if start is None and end is None and max_chars is None:
+        return entries, None
+
+    start = parse_time(start)
+    end = parse_time(end)
+    transcript = CompactTranscript.from_entries(entries)
+    part = transcript.between(start, end) if start is not None or end is not None else transcript
+    truncated = False
+    next_start = None
+    if max_chars is not None:
+        head = part.head_chars(max_chars)
+        if len(head) < len(part):
+            truncated = True
+            next_start = part.starts[len(head)]
+        part = head
+
+    return part, {
+        'start': start,
+        'end': end,
+        'max_chars': max_chars,
+        'total_subtitles': len(transcript),
+        'truncated': truncated,
+        'next_start': next_start,
+    }
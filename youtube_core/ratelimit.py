@@ -0,0 +1,63 @@
+"""
+요청 속도 제한
+
+토큰 버킷으로 초당 요청 수를 제한한다. 배치 추출처럼 한 번에 많은 요청을 보낼 때
+유튜브에 요청이 몰려 차단되지 않도록 모든 스레드가 같은 버킷을 공유한다.
+유튜브로 나가는 모든 요청은 youtube_core.scheduler 의 OutboundScheduler 가 이 버킷을 거쳐 보낸다
+(설정은 get_default_scheduler 의 YT_RATE_LIMIT, YT_RATE_BURST).
+"""
+
+import threading
+import time
+
+
+YOUTUBE_HOST = 'www.youtube.com'
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 burst개 보관)
+
+    clock/sleep 은 테스트에서 가짜 시계로 바꿀 수 있다.
+    """
+
+    def __init__(self, rate, burst, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def adjust_rate(self, func):
+        """충전 속도를 func(현재 속도) 로 바꾸고 새 속도 반환 (읽고 바꾸는 사이에 다른 스레드가 끼어들지 않는다)"""
+        with self._lock:
+            self._refill()
+            self.rate = float(func(self.rate))
+            return self.rate
+
+    def reserve(self):
+        """토큰이 있으면 쓰고 0, 없으면 다음 토큰까지 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """토큰을 얻을 때까지 대기, 기다린 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            delay = self.reserve()
+            if delay == 0.0:
+                return waited
+            self.sleep(delay)
+            waited += delay
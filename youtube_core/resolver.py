@@ -0,0 +1,341 @@
+"""
+자막 언어 선택
+
+자막 목록을 한 번만 조회해서 (language_code, is_generated) 로 색인하고
+우선순위 표에 따라 한 번에 트랙을 고른다. 예전처럼 언어마다 get_transcript 를
+다시 호출하지 않으므로 어떤 영상이든 네트워크 왕복은 목록 1회 + 자막 1회면 된다.
+
+캐시에는 두 종류의 레코드를 둔다.
+    (video_id)                        -> {'tracks': [...]} 자막 목록 (또는 {'error': ...})
+    (video_id, language, is_generated) -> {'entries': [...]} 자막 내용
+목록과 내용이 모두 캐시에 있으면 왕복 0회로 끝난다.
+
+보관소(youtube_core.archive)를 쓰면 캐시에 없을 때 보관소를 먼저 보고, 유튜브에서 받은 목록과 자막은
+보관소에도 저장한다. 보관된 영상은 캐시가 만료된 뒤에도 왕복 0회로 끝난다.
+
+목록 조회(list)와 자막 조회(fetch)에 걸린 시간(ms)은 TranscriptResult.timings 에 담긴다.
+"""
+
+import time
+
+from .archive import get_default_archive, store_quietly
+from .backends import Track
+from .cache import is_negative_error
+from .entries import normalize_entries
+from .metrics import observe_stage, record_selection
+from .singleflight import get_default_singleflight, process_lock
+
+
+# 한국어 → 영어 순, 같은 언어면 수동 자막 우선
+DEFAULT_PRIORITIES = ('ko', 'en')
+
+
+def parse_priorities(languages):
+    """언어 우선순위 지정을 [(language_code, is_generated), ...] 로 변환
+
+    'ko'        -> ('ko', False), ('ko', True)
+    'ko:manual' -> ('ko', False)
+    'ko:auto'   -> ('ko', True)
+    ('ko', True) 같은 튜플은 그대로 사용
+    문자열 하나면 쉼표로 구분된 목록으로 본다 ('ko,en:auto')
+    """
+    if isinstance(languages, str):
+        languages = [part for part in languages.split(',') if part.strip()]
+
+    priorities = []
+    for spec in languages or ():
+        if isinstance(spec, (tuple, list)):
+            candidates = [(spec[0], bool(spec[1]))]
+        else:
+            code, _, kind = spec.strip().partition(':')
+            if kind == 'manual':
+                candidates = [(code, False)]
+            elif kind == 'auto':
+                candidates = [(code, True)]
+            else:
+                candidates = [(code, False), (code, True)]
+        for candidate in candidates:
+            if candidate not in priorities:
+                priorities.append(candidate)
+    return priorities
+
+
+def index_tracks(tracks):
+    """트랙 목록을 (language_code, is_generated) 로 색인 (같은 키는 먼저 나온 트랙 유지)"""
+    index = {}
+    for track in tracks:
+        index.setdefault((track.language_code, track.is_generated), track)
+    return index
+
+
+def resolve_track(tracks, priorities, fallback_any=True):
+    """우선순위에 맞는 트랙 선택, 없으면 (fallback_any 일 때) 첫 번째 트랙"""
+    index = index_tracks(tracks)
+    for priority in priorities:
+        track = index.get(priority)
+        if track is not None:
+            return track
+    if fallback_any and tracks:
+        return tracks[0]
+    return None
+
+
+class NoTranscriptFound(Exception):
+    """우선순위에 맞는 자막이 없음"""
+
+    def __init__(self, video_id):
+        super().__init__(f"No transcripts found for video {video_id}")
+
+
+class TranscriptResult:
+    """선택된 트랙, 자막 항목, 네트워크 왕복 횟수, 단계별 소요 시간(ms)"""
+
+    __slots__ = ('track', 'entries', 'round_trips', 'timings')
+
+    def __init__(self, track, entries, round_trips, timings=None):
+        self.track = track
+        self.entries = entries
+        self.round_trips = round_trips
+        self.timings = timings if timings is not None else {}
+
+
+class CachedError(Exception):
+    """캐시에 저장돼 있던 실패 결과"""
+
+
+def _cached_tracks(cache, video_id):
+    """캐시된 자막 목록 (없으면 None, 실패가 캐시돼 있으면 CachedError)"""
+    record = cache.get(video_id) if cache else None
+    if record is None:
+        return None
+    if 'error' in record:
+        raise CachedError(record['error'])
+    if 'tracks' not in record:
+        return None
+    return [Track(t['language_code'], t.get('language', ''), t.get('is_generated', False))
+            for t in record['tracks']]
+
+
+def _cached_entries(cache, video_id, track):
+    record = cache.get(video_id, track.language_code, track.is_generated) if cache else None
+    if record is None or 'entries' not in record:
+        return None
+    return record['entries']
+
+
+def _stored_tracks(cache, archive, video_id):
+    """캐시, 없으면 보관소의 자막 목록 (보관소에서 찾으면 캐시에도 넣는다)"""
+    tracks = _cached_tracks(cache, video_id)
+    if tracks is None and archive is not None:
+        tracks = archive.get_tracks(video_id)
+        if tracks is not None and cache:
+            cache.put_tracks(video_id, [track.to_dict() for track in tracks])
+    return tracks
+
+
+def _stored_entries(cache, archive, video_id, track):
+    """캐시, 없으면 보관소의 자막 항목 (보관소에서 찾으면 캐시에도 넣는다)"""
+    entries = _cached_entries(cache, video_id, track)
+    if entries is None and archive is not None:
+        entries = archive.get_entries(video_id, track.language_code, track.is_generated)
+        if entries and cache:
+            cache.put(video_id, entries, track.language_code, track.is_generated)
+    return entries
+
+
+def _store_tracks(cache, archive, video_id, tracks):
+    if cache:
+        cache.put_tracks(video_id, [track.to_dict() for track in tracks])
+    if archive is not None:
+        store_quietly(archive.put_tracks, video_id, tracks)
+
+
+def _store_entries(cache, archive, video_id, track, entries):
+    if cache and entries:
+        cache.put(video_id, entries, track.language_code, track.is_generated)
+    if archive is not None and entries:
+        store_quietly(archive.put_entries, video_id, track, entries)
+
+
+def _store_error(cache, video_id, error):
+    # 자막 없음/비활성화처럼 목록 조회 자체가 실패한 경우만 부정 캐싱
+    if cache and is_negative_error(error):
+        cache.put_negative(video_id, error)
+
+
+class _StageTimer:
+    """list/fetch 단계 시간을 누적 (목록을 두 번 받으면 합산)"""
+
+    __slots__ = ('timings', 'stage', 'started')
+
+    def __init__(self, timings):
+        self.timings = timings
+
+    def start(self, stage):
+        self.stage = stage
+        self.started = time.perf_counter()
+
+    def stop(self):
+        seconds = time.perf_counter() - self.started
+        self.timings[self.stage] = round(self.timings.get(self.stage, 0) + seconds * 1000, 1)
+        observe_stage(self.stage, seconds)
+
+
+def _record_selection(track, priorities):
+    record_selection((track.language_code, track.is_generated) not in priorities)
+
+
+def _flight_key(backend, video_id, priorities, fallback_any):
+    return ('transcript', id(backend), video_id, tuple(priorities), fallback_any)
+
+
+def _shared_result(result, shared):
+    # 다른 요청이 가져온 결과를 함께 받았으면 이 요청이 쓴 왕복은 0회
+    if shared:
+        return TranscriptResult(result.track, result.entries, 0)
+    return result
+
+
+def peek_transcript(video_id, priorities, cache=None, fallback_any=True, archive=None):
+    """네트워크 없이 캐시/보관소에 있는 것만으로 fetch_transcript 와 같은 트랙을 골라 TranscriptResult 반환
+
+    목록이나 고른 트랙의 자막이 저장돼 있지 않으면 None (응답을 만들기 전에 ETag 를 계산할 때 쓴다).
+    """
+    archive = archive if archive is not None else get_default_archive()
+    try:
+        tracks = _stored_tracks(cache, archive, video_id)
+    except CachedError:
+        return None
+    track = resolve_track(tracks, priorities, fallback_any) if tracks else None
+    if track is None:
+        return None
+    entries = _stored_entries(cache, archive, video_id, track)
+    if not entries:
+        return None
+    return TranscriptResult(track, entries, 0)
+
+
+def fetch_transcript(backend, video_id, priorities, cache=None, fallback_any=True, singleflight=None, archive=None):
+    """자막 목록 1회 + 자막 1회 조회로 가장 알맞은 자막을 가져온다 (TranscriptResult 반환)
+
+    같은 비디오/우선순위로 동시에 들어온 호출은 하나로 합쳐서 유튜브에는 한 번만 요청한다
+    (youtube_core.singleflight). 실패하면 예외에 그때까지의 왕복 횟수(round_trips)를 붙여서 다시 던진다.
+    archive 를 넘기지 않으면 공용 보관소(YT_ARCHIVE_PATH, 없으면 사용 안 함)를 쓴다.
+    """
+    flight = singleflight if singleflight is not None else get_default_singleflight()
+    archive = archive if archive is not None else get_default_archive()
+
+    def load():
+        # 다른 프로세스가 같은 자막을 가져오는 중이면 끝날 때까지 기다렸다가 캐시에서 읽는다
+        with process_lock(('transcript', video_id, tuple(priorities), fallback_any)):
+            return _fetch_transcript(backend, video_id, priorities, cache, fallback_any, archive)
+
+    if flight is None:
+        return load()
+    return _shared_result(*flight.do(_flight_key(backend, video_id, priorities, fallback_any), load))
+
+
+def _fetch_steps(backend, video_id, priorities, cache, fallback_any, archive):
+    """캐시 → 보관소 → 목록 → 트랙 선택 → 자막 → 저장 순서 (동기/asyncio 버전이 함께 쓴다)
+
+    네트워크 호출이 필요할 때마다 ('list', None) 또는 ('fetch', track) 을 yield 하고 그 결과(실패하면 예외)를 받는다.
+    호출 자체는 _fetch_transcript / _fetch_transcript_async 가 실행한다. 끝나면 TranscriptResult 를 return.
+    """
+    round_trips = 0
+    timings = {}
+    timer = _StageTimer(timings)
+    try:
+        tracks = _stored_tracks(cache, archive, video_id)
+        if tracks is None:
+            round_trips += 1
+            timer.start('list')
+            try:
+                tracks = yield 'list', None
+            except Exception as e:
+                _store_error(cache, video_id, e)
+                raise
+            finally:
+                timer.stop()
+            _store_tracks(cache, archive, video_id, tracks)
+
+        track = resolve_track(tracks, priorities, fallback_any)
+        if track is None:
+            raise NoTranscriptFound(video_id)
+        _record_selection(track, priorities)
+
+        entries = _stored_entries(cache, archive, video_id, track)
+        if entries is None:
+            if round_trips == 0 and backend.fetch_requires_listing:
+                # 캐시/보관소에서 복원한 트랙은 원본 객체가 없으므로 목록을 다시 받아 찾는다
+                round_trips += 1
+                timer.start('list')
+                try:
+                    tracks = yield 'list', None
+                finally:
+                    timer.stop()
+                track = resolve_track(tracks, [(track.language_code, track.is_generated)], fallback_any=False)
+                if track is None:
+                    raise NoTranscriptFound(video_id)
+            round_trips += 1
+            timer.start('fetch')
+            try:
+                entries = normalize_entries((yield 'fetch', track))
+            finally:
+                timer.stop()
+            _store_entries(cache, archive, video_id, track, entries)
+
+        return TranscriptResult(track, entries, round_trips, timings)
+
+    except Exception as e:
+        e.round_trips = round_trips
+        raise
+
+
+def _fetch_transcript(backend, video_id, priorities, cache, fallback_any, archive):
+    steps = _fetch_steps(backend, video_id, priorities, cache, fallback_any, archive)
+    reply = error = None
+    while True:
+        try:
+            stage, track = steps.send(reply) if error is None else steps.throw(error)
+        except StopIteration as done:
+            return done.value
+        reply = error = None
+        try:
+            reply = backend.list_tracks(video_id) if stage == 'list' else backend.fetch(video_id, track)
+        except Exception as e:
+            error = e
+
+
+async def fetch_transcript_async(backend, video_id, priorities, cache=None, fallback_any=True, singleflight=None,
+                                 archive=None):
+    """fetch_transcript 의 asyncio 버전 (backend 메서드가 코루틴)
+
+    같은 이벤트 루프 안의 동시 호출만 합친다 (프로세스 간 잠금은 루프를 막으므로 쓰지 않는다).
+    """
+    flight = singleflight if singleflight is not None else get_default_singleflight()
+    archive = archive if archive is not None else get_default_archive()
+
+    def load():
+        return _fetch_transcript_async(backend, video_id, priorities, cache, fallback_any, archive)
+
+    if flight is None:
+        return await load()
+    return _shared_result(*await flight.do_async(_flight_key(backend, video_id, priorities, fallback_any), load))
+
+
+async def _fetch_transcript_async(backend, video_id, priorities, cache, fallback_any, archive):
+    steps = _fetch_steps(backend, video_id, priorities, cache, fallback_any, archive)
+    reply = error = None
+    while True:
+        try:
+            stage, track = steps.send(reply) if error is None else steps.throw(error)
+        except StopIteration as done:
+            return done.value
+        reply = error = None
+        try:
+            if stage == 'list':
+                reply = await backend.list_tracks(video_id)
+            else:
+                reply = await backend.fetch(video_id, track)
+        except Exception as e:
+            error = e
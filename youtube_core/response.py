@@ -0,0 +1,118 @@
+"""
+API 응답 생성
+
+extract_api.py, api/extract.py 가 같은 모양의 JSON 응답과 한국어 에러 메시지를 쓰도록 모은다.
+"""
+
+import time
+
+from .archive import DEFAULT_SEARCH_LIMIT, get_default_archive
+from .formats import DEFAULT_FORMAT, render_output
+
+
+def translate_error(error_msg, default_prefix=False):
+    """에러 메시지를 사용자용 한국어 메시지로 변환"""
+    # 차단/한도 초과는 "Could not retrieve a transcript" 로 감싸져 오므로 먼저 확인
+    if "Circuit open" in error_msg:
+        return "유튜브 요청이 차단되어 잠시 중단했습니다. 잠시 후 다시 시도해주세요."
+    elif "Too Many Requests" in error_msg or "HTTP Error 429" in error_msg:
+        return "유튜브 요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요."
+    elif "blocking requests from your IP" in error_msg:
+        return "유튜브가 서버의 요청을 차단했습니다. 잠시 후 다시 시도해주세요."
+    elif "Video unavailable" in error_msg:
+        return "비디오를 사용할 수 없습니다. 삭제되었거나 비공개일 수 있습니다."
+    elif "Private video" in error_msg:
+        return "비공개 비디오입니다."
+    elif "Could not retrieve a transcript" in error_msg:
+        if "Subtitles are disabled" in error_msg:
+            return "이 비디오는 자막이 비활성화되어 있습니다."
+        elif "No transcripts found" in error_msg:
+            return "이 비디오에는 자막이 없습니다."
+        else:
+            return "자막을 가져올 수 없습니다. 비디오가 제한되어 있을 수 있습니다."
+    elif "Connection" in error_msg or "Network" in error_msg:
+        return "네트워크 연결 문제가 발생했습니다. 잠시 후 다시 시도해주세요."
+    elif default_prefix:
+        return f"오류가 발생했습니다: {error_msg}"
+    return error_msg
+
+
+def extractor_info(extractor, timings=False):
+    """응답의 info 블록 (timings=True 면 단계별 소요 시간 info.timings 포함)"""
+    info = {
+        "title": extractor.video_info.get('title', '제목 없음'),
+        "channel": extractor.video_info.get('channel', '채널 없음'),
+        "duration": extractor.video_info.get('duration', 0),
+        "subtitle_count": len(extractor.transcript_data),
+        "language": getattr(extractor, 'transcript_language', None),
+        "round_trips": getattr(extractor, 'round_trips', 0)
+    }
+    if timings:
+        info["timings"] = dict(getattr(extractor, 'timings', {}))
+    # 구간(start/end/max_chars)을 지정했으면 전체 자막 수와 이어 받을 위치
+    if getattr(extractor, 'range_info', None):
+        info["range"] = extractor.range_info
+    return info
+
+
+def extractor_response(extractor, success, timings=False):
+    """process_youtube_url 실행 후 추출기 상태로 응답 딕셔너리 생성 (timings: extractor_info 참고)"""
+    if success and extractor.formatted_text:
+        output_format = getattr(extractor, 'output_format', DEFAULT_FORMAT)
+        if output_format == DEFAULT_FORMAT:
+            return {
+                "success": True,
+                "text": extractor.formatted_text,
+                "info": extractor_info(extractor, timings)
+            }
+        # 다른 형식은 이미 받아 온 transcript_data 로 만든다
+        return {
+            "success": True,
+            "text": render_output(extractor, output_format),
+            "format": output_format,
+            "info": extractor_info(extractor, timings)
+        }
+
+    error_msg = extractor.error_details if extractor.error_details else "자막을 추출할 수 없습니다"
+    return {
+        "success": False,
+        "error": translate_error(error_msg)
+    }
+
+
+def stable_response(response):
+    """캐시용 응답: 요청마다 달라지는 info.timings/round_trips 를 빼서 같은 자막이면 본문이 같게 한다"""
+    info = response.get("info")
+    if info:
+        response = dict(response, info={key: value for key, value in info.items()
+                                        if key not in ('timings', 'round_trips')})
+    return response
+
+
+def run_extraction(extractor, url, timings=False, **selection):
+    """URL 하나를 처리해서 응답 딕셔너리 생성 (selection: start/end/max_chars)"""
+    try:
+        return extractor_response(extractor, extractor.process_youtube_url(url, **selection), timings)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": translate_error(str(e), default_prefix=True)
+        }
+
+
+def search_response(query, limit=DEFAULT_SEARCH_LIMIT, archive=None):
+    """보관소 전문 검색 응답 딕셔너리 생성"""
+    archive = archive if archive is not None else get_default_archive()
+    if archive is None:
+        return {"success": False, "error": "자막 보관소가 설정되지 않았습니다 (YT_ARCHIVE_PATH)"}
+    if not (query or '').strip():
+        return {"success": False, "error": "검색어가 필요합니다"}
+
+    started = time.perf_counter()
+    results = archive.search(query, limit=max(1, min(int(limit), 100)))
+    return {
+        "success": True,
+        "query": query,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
@@ -0,0 +1,283 @@
+"""
+유튜브 요청 스케줄러
+
+유튜브로 나가는 모든 요청(자막 목록/자막/메타데이터)을 한곳에서 보낸다.
+    - 호스트별 토큰 버킷으로 속도 제한, 429 를 받으면 속도를 절반으로 줄이고 성공하면 조금씩 되돌린다
+    - 일시적인 실패(연결 끊김, 시간 초과, 5xx, 429)만 지수 백오프 + 지터로 다시 시도한다
+    - "자막 없음" 같은 실패는 다시 시도하지 않는다
+    - 차단(RequestBlocked/IpBlocked)이나 연속 실패가 쌓이면 회로를 열어 한동안 요청을 보내지 않는다
+
+stats() 로 현재 속도, 회로 상태, 재시도/차단 횟수를 볼 수 있다.
+"""
+
+import os
+import random
+import threading
+import time
+
+from .cache import NEGATIVE_ERROR_TYPES
+from .ratelimit import DEFAULT_BURST, DEFAULT_RATE, YOUTUBE_HOST, TokenBucket
+
+
+# 실패 종류
+FATAL = 'fatal'          # 다시 시도해도 같은 결과 (자막 없음, 비공개 영상 등)
+RETRY = 'retry'          # 일시적인 실패
+THROTTLED = 'throttled'  # 429 Too Many Requests
+BLOCKED = 'blocked'      # 유튜브가 요청을 차단
+
+BLOCKED_ERROR_TYPES = ('RequestBlocked', 'IpBlocked', 'TooManyRequests')
+RETRY_ERROR_TYPES = (
+    'ConnectionError', 'Timeout', 'ConnectTimeout', 'ReadTimeout', 'ChunkedEncodingError',
+    'RemoteDisconnected', 'IncompleteRead', 'ProtocolError',
+)
+RETRY_STATUS = (500, 502, 503, 504)
+# 메시지 내용과 상관없이 다시 시도하지 않는 실패 (메시지에 든 영상 ID 에 '429' 가 있을 수 있다)
+FATAL_ERROR_TYPES = NEGATIVE_ERROR_TYPES + (
+    'VideoUnavailable', 'VideoUnplayable', 'InvalidVideoId', 'AgeRestricted',
+    'NotTranslatable', 'TranslationLanguageNotAvailable',
+)
+# 메시지로만 429 를 알 수 있을 때 찾는 문구
+THROTTLED_MARKERS = ('HTTP Error 429', 'Too Many Requests')
+
+
+def _status_code(error):
+    status = getattr(error, 'status', None)
+    if status is None:
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None)
+    return status
+
+
+def classify_error(error):
+    """예외를 FATAL / RETRY / THROTTLED / BLOCKED 중 하나로 분류"""
+    name = type(error).__name__
+    if name in FATAL_ERROR_TYPES:
+        return FATAL
+    if name == 'TooManyRequests' or _status_code(error) == 429:
+        return THROTTLED
+    if name in BLOCKED_ERROR_TYPES:
+        return BLOCKED
+    if _status_code(error) in RETRY_STATUS:
+        return RETRY
+    if isinstance(error, (ConnectionError, TimeoutError)) or name in RETRY_ERROR_TYPES:
+        return RETRY
+
+    message = str(error)
+    if any(marker in message for marker in THROTTLED_MARKERS):
+        return THROTTLED
+    if name == 'YouTubeRequestFailed':
+        # youtube_transcript_api 가 HTTP 오류를 감싼 경우 (상태 코드는 메시지에만 있다)
+        return RETRY
+    return FATAL
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 유튜브에 요청하지 않음"""
+
+    def __init__(self, host, retry_after):
+        super().__init__(f"Circuit open for {host}: YouTube requests paused for {retry_after:.0f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 열리고, reset_timeout 뒤에 요청 하나로 회복 여부를 확인한다
+
+    회복 확인 요청이 실패하면 reset_timeout 을 두 배로 늘린다 (max_reset_timeout 까지, 성공하면 원래대로).
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, host=YOUTUBE_HOST, failure_threshold=5, reset_timeout=60.0, max_reset_timeout=900.0,
+                 clock=time.monotonic):
+        self.host = host
+        self.clock = clock
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trips = 0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """요청해도 되는지 확인 (안 되면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - self.clock()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+            raise CircuitOpenError(self.host, max(remaining, 0.0))
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.reset_timeout = self.base_reset_timeout
+            self._trial_running = False
+
+    def record_failure(self, kind):
+        with self._lock:
+            self._trial_running = False
+            if self.state == self.HALF_OPEN:
+                # 회복 확인 요청도 실패하면 더 오래 쉰다
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+                self._open()
+                return
+            self.failures += self.failure_threshold if kind == BLOCKED else 1
+            if self.state == self.CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = self.clock()
+        self.trips += 1
+
+    def stats(self):
+        with self._lock:
+            retry_after = 0.0
+            if self.state != self.CLOSED:
+                retry_after = max(0.0, self.opened_at + self.reset_timeout - self.clock())
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'trips': self.trips,
+                'retry_after': round(retry_after, 1),
+            }
+
+
+class OutboundScheduler:
+    """속도 제한 + 재시도 + 회로 차단기를 거쳐 함수 호출 (clock/sleep 은 테스트에서 가짜 시계로 바꿀 수 있다)"""
+
+    def __init__(self, host=YOUTUBE_HOST, rate=DEFAULT_RATE, burst=DEFAULT_BURST, min_rate=0.5,
+                 max_retries=3, base_delay=0.5, max_delay=10.0, breaker=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.host = host
+        self.max_rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.bucket = TokenBucket(rate, burst, clock, sleep)
+        self.breaker = breaker if breaker is not None else CircuitBreaker(host, clock=clock)
+        self._lock = threading.Lock()
+        self._counters = {
+            'calls': 0,
+            'successes': 0,
+            'failures': 0,
+            'retries': 0,
+            'throttled': 0,
+            'blocked': 0,
+            'rejected': 0,
+            'waited': 0.0,
+        }
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def backoff(self, attempt):
+        """attempt 번째 재시도 전 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _on_success(self):
+        self.breaker.record_success()
+        # 성공할 때마다 최대 속도의 5%씩 되돌린다
+        self.bucket.adjust_rate(lambda rate: min(self.max_rate, rate + self.max_rate * 0.05))
+
+    def _on_failure(self, kind):
+        if kind == FATAL:
+            # 유튜브는 정상 응답했다 (자막 없음 등)
+            self.breaker.record_success()
+            return
+        self.breaker.record_failure(kind)
+        if kind in (THROTTLED, BLOCKED):
+            self._count(kind)
+            self.bucket.adjust_rate(lambda rate: max(self.min_rate, rate / 2))
+
+    def call(self, func, *args, **kwargs):
+        """func 호출 - 일시적인 실패는 max_retries 번까지 다시 시도"""
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self._count('rejected')
+                raise
+            self._count('calls')
+            self._count('waited', self.bucket.acquire())
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                kind = classify_error(e)
+                self._on_failure(kind)
+                if kind in (FATAL, BLOCKED) or attempt >= self.max_retries:
+                    self._count('failures')
+                    raise
+                attempt += 1
+                self._count('retries')
+                self.sleep(self.backoff(attempt))
+                continue
+
+            self._on_success()
+            self._count('successes')
+            return result
+
+    def stats(self):
+        """현재 속도, 회로 상태, 누적 카운터"""
+        with self._lock:
+            stats = dict(self._counters)
+        stats['waited'] = round(stats['waited'], 3)
+        stats.update({
+            'host': self.host,
+            'rate': round(self.bucket.rate, 3),
+            'max_rate': self.max_rate,
+            'circuit': self.breaker.stats(),
+        })
+        return stats
+
+
+_default_schedulers = {}
+_default_schedulers_lock = threading.Lock()
+
+
+def get_default_scheduler(host=YOUTUBE_HOST):
+    """환경 변수 설정으로 만든 호스트별 공용 스케줄러
+
+    YT_RATE_LIMIT           초당 최대 요청 수 (기본 5)
+    YT_RATE_BURST           순간 최대 요청 수 (기본 10)
+    YT_RATE_MIN             429 를 받아 줄일 수 있는 최소 속도 (기본 0.5)
+    YT_RETRY_MAX            일시적인 실패 재시도 횟수 (기본 3)
+    YT_RETRY_BASE_DELAY     첫 재시도 대기 시간 기준 초 (기본 0.5)
+    YT_CIRCUIT_THRESHOLD    회로를 여는 연속 실패 횟수 (기본 5)
+    YT_CIRCUIT_RESET        회로를 연 뒤 다시 시도하기까지의 초 (기본 60)
+    """
+    with _default_schedulers_lock:
+        scheduler = _default_schedulers.get(host)
+        if scheduler is None:
+            breaker = CircuitBreaker(
+                host,
+                failure_threshold=int(os.environ.get('YT_CIRCUIT_THRESHOLD', '5')),
+                reset_timeout=float(os.environ.get('YT_CIRCUIT_RESET', '60')),
+            )
+            scheduler = _default_schedulers[host] = OutboundScheduler(
+                host,
+                rate=float(os.environ.get('YT_RATE_LIMIT', DEFAULT_RATE)),
+                burst=float(os.environ.get('YT_RATE_BURST', DEFAULT_BURST)),
+                min_rate=float(os.environ.get('YT_RATE_MIN', '0.5')),
+                max_retries=int(os.environ.get('YT_RETRY_MAX', '3')),
+                base_delay=float(os.environ.get('YT_RETRY_BASE_DELAY', '0.5')),
+                breaker=breaker,
+            )
+        return scheduler
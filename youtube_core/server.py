@@ -0,0 +1,162 @@
+"""
+독립 실행 HTTP 서버
+
+api/extract.py 의 handler 를 Vercel 밖(자체 서버)에서 동시에 여러 요청을 처리하도록 띄운다.
+    - 고정 크기 워커 스레드 풀 (요청마다 스레드를 새로 만들지 않는다)
+    - 대기열이 가득 차면 바로 503 + Retry-After 응답
+    - HTTP/1.1 keep-alive (유휴 연결은 keepalive_timeout 초 뒤에 닫는다)
+    - SIGTERM/SIGINT 를 받으면 새 연결을 받지 않고 진행 중인 요청을 마친 뒤 종료
+    - GET /health 로 워커/대기열/캐시 상태 확인
+
+사용법:
+    python api/extract.py --port 8000 --workers 16 --max-queue 64
+"""
+
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_SHUTDOWN_TIMEOUT = 30.0
+
+BUSY_BODY = '{"success": false, "error": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."}'.encode('utf-8')
+BUSY_RESPONSE = (
+    'HTTP/1.1 503 Service Unavailable\r\n'
+    'Content-Type: application/json\r\n'
+    'Retry-After: 5\r\n'
+    'Connection: close\r\n'
+    f'Content-Length: {len(BUSY_BODY)}\r\n'
+    '\r\n'
+).encode('latin-1') + BUSY_BODY
+
+
+class ExtractHTTPServer(ThreadingHTTPServer):
+    """워커 수와 대기열 길이가 제한된 HTTP 서버
+
+    연결 하나는 워커 하나가 맡는다. keep-alive 연결도 다음 요청을 기다리는 동안
+    워커를 차지하므로 유휴 연결은 keepalive_timeout 뒤에 닫는다.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, server_address, handler_class, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                 keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT):
+        super().__init__(server_address, handler_class)
+        self.workers = workers
+        self.max_queue = max_queue
+        self.keepalive_timeout = keepalive_timeout
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='http')
+        self.started_at = time.time()
+        self.draining = False
+        self._lock = threading.Lock()
+        self._counters = {'active': 0, 'queued': 0, 'handled': 0, 'rejected': 0}
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            busy = self.draining or self._counters['queued'] >= self.max_queue
+            if busy:
+                self._counters['rejected'] += 1
+            else:
+                self._counters['queued'] += 1
+        if busy:
+            # 요청을 읽고 응답해야 클라이언트가 연결 재설정 대신 503 을 받는다
+            threading.Thread(target=self._reject, args=(request,), daemon=True).start()
+            return
+        self.executor.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        with self._lock:
+            self._counters['queued'] -= 1
+            self._counters['active'] += 1
+        try:
+            request.settimeout(self.keepalive_timeout)
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._lock:
+                self._counters['active'] -= 1
+                self._counters['handled'] += 1
+
+    def _reject(self, request):
+        try:
+            request.settimeout(1.0)
+            request.recv(65536)
+            request.sendall(BUSY_RESPONSE)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def stats(self):
+        """워커/대기열 상태"""
+        with self._lock:
+            stats = dict(self._counters)
+        stats.update({
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'draining': self.draining,
+            'uptime': round(time.time() - self.started_at, 1),
+        })
+        return stats
+
+    def graceful_shutdown(self, timeout=DEFAULT_SHUTDOWN_TIMEOUT):
+        """새 연결을 받지 않고 진행 중인 요청이 끝날 때까지(최대 timeout 초) 기다린 뒤 종료"""
+        self.draining = True
+        self.shutdown()
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if self._counters['active'] == 0 and self._counters['queued'] == 0:
+                    break
+            time.sleep(0.05)
+        self.executor.shutdown(wait=False)
+        self.server_close()
+
+
+def make_keepalive_handler(handler_class):
+    """HTTP/1.1 keep-alive 를 쓰는 handler 하위 클래스 (종료 중이면 응답 후 연결을 닫는다)"""
+
+    class KeepAliveHandler(handler_class):
+        protocol_version = 'HTTP/1.1'
+        # 헤더와 본문을 따로 보내므로 Nagle 을 끄지 않으면 keep-alive 응답마다 지연된 ACK(~40ms)만큼 늦어진다
+        disable_nagle_algorithm = True
+
+        def handle_one_request(self):
+            super().handle_one_request()
+            if self.server.draining:
+                self.close_connection = True
+
+    KeepAliveHandler.__name__ = handler_class.__name__
+    return KeepAliveHandler
+
+
+def run_server(handler_class, host='127.0.0.1', port=8000, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+               keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT, shutdown_timeout=DEFAULT_SHUTDOWN_TIMEOUT):
+    """서버를 띄우고 SIGTERM/SIGINT 를 받을 때까지 실행"""
+    server = ExtractHTTPServer((host, port), make_keepalive_handler(handler_class), workers=workers,
+                               max_queue=max_queue, keepalive_timeout=keepalive_timeout)
+    stopping = []
+
+    def stop(signum, frame):
+        if not stopping:
+            # serve_forever 를 돌리는 스레드에서 shutdown() 을 부르면 멈추므로 별도 스레드에서 실행
+            thread = threading.Thread(target=server.graceful_shutdown, args=(shutdown_timeout,), daemon=True)
+            stopping.append(thread)
+            thread.start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    print(f"🚀 http://{host}:{server.server_address[1]} (워커 {workers}, 대기열 {max_queue})", flush=True)
+    server.serve_forever()
+    # graceful_shutdown 이 끝날 때까지 대기
+    for thread in stopping:
+        thread.join()
+    print("👋 서버 종료", flush=True)
@@ -0,0 +1,140 @@
+"""
+요청 합치기 (single-flight)
+
+같은 키로 동시에 들어온 호출은 하나만 실제로 실행하고, 나머지는 그 결과(또는 예외)를 함께 받는다.
+인기 영상에 요청이 몰려도 유튜브에는 한 번만 요청한다.
+    - SingleFlight.do(key, func): 스레드 간 합치기
+    - SingleFlight.do_async(key, coroutine_factory): 같은 이벤트 루프의 코루틴 간 합치기
+    - process_lock(key): 여러 워커 프로세스 사이의 합치기 (잠금 파일)
+
+프로세스 간 합치기는 YT_SINGLEFLIGHT_LOCK_DIR 를 지정했을 때만 켜진다. 먼저 잠금을 얻은 프로세스가
+가져와 공용 디스크 캐시(YT_CACHE_PATH)에 저장하면, 기다리던 프로세스는 잠금을 얻은 뒤 캐시에서 결과를 읽는다.
+"""
+
+import contextlib
+import hashlib
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error', 'followers')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나로 합치기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key, func):
+        """(결과, 공유 여부) 반환 - 같은 키의 호출이 진행 중이면 그 결과를 기다린다"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                call.followers += 1
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key, coroutine_factory):
+        """do() 의 asyncio 버전 - 기다리던 코루틴이 모두 취소되면 실제 호출도 취소한다"""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        entry = self._tasks.get(task_key)
+        if entry is None:
+            task = loop.create_task(coroutine_factory())
+            entry = self._tasks[task_key] = [task, 0]
+            task.add_done_callback(lambda _: self._tasks.pop(task_key, None))
+            shared = False
+        else:
+            shared = True
+        with self._lock:
+            if shared:
+                self.shared += 1
+            else:
+                self.leaders += 1
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task), shared
+        except asyncio.CancelledError:
+            if not task.done():
+                entry[1] -= 1
+                if entry[1] == 0:
+                    task.cancel()
+            raise
+
+    def stats(self):
+        with self._lock:
+            in_flight = len(self._calls)
+        return {'leaders': self.leaders, 'shared': self.shared, 'in_flight': in_flight + len(self._tasks)}
+
+
+def _lock_path(lock_dir, key):
+    digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+    return os.path.join(lock_dir, f'{digest}.lock')
+
+
+@contextlib.contextmanager
+def process_lock(key, lock_dir=None):
+    """같은 키를 다루는 다른 프로세스와 순서를 맞추는 잠금 (lock_dir 가 없으면 아무것도 하지 않는다)"""
+    lock_dir = lock_dir if lock_dir is not None else os.environ.get('YT_SINGLEFLIGHT_LOCK_DIR')
+    if not lock_dir or fcntl is None:
+        yield
+        return
+
+    os.makedirs(lock_dir, exist_ok=True)
+    with open(_lock_path(lock_dir, key), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_default_singleflight = SingleFlight()
+
+
+def get_default_singleflight():
+    """프로세스 공용 SingleFlight (YT_SINGLEFLIGHT_DISABLE=1 이면 None)"""
+    if os.environ.get('YT_SINGLEFLIGHT_DISABLE') == '1':
+        return None
+    return _default_singleflight
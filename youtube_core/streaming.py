@@ -0,0 +1,82 @@
+"""
+스트리밍 응답
+
+전체 formatted_text 를 만들어 한 번에 보내는 대신 비디오 정보를 먼저 보내고
+자막 텍스트를 포맷팅되는 대로 조각(chunk) 단위로 내보낸다.
+
+이벤트 순서:
+    {"type": "info", "info": {...}}
+    {"type": "chunk", "text": "..."}   (여러 번, 이어 붙이면 일반 응답의 text 와 같다)
+    {"type": "done", "subtitle_count": n, "chars": n}
+실패하면 {"type": "error", "error": "..."} 하나로 끝난다.
+"""
+
+import json
+
+from .formats import iter_output
+from .pipeline import fetch_pipelined, measure
+from .response import extractor_info, translate_error
+
+
+DEFAULT_CHUNK_CHARS = 4096
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+SSE_CONTENT_TYPE = 'text/event-stream'
+
+
+def iter_chunks(pieces, chunk_chars=DEFAULT_CHUNK_CHARS):
+    """텍스트 조각들을 chunk_chars 글자 정도의 덩어리로 묶기"""
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= chunk_chars:
+            yield ''.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_extraction_events(extractor, url, chunk_chars=DEFAULT_CHUNK_CHARS, start=None, end=None, max_chars=None,
+                           timings=False):
+    """URL 하나를 처리하면서 스트리밍 이벤트 dict를 차례로 yield (start/end/max_chars 로 구간 선택)
+
+    timings=True 면 info 이벤트에 그때까지의 단계별 소요 시간(info.timings)을 넣는다.
+    """
+    try:
+        video_id = measure(extractor.timings, 'parse', extractor.extract_video_id, url)
+        if not video_id:
+            yield {"type": "error", "error": "올바른 유튜브 URL이 아닙니다"}
+            return
+
+        # 비디오 정보와 자막을 동시에 가져온다
+        if (not fetch_pipelined(extractor, video_id) or not extractor.transcript_data
+                or not extractor.select_range(start, end, max_chars)):
+            error_msg = extractor.error_details if extractor.error_details else "자막을 추출할 수 없습니다"
+            yield {"type": "error", "error": translate_error(error_msg)}
+            return
+
+        yield {"type": "info", "info": extractor_info(extractor, timings)}
+
+        chars = 0
+        for chunk in iter_chunks(iter_output(extractor), chunk_chars):
+            chars += len(chunk)
+            yield {"type": "chunk", "text": chunk}
+
+        yield {"type": "done", "subtitle_count": len(extractor.transcript_data), "chars": chars}
+
+    except Exception as e:
+        yield {"type": "error", "error": translate_error(str(e), default_prefix=True)}
+
+
+def encode_ndjson(event):
+    """이벤트를 NDJSON 한 줄(bytes)로 인코딩"""
+    return json.dumps(event, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def encode_sse(event):
+    """이벤트를 Server-Sent Events 메시지(bytes)로 인코딩"""
+    data = json.dumps(event, ensure_ascii=False)
+    return f"event: {event['type']}\ndata: {data}\n\n".encode('utf-8')
@@ -0,0 +1,111 @@
+"""
+yt_dlp 자막 백엔드
+
+youtube_transcript_api 가 실패하는 영상(차단, 형식 변경 등)을 yt_dlp 가 알려 주는 자막 트랙으로 다시 시도한다.
+트랙 목록(subtitles/automatic_captions)은 메타데이터 서비스가 제목/채널을 가져올 때 쓰는 extract_info 응답에
+이미 들어 있으므로 목록을 따로 요청하지 않는다. 메타데이터와 동시에 조회하면 같은 extract_info 를 함께 쓰고,
+먼저 끝났으면 캐시에서 읽는다. 그다음 자막 파일(json3, 없으면 vtt) 하나만 받아 같은 항목 형식으로 바꾼다.
+
+YT_TRANSCRIPT_FALLBACK=yt_dlp 로 켜면 공용 youtube 백엔드의 예비 백엔드로 쓰인다 (youtube_core.backends.FallbackTranscriptBackend).
+"""
+
+import html
+import json
+import re
+
+from .backends import TranscriptBackend, Track
+
+
+VTT_TIMING = re.compile(
+    r'^((?:\d+:)?\d{1,2}:\d{2}\.\d{3})\s+-->\s+((?:\d+:)?\d{1,2}:\d{2}\.\d{3})'
+)
+VTT_TAG = re.compile(r'<[^>]*>')
+
+
+def parse_json3(data):
+    """json3 자막을 {'text', 'start', 'duration'} 항목 리스트로 변환"""
+    entries = []
+    for event in json.loads(data).get('events', []):
+        segments = event.get('segs')
+        if not segments:
+            continue
+        text = ''.join(segment.get('utf8', '') for segment in segments).strip()
+        if not text:
+            continue
+        entries.append({
+            'text': text,
+            'start': event.get('tStartMs', 0) / 1000,
+            'duration': event.get('dDurationMs', 0) / 1000,
+        })
+    return entries
+
+
+def _vtt_seconds(timestamp):
+    seconds = 0.0
+    for part in timestamp.split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_vtt(data):
+    """WebVTT 자막을 항목 리스트로 변환
+
+    자동 자막 VTT 는 앞 큐의 줄을 다음 큐에 다시 싣고(롤링) 단어마다 시각 태그를 붙이므로
+    태그를 지우고 바로 앞 큐에 있던 줄은 건너뛴다.
+    """
+    entries = []
+    previous = set()
+    for block in re.split(r'\r?\n\r?\n', data):
+        lines = block.strip().splitlines()
+        for index, line in enumerate(lines):
+            timing = VTT_TIMING.match(line.strip())
+            if timing:
+                break
+        else:
+            continue
+
+        start = _vtt_seconds(timing.group(1))
+        end = _vtt_seconds(timing.group(2))
+        texts = [html.unescape(VTT_TAG.sub('', line)).strip() for line in lines[index + 1:]]
+        texts = [text for text in texts if text]
+        new = [text for text in texts if text not in previous]
+        previous = set(texts)
+        if new:
+            entries.append({'text': '\n'.join(new), 'start': start, 'duration': max(0.0, end - start)})
+    return entries
+
+
+PARSERS = (('json3', parse_json3), ('vtt', parse_vtt))
+
+
+class YtDlpSubtitleBackend(TranscriptBackend):
+    """yt_dlp 자막 트랙 백엔드 (목록은 메타데이터 서비스의 extract_info 응답을 함께 쓴다)"""
+
+    def __init__(self, metadata=None):
+        if metadata is None:
+            from .metadata import get_default_metadata_service
+            metadata = get_default_metadata_service()
+        self.metadata = metadata
+
+    def list_tracks(self, video_id):
+        captions = self.metadata.captions(video_id)
+        if not captions:
+            raise LookupError(f"No transcripts found for video {video_id} (yt_dlp)")
+        return [Track(c['language_code'], c['language'], c['is_generated'], handle=c) for c in captions]
+
+    def _caption(self, video_id, track):
+        if track.handle is not None:
+            return track.handle
+        # 캐시/보관소에서 복원한 트랙은 자막 주소를 다시 찾는다 (보통 캐시에 있다)
+        for caption in self.metadata.captions(video_id):
+            if caption['language_code'] == track.language_code and caption['is_generated'] == track.is_generated:
+                return caption
+        raise LookupError(f"No transcripts found for the requested language ({track.language_code})")
+
+    def fetch(self, video_id, track):
+        formats = self._caption(video_id, track)['formats']
+        for name, parse in PARSERS:
+            url = formats.get(name)
+            if url:
+                return parse(self.metadata.download(url).decode('utf-8'))
+        raise LookupError(f"지원하는 자막 파일 형식이 없습니다: {', '.join(formats)}")
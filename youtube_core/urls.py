@@ -0,0 +1,92 @@
+"""
+유튜브 URL 정규화
+
+붙여 넣은 URL이나 비디오 ID를 검증한 11자 비디오 ID로 바꾼다. 모든 진입점(추출기, 배치, 작업 큐)이
+이 모듈을 쓰므로 어떤 주소를 받는지가 한 곳에서 정해진다.
+    - watch?v=(앞뒤 추적 파라미터 포함), youtu.be/, shorts/, embed/, live/, v/, e/ 주소
+    - www./m./music. 하위 도메인과 youtube-nocookie.com, 대소문자가 섞인 호스트, 스킴 없는 주소
+    - allow_bare_id=True 일 때만: 주소 없이 ID만 적은 입력 (앞뒤 공백/따옴표 허용)
+비디오 ID는 정확히 11자([A-Za-z0-9_-])여야 한다 - 잘리거나 덧붙은 ID는 거절한다.
+호스트는 입력 시작, 스킴의 '//', 공백 바로 뒤에 있어야 한다 - 'evil.com/youtube.com/...' 이나
+'?r=youtu.be/...' 처럼 다른 주소의 경로/파라미터 안에 든 유튜브 주소는 거절한다.
+
+많은 입력(파일, 배치 요청)은 normalize_batch 로 한 번 훑으며 ID를 찾고 중복을 없애고 거절한 줄을 모은다.
+대부분의 줄은 미리 컴파일한 URL_PATTERN 하나로 주소 모양과 ID 검증이 함께 끝나고, 드문 모양(주소 없는 ID,
+대소문자가 섞인 주소)은 그 패턴이 못 찾았을 때만 따로 본다. URL_PATTERN 이 리터럴 'youtu' 로 시작해야
+정규식 엔진이 줄 앞부분을 빠르게 건너뛴다 (대소문자 무시나 선택지를 앞에 두면 몇 배 느려진다).
+그래서 호스트 앞 경계(HOST_BOUNDARY)는 패턴에 넣지 않고 찾은 자리 앞 몇 글자만 따로 확인한다.
+"""
+
+import re
+
+
+VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+_ID = r'([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'  # 뒤에 ID 글자가 더 붙으면 거절
+# v= 앞의 추적 파라미터(&로 끝나는 부분)는 v= 가 바로 없을 때만 찾는다
+_URL_PREFIX = r'youtu(?:be(?:-nocookie)?\.com/(?:watch/?\?(?:[^#\s]*?&)??v=|(?:shorts|embed|live|v|e)/)|\.be/)'
+
+# 주소 안의 비디오 ID
+URL_PATTERN = re.compile(_URL_PREFIX + _ID)
+# 'YouTube.com/Watch?V=' 처럼 대소문자가 섞인 주소 (URL_PATTERN 이 못 찾았을 때만)
+URL_PATTERN_IGNORECASE = re.compile(_URL_PREFIX + _ID, re.IGNORECASE)
+# 'youtu' 바로 앞: 입력 시작, '//', 공백 + 선택적인 www./m./music. 하위 도메인 (찾은 자리 앞 최대 8글자만 본다)
+HOST_BOUNDARY = re.compile(r'(?:^|//|\s)(?:(?:www|m|music)\.)?$', re.IGNORECASE)
+_BOUNDARY_WIDTH = len('//music.')
+# 대부분의 줄은 정규식 없이 endswith 로 끝난다
+_COMMON_BOUNDARIES = ('//', '//www.', '//m.', '//music.')
+# 입력 전체가 비디오 ID 하나 (앞뒤 공백/따옴표 허용)
+BARE_ID_PATTERN = re.compile(r'[\s\'"]*([A-Za-z0-9_-]{11})[\s\'"]*$')
+
+
+def _search_url(pattern, text):
+    """호스트 앞 경계를 지키는 첫 주소 (없으면 None)"""
+    match = pattern.search(text)
+    while match:
+        start = match.start()
+        if (not start or text.endswith(_COMMON_BOUNDARIES, 0, start)
+                or HOST_BOUNDARY.search(text, max(0, start - _BOUNDARY_WIDTH), start)):
+            return match
+        match = pattern.search(text, start + 1)
+    return None
+
+
+def parse_video_id(text, allow_bare_id=False):
+    """URL에서 11자 비디오 ID 추출 (없으면 None)
+
+    allow_bare_id=True 이면 입력 전체가 ID 하나인 경우('dQw4w9WgXcQ')도 받는다. 기본값은 거절 -
+    'helloworld1' 같은 아무 11자 단어가 비디오 ID로 통과하지 않도록.
+    """
+    if not text:
+        return None
+    match = (_search_url(URL_PATTERN, text)
+             or (allow_bare_id and BARE_ID_PATTERN.match(text))
+             or _search_url(URL_PATTERN_IGNORECASE, text))
+    return match.group(1) if match else None
+
+
+def canonical_url(video_id):
+    """비디오 ID의 표준 watch URL"""
+    return f'https://www.youtube.com/watch?v={video_id}'
+
+
+def normalize_batch(lines, allow_bare_id=False):
+    """줄 리스트를 한 번 훑어 비디오 ID로 바꾸고 중복 제거 (allow_bare_id 는 parse_video_id 와 같음)
+
+    반환값: (video_ids, rejects)
+        video_ids: 처음 나온 순서대로 중복 없는 비디오 ID 리스트
+        rejects: 비디오 ID를 찾지 못한 [(줄 번호, 앞뒤 공백을 뗀 줄), ...] (빈 줄 포함)
+    중복 줄 수는 len(lines) - len(video_ids) - len(rejects).
+    """
+    parse = parse_video_id
+    seen = set()
+    video_ids = []
+    rejects = []
+    for index, line in enumerate(lines):
+        video_id = parse(line, allow_bare_id)
+        if not video_id:
+            rejects.append((index, (line or '').strip()))
+        elif video_id not in seen:
+            seen.add(video_id)
+            video_ids.append(video_id)
+    return video_ids, rejects